@@ -3,29 +3,53 @@
 Command line interface for llm-file-rename-n-sort.
 """
 
+from __future__ import annotations
+
 # Standard Library
 import argparse
+import functools
 import logging
 from pathlib import Path
-import urllib.request
+import socket
+import urllib.parse
+import math
 import random
+import itertools
+import heapq
 from collections import Counter
-import sys
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
 
 # local repo modules
 from .config import AppConfig, parse_exts
-from .llm_engine import LLMEngine
 from .llm_utils import apple_models_available, choose_model
-from .transports import AppleTransport, OllamaTransport
-from .organizer import Organizer
+from .path_utils import extension_of
 from .scanner import iter_files
+from .term_utils import stdout_is_tty
+
+# the engine, transports, organizer, and plugins are imported inside
+# build_llm/main, so --help and argument errors never load them
+if TYPE_CHECKING:
+	from .llm_engine import LLMEngine
 
 #============================================
 
 
-def parse_args() -> argparse.Namespace:
+def _expanded_path(value: str) -> Path:
 	"""
-	Parse CLI arguments.
+	Argparse type converter: user path string -> expanded Path.
+	"""
+	path = Path(value).expanduser()
+	return path
+
+
+#============================================
+
+
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+	"""
+	Build the CLI argument parser once per process.
 	"""
 	parser = argparse.ArgumentParser(
 		description="Rename and sort macOS files using a local LLM."
@@ -36,6 +60,7 @@ def parse_args() -> argparse.Namespace:
 		dest="paths",
 		nargs="+",
 		required=True,
+		type=_expanded_path,
 		help="Paths to scan (required).",
 	)
 	mode_group = parser.add_mutually_exclusive_group()
@@ -67,6 +92,19 @@ def parse_args() -> argparse.Namespace:
 		default=1,
 		help="Maximum directory depth to scan (default 1).",
 	)
+	parser.add_argument(
+		"--min-size",
+		dest="min_size",
+		type=int,
+		default=1,
+		help="Skip files smaller than this many bytes (default 1, skips empty files).",
+	)
+	parser.add_argument(
+		"--max-size",
+		dest="max_size",
+		type=int,
+		help="Skip files larger than this many bytes.",
+	)
 	parser.add_argument(
 		"-v",
 		"--verbose",
@@ -85,6 +123,7 @@ def parse_args() -> argparse.Namespace:
 		"-t",
 		"--target",
 		dest="target_root",
+		type=_expanded_path,
 		help="Target root for organized files (default ~/Organized).",
 	)
 	parser.add_argument(
@@ -108,6 +147,45 @@ def parse_args() -> argparse.Namespace:
 		action="store_true",
 		help="Process files in sorted order.",
 	)
+	parser.add_argument(
+		"-j",
+		"--parallel",
+		dest="parallel",
+		type=int,
+		default=1,
+		help="Plan this many files concurrently (default 1; Ollama needs OLLAMA_NUM_PARALLEL > 1 to benefit).",
+	)
+	parser.add_argument(
+		"--metadata-workers",
+		dest="metadata_workers",
+		type=int,
+		default=4,
+		help="Threads reading file metadata ahead of the LLM (default 4; 1 disables).",
+	)
+	parser.add_argument(
+		"--no-cache",
+		dest="use_cache",
+		action="store_false",
+		help="Do not reuse stored LLM replies from earlier runs.",
+	)
+	parser.add_argument(
+		"--no-metadata-cache",
+		dest="metadata_cache",
+		action="store_false",
+		help="Extract metadata again even for files unchanged since an earlier run.",
+	)
+	parser.add_argument(
+		"--semantic-cache",
+		dest="semantic_cache",
+		action="store_true",
+		help="Reuse category answers for near-identical files via Ollama embeddings.",
+	)
+	parser.add_argument(
+		"--no-fast-path",
+		dest="fast_path",
+		action="store_false",
+		help="Ask the LLM even for files with no descriptive metadata.",
+	)
 	parser.add_argument(
 		"--llm-backend",
 		dest="llm_backend",
@@ -122,7 +200,24 @@ def parse_args() -> argparse.Namespace:
 		help="Optional context string added to LLM prompts to keep naming on-theme (e.g., 'Biology class', 'Client ACME').",
 	)
 	parser.set_defaults(apply=False, dry_run=True, randomize=True, sorted=False)
-	return parser.parse_args()
+	return parser
+
+
+#============================================
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+	"""
+	Parse CLI arguments.
+
+	Args:
+		argv: Arguments to parse; defaults to sys.argv[1:].
+
+	Returns:
+		Parsed namespace.
+	"""
+	args = build_parser().parse_args(argv)
+	return args
 
 
 #============================================
@@ -133,31 +228,33 @@ def build_config(args: argparse.Namespace) -> AppConfig:
 	Build runtime config from args and file.
 	"""
 	config = AppConfig()
-	config.roots = [Path(p).expanduser() for p in args.paths]
+	config.roots = list(args.paths)
 	if args.target_root:
-		config.target_root = Path(args.target_root).expanduser()
+		config.target_root = args.target_root
 	if args.max_files:
 		config.max_files = args.max_files
 	if args.max_depth is not None:
 		config.max_depth = args.max_depth
-	if args.sorted:
-		config.randomize = False
-	elif args.randomize:
-		config.randomize = True
-	exts = parse_exts(args.extensions) if args.extensions else None
-	if exts:
-		config.include_extensions = exts
-	config.dry_run = True
-	if args.apply:
-		config.dry_run = False
-	elif args.dry_run:
-		config.dry_run = True
+	if args.min_size is not None:
+		config.min_size = args.min_size
+	if args.max_size is not None:
+		config.max_size = args.max_size
+	# -R and -S are mutually exclusive, and randomized order is the default
+	config.randomize = not args.sorted
+	config.include_extensions = parse_exts(args.extensions)
+	config.dry_run = not args.apply
 	if args.model:
 		config.model_override = args.model
 	if args.llm_backend:
 		config.llm_backend = args.llm_backend
 	if args.context:
 		config.context = args.context
+	config.parallel = max(1, args.parallel)
+	config.metadata_workers = max(1, args.metadata_workers)
+	config.use_cache = args.use_cache
+	config.metadata_cache = args.metadata_cache
+	config.semantic_cache = args.semantic_cache
+	config.fast_path = args.fast_path
 	config.verbose = args.verbose
 	return config
 
@@ -175,6 +272,9 @@ def build_llm(config: AppConfig) -> LLMEngine:
 	Returns:
 		LLMEngine instance.
 	"""
+	from .llm_engine import LLMEngine
+	from .transports import AppleTransport, OllamaTransport
+
 	model = choose_model(config.model_override)
 	base_url = "http://localhost:11434"
 	transports = []
@@ -199,7 +299,7 @@ def build_llm(config: AppConfig) -> LLMEngine:
 
 
 def _color(text: str, code: str) -> str:
-	if sys.stdout.isatty():
+	if stdout_is_tty():
 		return f"\033[{code}m{text}\033[0m"
 	return text
 
@@ -210,46 +310,154 @@ def _color(text: str, code: str) -> str:
 def _ollama_available(base_url: str) -> bool:
 	"""
 	Check if Ollama service is up.
+
+	A TCP connect to the service port is enough to answer "reachable?" and
+	skips building and parsing a full HTTP request.
 	"""
+	parts = urllib.parse.urlsplit(base_url)
+	host = parts.hostname or "localhost"
+	port = parts.port or 11434
 	try:
-		request = urllib.request.Request(f"{base_url}/api/tags", method="GET")
-		with urllib.request.urlopen(request, timeout=2) as response:
-			return response.status < 400
-	except Exception:
+		with socket.create_connection((host, port), timeout=0.25):
+			return True
+	except OSError:
 		return False
 
 
 #============================================
 
 
+def _count_extensions(paths: Iterable[Path], ext_counter: Counter) -> Iterator[Path]:
+	"""
+	Pass paths through while tallying their extensions (single pass).
+	"""
+	for path in paths:
+		ext_counter[extension_of(path.name)] += 1
+		yield path
+
+
+#============================================
+
+
+def _open_unit_random() -> float:
+	"""
+	Uniform random float in the open interval (0, 1), safe for log().
+	"""
+	value = random.random()
+	while value == 0.0:
+		value = random.random()
+	return value
+
+
+#============================================
+
+
+def _reservoir_sample(paths: Iterable[Path], size: int) -> list[Path]:
+	"""
+	Uniform random sample of up to size paths in one pass (Algorithm L).
+
+	Algorithm L jumps ahead by a geometric skip count, so it draws
+	O(size * log(N / size)) random numbers instead of one per path.
+	Skipped paths are still consumed, so a counting generator sees them all.
+	"""
+	iterator = iter(paths)
+	if size <= 0:
+		for _path in iterator:
+			pass
+		return []
+	sample: list[Path] = list(itertools.islice(iterator, size))
+	if len(sample) < size:
+		return sample
+	weight = math.exp(math.log(_open_unit_random()) / size)
+	while True:
+		skip = math.floor(math.log(_open_unit_random()) / math.log1p(-weight))
+		path = next(itertools.islice(iterator, skip, skip + 1), None)
+		if path is None:
+			return sample
+		sample[random.randrange(size)] = path
+		weight *= math.exp(math.log(_open_unit_random()) / size)
+
+
+#============================================
+
+
+def select_files(config: AppConfig) -> tuple[list[Path], Counter]:
+	"""
+	Scan the roots once, counting extensions and choosing the files to process.
+
+	With max_files set, only max_files paths are held in memory while the
+	scan streams past.
+
+	Args:
+		config: Application configuration.
+
+	Returns:
+		Tuple of (selected files, extension counter for all scanned files).
+	"""
+	ext_counter: Counter = Counter()
+	stream = _count_extensions(iter_files(config), ext_counter)
+	if config.max_files:
+		if config.randomize:
+			selected = _reservoir_sample(stream, config.max_files)
+			# reservoir order is biased toward scan order; mix it
+			random.shuffle(selected)
+		else:
+			# same result as sorted(...)[:max_files] without sorting everything
+			selected = heapq.nsmallest(config.max_files, stream)
+	else:
+		selected = list(stream)
+		if config.randomize:
+			random.shuffle(selected)
+		else:
+			selected.sort()
+	return selected, ext_counter
+
+
+#============================================
+
+
 def main() -> None:
 	"""
 	Entry point for the CLI.
 	"""
 	args = parse_args()
+	from .organizer import Organizer
+	from .plugins.cache import MetadataCache
+	from .response_cache import ResponseCache, SemanticCache
+	from .transports import OllamaTransport
+
 	config = build_config(args)
 	if config.verbose:
 		logging.basicConfig(level=logging.INFO)
 	else:
 		logging.basicConfig(level=logging.WARNING)
 	llm = build_llm(config)
+	llm.fast_path = config.fast_path
+	if config.use_cache:
+		llm.cache = ResponseCache()
+	if config.semantic_cache:
+		ollama_transports = [transport for transport in llm.transports if isinstance(transport, OllamaTransport)]
+		if ollama_transports:
+			llm.semantic_cache = SemanticCache(ollama_transports[0].embed)
+		else:
+			logging.warning("Semantic cache needs a reachable Ollama service; disabled.")
 	organizer = Organizer(config=config, llm=llm)
-	files = iter_files(config)
-	print(f"{_color('[SCAN]', '34')} Found {len(files)} files to consider.")
-	if files:
-		ext_counter = Counter(p.suffix.lower().lstrip(".") for p in files)
-		top_exts = ext_counter.most_common(8)
-		summary = ", ".join(f"{ext}:{count}" for ext, count in top_exts if ext)
-		if summary:
-			print(f"{_color('[SCAN]', '34')} Top extensions: {summary}")
-	limited_files = files
-	if config.randomize:
-		random.shuffle(limited_files)
-	else:
-		limited_files = sorted(limited_files)
-	if config.max_files:
-		limited_files = limited_files[: config.max_files]
-	organizer.process_one_by_one(limited_files)
+	if config.metadata_cache:
+		organizer.metadata_cache = MetadataCache()
+	try:
+		limited_files, ext_counter = select_files(config)
+		total = sum(ext_counter.values())
+		print(f"{_color('[SCAN]', '34')} Found {total} files to consider.")
+		if total:
+			top_exts = ext_counter.most_common(8)
+			summary = ", ".join(f"{ext}:{count}" for ext, count in top_exts if ext)
+			if summary:
+				print(f"{_color('[SCAN]', '34')} Top extensions: {summary}")
+		organizer.process_one_by_one(limited_files)
+	finally:
+		llm.close()
+		if organizer.metadata_cache is not None:
+			organizer.metadata_cache.close()
 
 
 #============================================
@@ -26,10 +26,18 @@ class AppConfig:
 		dry_run: Only print planned work.
 		max_files: Optional limit.
 		max_depth: Maximum directory depth to scan.
-		include_extensions: Optional filter set.
+		include_extensions: Optional filter set of lowercase extensions without dots.
 		exclude_hidden: Skip dotfiles when True.
+		min_size: Skip files smaller than this many bytes.
+		max_size: Optional upper bound on file size in bytes.
 		llm_backend: LLM backend selector ("macos" or "ollama").
 		model_override: Optional Ollama model name.
+		parallel: Number of files planned concurrently (1 = serial).
+		metadata_workers: Threads reading metadata ahead of the LLM in serial mode (1 = off).
+		use_cache: Reuse stored LLM replies for identical prompts.
+		metadata_cache: Reuse extracted metadata for files unchanged since an earlier run.
+		semantic_cache: Reuse category replies for near-identical prompts (needs Ollama).
+		fast_path: Skip the LLM for files with no descriptive metadata.
 	"""
 	roots: list[Path] = field(default_factory=_default_roots)
 	target_root: Path | None = None
@@ -37,22 +45,49 @@ class AppConfig:
 	max_files: int | None = 150
 	max_depth: int = 1
 	randomize: bool = True
-	include_extensions: set[str] | None = None
+	include_extensions: frozenset[str] | None = None
 	exclude_hidden: bool = True
+	min_size: int = 1
+	max_size: int | None = None
 	llm_backend: str = "macos"
 	model_override: str | None = None
+	parallel: int = 1
+	metadata_workers: int = 4
+	use_cache: bool = True
+	metadata_cache: bool = True
+	semantic_cache: bool = False
+	fast_path: bool = True
 	verbose: bool = False
 	context: str | None = None
+	# (roots seen, resolved roots); resolve() costs an lstat per path component
+	_roots_memo: tuple[tuple[Path, ...], tuple[Path, ...]] | None = field(
+		default=None, init=False, repr=False, compare=False
+	)
+	_target_memo: tuple[Path, Path] | None = field(default=None, init=False, repr=False, compare=False)
+
+	#============================================
+	def __post_init__(self) -> None:
+		# any iterable of ".PDF"-style names becomes a frozenset once, so the
+		# scanner's per-file membership test is a plain hash lookup
+		if self.include_extensions is not None:
+			self.include_extensions = parse_exts(list(self.include_extensions))
 
 	#============================================
 	def normalized_roots(self) -> list[Path]:
 		"""
 		Normalize user root paths.
 
+		The organizer asks for these once or more per file, so the resolved
+		paths are kept until roots is changed.
+
 		Returns:
 			List of normalized Path objects.
 		"""
-		paths: list[Path] = [root.expanduser().resolve() for root in self.roots]
+		key = tuple(self.roots)
+		if self._roots_memo is None or self._roots_memo[0] != key:
+			resolved = tuple(root.expanduser().resolve() for root in key)
+			self._roots_memo = (key, resolved)
+		paths: list[Path] = list(self._roots_memo[1])
 		return paths
 
 	#============================================
@@ -65,12 +100,14 @@ class AppConfig:
 		"""
 		if self.target_root is None:
 			raise RuntimeError("target_root is not set.")
-		target: Path = self.target_root.expanduser().resolve()
+		if self._target_memo is None or self._target_memo[0] != self.target_root:
+			self._target_memo = (self.target_root, self.target_root.expanduser().resolve())
+		target: Path = self._target_memo[1]
 		return target
 
 
 #============================================
-def parse_exts(exts: list[str] | None) -> set[str] | None:
+def parse_exts(exts: list[str] | None) -> frozenset[str] | None:
 	"""
 	Normalize extension filters.
 
@@ -78,14 +115,11 @@ def parse_exts(exts: list[str] | None) -> set[str] | None:
 		exts: Extensions from CLI.
 
 	Returns:
-		Set of lowercase extensions or None.
+		Frozenset of lowercase extensions or None.
 	"""
 	if not exts:
 		return None
-	cleaned: set[str] = set()
-	for ext in exts:
-		if ext:
-			cleaned.add(ext.lower().lstrip("."))
+	cleaned = frozenset(ext.lower().lstrip(".") for ext in exts if ext)
 	if not cleaned:
 		return None
 	return cleaned
@@ -5,9 +5,11 @@ Compatibility exports for LLM utilities and engine.
 
 from __future__ import annotations
 
-from .llm_engine import LLMEngine
-from .llm_parsers import KeepResult, RenameResult, SortResult, ParseError
-from .llm_prompts import KeepRequest, RenameRequest, SortItem, SortRequest
+# Standard Library
+from typing import TYPE_CHECKING
+import importlib
+
+# local repo modules
 from .llm_utils import (
 	ALLOWED_CATEGORIES,
 	MAX_FILENAME_CHARS,
@@ -18,12 +20,46 @@ from .llm_utils import (
 	extract_xml_tag_content,
 	get_vram_size_in_gb as _get_vram_size_in_gb,
 	total_ram_bytes as _total_ram_bytes,
+	keyword_category,
+	normalize_category,
 	normalize_reason,
 	pick_category,
 	sanitize_filename,
 )
-from .transports.apple import AppleTransport
-from .transports.ollama import OllamaTransport
+
+if TYPE_CHECKING:
+	from .llm_engine import LLMEngine
+	from .llm_parsers import KeepResult, RenameResult, SortResult, ParseError
+	from .llm_prompts import KeepRequest, RenameRequest, SortItem, SortRequest
+	from .transports.apple import AppleTransport
+	from .transports.ollama import OllamaTransport
+
+# engine, transports, parsers, and prompts load on first attribute access
+# (PEP 562), so importing this module does not pull in the backends
+_LAZY_EXPORTS: dict[str, str] = {
+	"LLMEngine": ".llm_engine",
+	"KeepResult": ".llm_parsers",
+	"RenameResult": ".llm_parsers",
+	"SortResult": ".llm_parsers",
+	"ParseError": ".llm_parsers",
+	"KeepRequest": ".llm_prompts",
+	"RenameRequest": ".llm_prompts",
+	"SortItem": ".llm_prompts",
+	"SortRequest": ".llm_prompts",
+	"AppleTransport": ".transports.apple",
+	"OllamaTransport": ".transports.ollama",
+}
+
+
+def __getattr__(name: str) -> object:
+	module_name = _LAZY_EXPORTS.get(name)
+	if module_name is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(importlib.import_module(module_name, __package__), name)
+	# cache so later lookups skip __getattr__
+	globals()[name] = value
+	return value
+
 
 def get_vram_size_in_gb() -> int | None:
 	return _get_vram_size_in_gb()
@@ -79,6 +115,8 @@ __all__ = [
 	"total_ram_bytes",
 	"compute_stem_features",
 	"extract_xml_tag_content",
+	"keyword_category",
+	"normalize_category",
 	"normalize_reason",
 	"pick_category",
 	"sanitize_filename",
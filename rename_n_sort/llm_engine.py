@@ -6,22 +6,41 @@ Backend-agnostic LLM engine with fallback and strict parsing.
 from __future__ import annotations
 
 # Standard Library
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
+import threading
 
 # local repo modules
-from .llm_parsers import ParseError, KeepResult, RenameResult, SortResult, parse_keep_response, parse_rename_response, parse_sort_response
+from .llm_parsers import (
+	ParseError,
+	KeepResult,
+	RenameResult,
+	SortResult,
+	parse_keep_response,
+	parse_rename_keep_response,
+	parse_rename_keep_sort_response,
+	parse_rename_response,
+	parse_sort_batch_response,
+	parse_sort_response,
+)
 from .llm_prompts import (
 	KeepRequest,
 	RenameRequest,
 	SortItem,
 	SortRequest,
 	RENAME_EXAMPLE_OUTPUT,
+	RENAME_KEEP_EXAMPLE_OUTPUT,
+	RENAME_KEEP_SORT_EXAMPLE_OUTPUT,
 	KEEP_EXAMPLE_OUTPUT,
 	SORT_EXAMPLE_OUTPUT,
+	SORT_BATCH_EXAMPLE_OUTPUT,
 	build_format_fix_prompt,
 	build_keep_prompt,
+	build_rename_keep_prompt,
+	build_rename_keep_sort_prompt,
 	build_rename_prompt,
 	build_rename_prompt_minimal,
+	build_sort_batch_prompt,
 	build_sort_prompt,
 )
 from .llm_utils import (
@@ -31,17 +50,43 @@ from .llm_utils import (
 	_print_llm,
 	log_parse_failure,
 	normalize_reason,
+	obvious_stem_action,
 	sanitize_filename,
 )
+from .response_cache import ResponseCache, SemanticCache, cache_key
 from .transports.base import LLMTransport
 
 #============================================
 
 
+def _semantic_text(item: SortItem) -> str:
+	"""
+	Per-file part of a category prompt, embedded for the semantic cache.
+
+	The shared instruction header is left out; it would dominate the
+	vector and make unrelated files look alike.
+	"""
+	text = f"{item.name}\n{item.ext}\n{item.description}"
+	return text
+
+
+# (exact cache key, semantic scope, semantic vector) of a fresh reply,
+# stored by _parse_with_retry only once the reply has parsed
+_PendingReply = tuple[str | None, str, list[float] | None]
+
+#============================================
+
+
 @dataclass(slots=True)
 class LLMEngine:
 	transports: list[LLMTransport]
 	context: str | None = None
+	cache: ResponseCache | None = None
+	semantic_cache: SemanticCache | None = None
+	# decide opaque stems (IMG_1234, UUIDs) without a keep prompt
+	fast_path: bool = True
+	# per-thread cache entry of the last generated reply, see _PendingReply
+	_pending: threading.local = field(default_factory=threading.local, init=False, repr=False, compare=False)
 
 	#============================================
 	def rename(self, current_name: str, metadata: dict) -> RenameResult:
@@ -54,7 +99,7 @@ class LLMEngine:
 			retry_prompt=build_rename_prompt_minimal(req),
 		)
 		result = self._parse_with_retry(
-			lambda text: parse_rename_response(text),
+			parse_rename_response,
 			prompt,
 			RENAME_EXAMPLE_OUTPUT,
 			raw,
@@ -65,9 +110,112 @@ class LLMEngine:
 		result.reason = normalize_reason(result.reason)
 		return result
 
+	#============================================
+	def rename_and_stem_action(
+		self, current_name: str, metadata: dict, extension: str | None = None
+	) -> tuple[RenameResult, KeepResult]:
+		"""
+		Ask for the new name and the stem action in one LLM call.
+
+		Falls back to separate rename() and stem_action() calls when the
+		combined reply cannot be parsed or the prompt trips a guardrail.
+		"""
+		req = RenameRequest(metadata=metadata, current_name=current_name, context=self.context)
+		original_stem = Path(current_name).stem
+		# the suggested name is not known yet, so stem_in_suggested is left out
+		features = compute_stem_features(original_stem, "")
+		features.pop("stem_in_suggested", None)
+		prompt = build_rename_keep_prompt(req, features)
+		try:
+			raw = self._generate_with_fallback(
+				prompt,
+				purpose="filename and stem action",
+				max_tokens=240,
+				retry_prompt=None,
+			)
+			rename_result, keep_result = self._parse_with_retry(
+				parse_rename_keep_response,
+				prompt,
+				RENAME_KEEP_EXAMPLE_OUTPUT,
+				raw,
+				purpose="filename and stem action",
+				max_tokens=240,
+			)
+		except ParseError:
+			return self._rename_then_stem_action(current_name, metadata, extension)
+		except Exception as exc:
+			if _is_guardrail_error(exc) or _is_context_window_error(exc):
+				return self._rename_then_stem_action(current_name, metadata, extension)
+			raise
+		rename_result.new_name = sanitize_filename(rename_result.new_name)
+		rename_result.reason = normalize_reason(rename_result.reason)
+		keep_result.reason = normalize_reason(keep_result.reason)
+		return (rename_result, keep_result)
+
+	#============================================
+	def rename_stem_action_and_category(
+		self, current_name: str, metadata: dict, extension: str | None = None
+	) -> tuple[RenameResult, KeepResult, SortResult | None]:
+		"""
+		Ask for the new name, the stem action and the category in one LLM call.
+
+		The SortResult is keyed on current_name. When the combined reply
+		cannot be parsed or the prompt trips a guardrail, this falls back to
+		rename_and_stem_action() and returns None for the category, so the
+		caller can sort the file separately.
+		"""
+		req = RenameRequest(metadata=metadata, current_name=current_name, context=self.context)
+		original_stem = Path(current_name).stem
+		features = compute_stem_features(original_stem, "")
+		features.pop("stem_in_suggested", None)
+		prompt = build_rename_keep_sort_prompt(req, features)
+		try:
+			raw = self._generate_with_fallback(
+				prompt,
+				purpose="filename, stem action and category",
+				max_tokens=300,
+				retry_prompt=None,
+			)
+			rename_result, keep_result, sort_result = self._parse_with_retry(
+				parse_rename_keep_sort_response,
+				prompt,
+				RENAME_KEEP_SORT_EXAMPLE_OUTPUT,
+				raw,
+				purpose="filename, stem action and category",
+				max_tokens=300,
+				parser_args=(current_name,),
+			)
+		except ParseError:
+			return (*self.rename_and_stem_action(current_name, metadata, extension), None)
+		except Exception as exc:
+			if _is_guardrail_error(exc) or _is_context_window_error(exc):
+				return (*self.rename_and_stem_action(current_name, metadata, extension), None)
+			raise
+		rename_result.new_name = sanitize_filename(rename_result.new_name)
+		rename_result.reason = normalize_reason(rename_result.reason)
+		keep_result.reason = normalize_reason(keep_result.reason)
+		for key, reason in sort_result.reasons.items():
+			sort_result.reasons[key] = normalize_reason(reason)
+		return (rename_result, keep_result, sort_result)
+
+	#============================================
+	def _rename_then_stem_action(
+		self, current_name: str, metadata: dict, extension: str | None
+	) -> tuple[RenameResult, KeepResult]:
+		_print_llm("combined rename reply unusable; asking for name and stem separately")
+		rename_result = self.rename(current_name, metadata)
+		keep_result = self.stem_action(
+			Path(current_name).stem, rename_result.new_name, extension=extension
+		)
+		return (rename_result, keep_result)
+
 	#============================================
 	def stem_action(self, original_stem: str, suggested_name: str, extension: str | None = None) -> KeepResult:
 		features = compute_stem_features(original_stem, suggested_name)
+		if self.fast_path:
+			decided = obvious_stem_action(original_stem, features)
+			if decided is not None:
+				return KeepResult(stem_action=decided[0], reason=decided[1], raw_text="")
 		req = KeepRequest(
 			original_stem=original_stem,
 			suggested_name=suggested_name,
@@ -82,10 +230,11 @@ class LLMEngine:
 			retry_prompt=None,
 		)
 		result = self._parse_with_retry(
-			lambda text: parse_keep_response(text, original_stem),
+			parse_keep_response,
 			prompt,
 			KEEP_EXAMPLE_OUTPUT,
 			raw,
+			parser_args=(original_stem,),
 			purpose="how to handle the original filename stem",
 			max_tokens=120,
 		)
@@ -96,23 +245,62 @@ class LLMEngine:
 	def sort(self, files: list[SortItem]) -> SortResult:
 		if not files:
 			return SortResult(assignments={}, raw_text="")
+		if len(files) > 1:
+			return self._sort_halving(files)
+		return self._sort_each(files)
+
+	#============================================
+	def _sort_halving(self, files: list[SortItem]) -> SortResult:
+		"""
+		Sort a batch in one prompt; if the reply is unusable, retry each half.
+
+		Halving keeps the answers of the half that parses, so a few bad
+		replies cost a handful of extra prompts instead of one per file.
+		If replies keep failing, recursion reaches single files, so the
+		worst case still grows linearly with len(files).
+		"""
+		try:
+			return self._sort_batch(files)
+		except ParseError:
+			if len(files) <= 2:
+				_print_llm("batch category reply unusable; asking one file at a time")
+				return self._sort_each(files)
+		half = len(files) // 2
+		_print_llm(f"batch category reply unusable; retrying as {half} + {len(files) - half} files")
+		first = self._sort_halving(files[:half])
+		second = self._sort_halving(files[half:])
+		return SortResult(
+			assignments={**first.assignments, **second.assignments},
+			reasons={**first.reasons, **second.reasons},
+			raw_text="\n".join(text for text in (first.raw_text, second.raw_text) if text),
+		)
+
+	#============================================
+	def _sort_each(self, files: list[SortItem]) -> SortResult:
+		"""
+		Sort files with one prompt per file.
+		"""
 		assignments: dict[str, str] = {}
 		reasons: dict[str, str] = {}
 		last_raw = ""
 		for item in files:
 			req = SortRequest(files=[item], context=self.context)
 			prompt = build_sort_prompt(req)
+			# only single-file category answers are safe to reuse for a
+			# merely similar file; rename replies carry file-specific names
 			raw = self._generate_with_fallback(
 				prompt,
 				purpose="category assignment",
 				max_tokens=120,
 				retry_prompt=None,
+				semantic_text=_semantic_text(item),
 			)
 			result = self._parse_with_retry(
-				lambda text: parse_sort_response(text, [item.path]),
+				parse_sort_response,
 				prompt,
 				SORT_EXAMPLE_OUTPUT,
 				raw,
+				parser_args=([item.path],),
 				purpose="category assignment",
 				max_tokens=120,
 			)
@@ -122,6 +310,30 @@ class LLMEngine:
 			last_raw = result.raw_text
 		return SortResult(assignments=assignments, reasons=reasons, raw_text=last_raw)
 
+	#============================================
+	def _sort_batch(self, files: list[SortItem]) -> SortResult:
+		req = SortRequest(files=files, context=self.context)
+		prompt = build_sort_batch_prompt(req)
+		paths = [item.path for item in files]
+		# roughly one short tag line per file
+		max_tokens = 40 + 20 * len(files)
+		raw = self._generate_with_fallback(
+			prompt,
+			purpose="category assignment (batch)",
+			max_tokens=max_tokens,
+			retry_prompt=None,
+		)
+		result = self._parse_with_retry(
+			parse_sort_batch_response,
+			prompt,
+			SORT_BATCH_EXAMPLE_OUTPUT,
+			raw,
+			parser_args=(paths,),
+			purpose="category assignment (batch)",
+			max_tokens=max_tokens,
+		)
+		return result
+
 	#============================================
 	def _generate_with_fallback(
 		self,
@@ -130,12 +342,15 @@ class LLMEngine:
 		purpose: str,
 		max_tokens: int,
 		retry_prompt: str | None,
+		semantic_text: str | None = None,
 	) -> str:
 		last_exc: Exception | None = None
 		for idx, transport in enumerate(self.transports):
 			try:
 				_print_llm(f"asking {transport.name} for {purpose}")
-				return self._generate_on_transport(transport, prompt, purpose, max_tokens)
+				return self._generate_on_transport(
+					transport, prompt, purpose, max_tokens, semantic_text=semantic_text
+				)
 			except Exception as exc:
 				last_exc = exc
 				if _is_guardrail_error(exc) or _is_context_window_error(exc):
@@ -168,9 +383,13 @@ class LLMEngine:
 		*,
 		purpose: str,
 		max_tokens: int,
+		parser_args: tuple = (),
 	):
+		# parser(text, *parser_args); extra arguments are passed through
+		# rather than bound in a closure for every call
+		pending = self._take_pending()
 		try:
-			return parser(raw_text)
+			result = parser(raw_text, *parser_args)
 		except ParseError as exc:
 			excerpt = " ".join(raw_text.split())[:160]
 			print(f"[WHY] parse_error: {exc} (excerpt: {excerpt})")
@@ -201,8 +420,10 @@ class LLMEngine:
 						continue
 					last_transport = transport_exc
 					continue
+				# the format-fix prompt itself is not cached
+				self._take_pending()
 				try:
-					return parser(fixed)
+					result = parser(fixed, *parser_args)
 				except ParseError as parse_exc:
 					last_parse = parse_exc
 					log_parse_failure(
@@ -213,12 +434,37 @@ class LLMEngine:
 						stage=f"format fix ({transport.name})",
 					)
 					continue
+				# cache the usable reply under the original prompt, so a
+				# rerun skips both round trips
+				self._store_reply(pending, fixed)
+				return result
 			if last_parse:
 				text = last_fixed or raw_text
 				raise ParseError(str(last_parse), raw_text=text)
 			if last_transport:
 				raise last_transport
 			raise ParseError("Format-fix retry failed.")
+		self._store_reply(pending, raw_text)
+		return result
+
+	#============================================
+	def _take_pending(self) -> _PendingReply | None:
+		pending = getattr(self._pending, "reply", None)
+		self._pending.reply = None
+		return pending
+
+	#============================================
+	def _store_reply(self, pending: _PendingReply | None, text: str) -> None:
+		"""
+		Put a reply that parsed into the caches it was looked up in.
+		"""
+		if pending is None:
+			return
+		key, scope, vector = pending
+		if key is not None and self.cache is not None:
+			self.cache.put(key, text)
+		if vector is not None and self.semantic_cache is not None:
+			self.semantic_cache.store(scope, vector, text)
 
 	#============================================
 	def _generate_on_transport(
@@ -227,5 +473,42 @@ class LLMEngine:
 		prompt: str,
 		purpose: str,
 		max_tokens: int,
+		*,
+		semantic_text: str | None = None,
 	) -> str:
-		return transport.generate(prompt, purpose=purpose, max_tokens=max_tokens)
+		self._pending.reply = None
+		model = getattr(transport, "model", "")
+		key: str | None = None
+		if self.cache is not None:
+			options = dict(getattr(transport, "generation_options", {}))
+			system_message = getattr(transport, "system_message", "")
+			if system_message:
+				options["system"] = system_message
+			key = cache_key(transport.name, model, prompt, max_tokens, options)
+			cached = self.cache.get(key)
+			if cached is not None:
+				_print_llm(f"using cached {transport.name} reply for {purpose}")
+				return cached
+		scope = f"{transport.name}:{model}"
+		vector: list[float] | None = None
+		if self.semantic_cache is not None and semantic_text is not None:
+			similar, vector = self.semantic_cache.lookup(scope, semantic_text)
+			if similar is not None:
+				_print_llm(f"reusing {transport.name} reply from a near-identical prompt for {purpose}")
+				return similar
+		text = transport.generate(prompt, purpose=purpose, max_tokens=max_tokens)
+		# stored by _parse_with_retry once the reply parses
+		self._pending.reply = (key, scope, vector)
+		return text
+
+	#============================================
+	def close(self) -> None:
+		"""
+		Close the transports and the response cache.
+		"""
+		for transport in self.transports:
+			close = getattr(transport, "close", None)
+			if close is not None:
+				close()
+		if self.cache is not None:
+			self.cache.close()
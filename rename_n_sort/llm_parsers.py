@@ -47,6 +47,7 @@ class SortResult:
 
 
 _CODE_FENCE_RE = re.compile(r"```[a-zA-Z0-9_+-]*\n(.*?)```", re.DOTALL)
+_CDATA_RE = re.compile(r"<!\[CDATA\[(.*?)\]\]>", re.DOTALL)
 
 
 def _strip_code_fences(text: str) -> str:
@@ -67,43 +68,117 @@ def _coerce_response_body(text: str) -> str:
 		unescaped = html.unescape(cleaned)
 		if unescaped:
 			cleaned = unescaped
+	if "<![CDATA[" in cleaned:
+		# unwrap every CDATA section in one pass so tag values come out plain
+		cleaned = _CDATA_RE.sub(r"\1", cleaned)
 	return cleaned
 
 
-def _find_tag_values(text: str, tag: str) -> list[str]:
-	pattern = re.compile(
-		rf"<{tag}\b[^>]*>(.*?)</{tag}>",
-		flags=re.IGNORECASE | re.DOTALL,
-	)
-	return [match.strip() for match in pattern.findall(text)]
+# every single-value tag the parsers read, matched in one scan of the reply
+_RESPONSE_TAGS = (
+	"new_name",
+	"reason",
+	"stem_action",
+	"stem_reason",
+	"keep_original",
+	"category",
+	"category_reason",
+)
+_RESPONSE_TAG_RE = re.compile(
+	rf"<({'|'.join(_RESPONSE_TAGS)})\b[^>]*>(.*?)</\1>",
+	flags=re.IGNORECASE | re.DOTALL,
+)
+
+# all <file_N>...</file_N> tags of a batch sort response in one scan
+_FILE_TAG_RE = re.compile(
+	r"<file_(\d+)\b[^>]*>(.*?)</file_\1>",
+	flags=re.IGNORECASE | re.DOTALL,
+)
+
+
+def _collect_tag_values(text: str) -> dict[str, list[str]]:
+	"""
+	Group the values of all known response tags by lowercase tag name.
+	"""
+	values: dict[str, list[str]] = {}
+	for tag, value in _RESPONSE_TAG_RE.findall(text):
+		values.setdefault(tag.lower(), []).append(value.strip())
+	return values
 
 
 def parse_rename_response(text: str) -> RenameResult:
 	response_body = _coerce_response_body(text)
 	if not response_body:
 		raise ParseError("Missing required tags in rename response.", text)
-	new_names = _find_tag_values(response_body, "new_name")
+	tags = _collect_tag_values(response_body)
+	new_names = tags.get("new_name", [])
 	if not new_names:
 		raise ParseError("Missing <new_name> in rename response.", text)
 	if len(new_names) > 1:
 		raise ParseError("Duplicate <new_name> tags in rename response.", text)
-	reasons = _find_tag_values(response_body, "reason")
+	reasons = tags.get("reason", [])
 	if len(reasons) > 1:
 		raise ParseError("Duplicate <reason> tags in rename response.", text)
 	new_name = new_names[0]
 	reason = reasons[0] if reasons else ""
 	return RenameResult(new_name=new_name, reason=reason, raw_text=text)
 
+def parse_rename_keep_response(text: str) -> tuple[RenameResult, KeepResult]:
+	rename_result = parse_rename_response(text)
+	tags = _collect_tag_values(_coerce_response_body(text))
+	stem_actions = tags.get("stem_action", [])
+	if not stem_actions:
+		raise ParseError("Missing <stem_action> in rename response.", text)
+	if len(stem_actions) > 1:
+		raise ParseError("Duplicate <stem_action> tags in rename response.", text)
+	stem_action = stem_actions[0].strip().lower()
+	if stem_action not in {"drop", "keep", "normalize"}:
+		raise ParseError("Invalid <stem_action> value in rename response.", text)
+	stem_reasons = tags.get("stem_reason", [])
+	if not stem_reasons:
+		raise ParseError("Missing <stem_reason> in rename response.", text)
+	if len(stem_reasons) > 1:
+		raise ParseError("Duplicate <stem_reason> tags in rename response.", text)
+	keep_result = KeepResult(stem_action=stem_action, reason=stem_reasons[0], raw_text=text)
+	return (rename_result, keep_result)
+
+def parse_rename_keep_sort_response(
+	text: str, current_name: str
+) -> tuple[RenameResult, KeepResult, SortResult]:
+	"""
+	Parse the combined rename, stem_action and category reply.
+
+	The SortResult is keyed on current_name.
+	"""
+	rename_result, keep_result = parse_rename_keep_response(text)
+	tags = _collect_tag_values(_coerce_response_body(text))
+	categories = tags.get("category", [])
+	if not categories:
+		raise ParseError("Missing <category> in rename response.", text)
+	if len(categories) > 1:
+		raise ParseError("Duplicate <category> tags in rename response.", text)
+	category_reasons = tags.get("category_reason", [])
+	if len(category_reasons) > 1:
+		raise ParseError("Duplicate <category_reason> tags in rename response.", text)
+	category_reason = category_reasons[0].strip() if category_reasons else ""
+	sort_result = SortResult(
+		assignments={current_name: categories[0].strip()},
+		reasons={current_name: category_reason} if category_reason else {},
+		raw_text=text,
+	)
+	return (rename_result, keep_result, sort_result)
+
 def parse_keep_response(
 	text: str, original_stem: str
 ) -> KeepResult:
 	response_body = _coerce_response_body(text)
 	if not response_body:
 		raise ParseError("Missing required tags in keep response.", text)
-	stem_actions = _find_tag_values(response_body, "stem_action")
+	tags = _collect_tag_values(response_body)
+	stem_actions = tags.get("stem_action", [])
 	if len(stem_actions) > 1:
 		raise ParseError("Duplicate <stem_action> tags in keep response.", text)
-	reason_values = _find_tag_values(response_body, "reason")
+	reason_values = tags.get("reason", [])
 	if not reason_values:
 		raise ParseError("Missing <reason> in keep response.", text)
 	if len(reason_values) > 1:
@@ -112,7 +187,7 @@ def parse_keep_response(
 	if stem_actions:
 		stem_action = stem_actions[0].strip().lower()
 	else:
-		keep_values = _find_tag_values(response_body, "keep_original")
+		keep_values = tags.get("keep_original", [])
 		if not keep_values:
 			raise ParseError("Missing <stem_action> in keep response.", text)
 		if len(keep_values) > 1:
@@ -137,13 +212,14 @@ def parse_sort_response(text: str, expected_paths: list[str]) -> SortResult:
 		raise ParseError("Missing required tags in sort response.", text)
 	if len(expected_paths) != 1:
 		raise ParseError("Sort responses only support a single file.", text)
-	categories = _find_tag_values(response_body, "category")
+	tags = _collect_tag_values(response_body)
+	categories = tags.get("category", [])
 	if not categories:
 		raise ParseError("Missing <category> in sort response.", text)
 	if len(categories) > 1:
 		raise ParseError("Duplicate <category> tags in sort response.", text)
 	category = categories[0].strip()
-	reasons = _find_tag_values(response_body, "reason")
+	reasons = tags.get("reason", [])
 	if len(reasons) > 1:
 		raise ParseError("Duplicate <reason> tags in sort response.", text)
 	reason = reasons[0].strip() if reasons else ""
@@ -152,3 +228,25 @@ def parse_sort_response(text: str, expected_paths: list[str]) -> SortResult:
 		reasons={expected_paths[0]: reason} if reason else {},
 		raw_text=text,
 	)
+
+
+def parse_sort_batch_response(text: str, expected_paths: list[str]) -> SortResult:
+	response_body = _coerce_response_body(text)
+	if not response_body:
+		raise ParseError("Missing required tags in sort response.", text)
+	values_by_index: dict[int, list[str]] = {}
+	for index_text, value in _FILE_TAG_RE.findall(response_body):
+		if "<" in value:
+			# some models nest the answer as <file_1><category>X</category></file_1>
+			value = (_collect_tag_values(value).get("category") or [value])[0]
+		values_by_index.setdefault(int(index_text), []).append(value.strip())
+	assignments: dict[str, str] = {}
+	for idx, path in enumerate(expected_paths, start=1):
+		tag = f"file_{idx}"
+		values = values_by_index.get(idx)
+		if not values:
+			raise ParseError(f"Missing <{tag}> in sort response.", text)
+		if len(values) > 1:
+			raise ParseError(f"Duplicate <{tag}> tags in sort response.", text)
+		assignments[path] = values[0]
+	return SortResult(assignments=assignments, raw_text=text)
@@ -53,6 +53,20 @@ RENAME_EXAMPLE_OUTPUT = (
 	"<new_name>GV60_MAX_Fan_Manual_2015.pdf</new_name>\n"
 	"<reason>manual with model and year</reason>"
 )
+RENAME_KEEP_EXAMPLE_OUTPUT = (
+	"<new_name>GV60_MAX_Fan_Manual_2015.pdf</new_name>\n"
+	"<reason>manual with model and year</reason>\n"
+	"<stem_action>keep</stem_action>\n"
+	"<stem_reason>stem has a meaningful model number</stem_reason>"
+)
+RENAME_KEEP_SORT_EXAMPLE_OUTPUT = (
+	"<new_name>GV60_MAX_Fan_Manual_2015.pdf</new_name>\n"
+	"<reason>manual with model and year</reason>\n"
+	"<stem_action>keep</stem_action>\n"
+	"<stem_reason>stem has a meaningful model number</stem_reason>\n"
+	"<category>Document</category>\n"
+	"<category_reason>product manual</category_reason>"
+)
 KEEP_EXAMPLE_OUTPUT = (
 	"<stem_action>keep</stem_action>\n"
 	"<reason>stem has a meaningful model number</reason>"
@@ -61,19 +75,59 @@ SORT_EXAMPLE_OUTPUT = (
 	"<category>Document</category>\n"
 	"<reason>manual with model and year</reason>"
 )
+SORT_BATCH_EXAMPLE_OUTPUT = (
+	"<file_1>Document</file_1>\n"
+	"<file_2>Image</file_2>"
+)
 
 
-def build_rename_prompt(req: RenameRequest) -> str:
+# fixed instruction and example blocks, joined once at import
+_RENAME_INSTRUCTIONS = "\n".join([
+	f"Rename this file concisely (max {PROMPT_FILENAME_CHARS} chars).",
+	"If the document type is unclear, describe the content neutrally "
+	"and avoid guessing.",
+])
+_RENAME_PROMPT_FOOTER = "\n".join([
+	"Return only the tags shown below.",
+	"Example output:",
+	RENAME_EXAMPLE_OUTPUT,
+])
+_RENAME_KEEP_STEM_INSTRUCTIONS = "\n".join([
+	"Also choose stem_action for the current name's stem: drop | normalize | keep.",
+	"Prefer keep when the stem is already concise; normalize only to shorten long or noisy stems.",
+	"stem features:",
+])
+_RENAME_KEEP_PROMPT_FOOTER = "\n".join([
+	"reason explains the new name; stem_reason says what useful info is in the stem.",
+	"Return only the tags shown below.",
+	"Example output:",
+	RENAME_KEEP_EXAMPLE_OUTPUT,
+])
+_KEEP_PROMPT_HEADER = "\n".join([
+	"Choose stem_action: drop | normalize | keep.",
+	"Reason should mention what useful info is in the stem.",
+	"Prefer keep when the stem is already concise; normalize only to shorten long or noisy stems.",
+])
+_KEEP_PROMPT_FOOTER = "\n".join([
+	"Return only the tags shown below.",
+	"Example outputs (choose only one):",
+	"keep:",
+	"<stem_action>keep</stem_action>",
+	"<reason>stem has a meaningful model number</reason>",
+	"drop:",
+	"<stem_action>drop</stem_action>",
+	"<reason>stem is a generic download label</reason>",
+	"normalize:",
+	"<stem_action>normalize</stem_action>",
+	"<reason>stem is long; keep only the core identifier</reason>",
+])
+
+
+def _rename_prompt_lines(req: RenameRequest) -> list[str]:
 	lines: list[str] = []
 	if req.context:
 		lines.append(f"Context: {req.context}")
-	lines.append(
-		f"Rename this file concisely (max {PROMPT_FILENAME_CHARS} chars)."
-	)
-	lines.append(
-		"If the document type is unclear, describe the content neutrally "
-		"and avoid guessing."
-	)
+	lines.append(_RENAME_INSTRUCTIONS)
 	title = _sanitize_prompt_text(req.metadata.get("title"), max_chars=200)
 	keywords = _sanitize_prompt_list(req.metadata.get("keywords"))
 	description = _sanitize_prompt_text(
@@ -100,9 +154,23 @@ def build_rename_prompt(req: RenameRequest) -> str:
 	if caption_note:
 		lines.append(f"caption_note: {caption_note}")
 	lines.append(f"extension: {req.metadata.get('extension')}")
-	lines.append("Return only the tags shown below.")
-	lines.append("Example output:")
-	lines.append(RENAME_EXAMPLE_OUTPUT)
+	return lines
+
+
+def build_rename_prompt(req: RenameRequest) -> str:
+	lines = _rename_prompt_lines(req)
+	lines.append(_RENAME_PROMPT_FOOTER)
+	return "\n".join(lines)
+
+
+def build_rename_keep_prompt(req: RenameRequest, features: dict[str, object]) -> str:
+	"""
+	Rename prompt that also asks for the stem_action, saving a second call.
+	"""
+	lines = _rename_prompt_lines(req)
+	lines.append(_RENAME_KEEP_STEM_INSTRUCTIONS)
+	lines.extend(f"- {key}: {value}" for key, value in features.items())
+	lines.append(_RENAME_KEEP_PROMPT_FOOTER)
 	return "\n".join(lines)
 
 
@@ -110,13 +178,7 @@ def build_rename_prompt_minimal(req: RenameRequest) -> str:
 	lines: list[str] = []
 	if req.context:
 		lines.append(f"Context: {req.context}")
-	lines.append(
-		f"Rename this file concisely (max {PROMPT_FILENAME_CHARS} chars)."
-	)
-	lines.append(
-		"If the document type is unclear, describe the content neutrally "
-		"and avoid guessing."
-	)
+	lines.append(_RENAME_INSTRUCTIONS)
 	title = _sanitize_prompt_text(req.metadata.get("title"), max_chars=200)
 	excerpt = _prompt_excerpt(req.metadata)
 	filetype_hint = _sanitize_prompt_text(req.metadata.get("filetype_hint"))
@@ -128,55 +190,99 @@ def build_rename_prompt_minimal(req: RenameRequest) -> str:
 	if excerpt:
 		lines.append(f"excerpt: {excerpt}")
 	lines.append(f"extension: {req.metadata.get('extension')}")
-	lines.append("Return only the tags shown below.")
-	lines.append("Example output:")
-	lines.append(RENAME_EXAMPLE_OUTPUT)
+	lines.append(_RENAME_PROMPT_FOOTER)
 	return "\n".join(lines)
 
 
 def build_keep_prompt(req: KeepRequest) -> str:
-	lines: list[str] = []
-	lines.append("Choose stem_action: drop | normalize | keep.")
-	lines.append("Reason should mention what useful info is in the stem.")
-	lines.append("Prefer keep when the stem is already concise; normalize only to shorten long or noisy stems.")
+	lines: list[str] = [_KEEP_PROMPT_HEADER]
 	lines.append(f"original_stem: {req.original_stem}")
 	lines.append(f"suggested_name: {req.suggested_name}")
 	if req.extension:
 		lines.append(f"extension: {req.extension}")
 	lines.append("features:")
-	for key, value in req.features.items():
-		lines.append(f"- {key}: {value}")
-	lines.append("Return only the tags shown below.")
-	lines.append("Example outputs (choose only one):")
-	lines.append("keep:")
-	lines.append("<stem_action>keep</stem_action>")
-	lines.append("<reason>stem has a meaningful model number</reason>")
-	lines.append("drop:")
-	lines.append("<stem_action>drop</stem_action>")
-	lines.append("<reason>stem is a generic download label</reason>")
-	lines.append("normalize:")
-	lines.append("<stem_action>normalize</stem_action>")
-	lines.append("<reason>stem is long; keep only the core identifier</reason>")
+	lines.extend(f"- {key}: {value}" for key, value in req.features.items())
+	lines.append(_KEEP_PROMPT_FOOTER)
+	return "\n".join(lines)
+
+
+# constant prompt text, built once; keeping it at the start of every sort
+# prompt also gives Ollama an identical prefix to reuse across calls
+_ALLOWED_CATEGORY_BLOCK = "\n".join(
+	["Allowed categories:"] + [f"- {cat}" for cat in ALLOWED_CATEGORIES]
+)
+_SORT_PROMPT_HEADER = "\n".join([
+	"Assign one allowed category to the file below.",
+	"Give a short reason tied to the file details.",
+	_ALLOWED_CATEGORY_BLOCK,
+])
+_SORT_PROMPT_FOOTER = "\n".join([
+	"Return only the tags shown below.",
+	"Example output:",
+	SORT_EXAMPLE_OUTPUT,
+])
+_SORT_BATCH_PROMPT_HEADER = "\n".join([
+	"Assign one allowed category to each numbered file below.",
+	_ALLOWED_CATEGORY_BLOCK,
+])
+_SORT_BATCH_PROMPT_FOOTER = "\n".join([
+	"Return one tag per file, numbered to match, as shown below.",
+	"Example output:",
+	SORT_BATCH_EXAMPLE_OUTPUT,
+])
+
+
+_RENAME_KEEP_SORT_CATEGORY_INSTRUCTIONS = "\n".join([
+	"Also assign one allowed category to the file.",
+	_ALLOWED_CATEGORY_BLOCK,
+])
+_RENAME_KEEP_SORT_PROMPT_FOOTER = "\n".join([
+	"reason explains the new name; stem_reason says what useful info is in the stem;",
+	"category_reason ties the category to the file details.",
+	"Return only the tags shown below.",
+	"Example output:",
+	RENAME_KEEP_SORT_EXAMPLE_OUTPUT,
+])
+
+
+def build_rename_keep_sort_prompt(req: RenameRequest, features: dict[str, object]) -> str:
+	"""
+	Rename and stem_action prompt that also asks for the category.
+
+	Used when files are finished one at a time, where the category would
+	otherwise cost a separate sort prompt per file.
+	"""
+	lines = _rename_prompt_lines(req)
+	lines.append(_RENAME_KEEP_STEM_INSTRUCTIONS)
+	lines.extend(f"- {key}: {value}" for key, value in features.items())
+	lines.append(_RENAME_KEEP_SORT_CATEGORY_INSTRUCTIONS)
+	lines.append(_RENAME_KEEP_SORT_PROMPT_FOOTER)
 	return "\n".join(lines)
 
 
 def build_sort_prompt(req: SortRequest) -> str:
-	lines: list[str] = []
+	lines: list[str] = [_SORT_PROMPT_HEADER]
 	if req.context:
 		lines.append(f"Context: {req.context}")
-	lines.append("Assign one allowed category to the file below.")
-	lines.append("Give a short reason tied to the file details.")
-	lines.append("Allowed categories:")
-	for cat in ALLOWED_CATEGORIES:
-		lines.append(f"- {cat}")
 	lines.append("File:")
 	item = req.files[0]
 	lines.append(
 		f"path={item.path} | name={item.name} | ext={item.ext} | desc={item.description}"
 	)
-	lines.append("Return only the tags shown below.")
-	lines.append("Example output:")
-	lines.append(SORT_EXAMPLE_OUTPUT)
+	lines.append(_SORT_PROMPT_FOOTER)
+	return "\n".join(lines)
+
+
+def build_sort_batch_prompt(req: SortRequest) -> str:
+	lines: list[str] = [_SORT_BATCH_PROMPT_HEADER]
+	if req.context:
+		lines.append(f"Context: {req.context}")
+	lines.append("Files:")
+	for idx, item in enumerate(req.files, start=1):
+		lines.append(
+			f"file_{idx}: name={item.name} | ext={item.ext} | desc={item.description}"
+		)
+	lines.append(_SORT_BATCH_PROMPT_FOOTER)
 	return "\n".join(lines)
 
 
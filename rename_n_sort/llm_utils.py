@@ -7,12 +7,18 @@ from __future__ import annotations
 
 # Standard Library
 from datetime import datetime, timezone
+import ctypes
+import ctypes.util
+import functools
 import os
 import platform
 import re
 import subprocess
 import sys
 
+# local repo modules
+from .term_utils import stdout_is_tty
+
 #============================================
 
 
@@ -31,15 +37,35 @@ ALLOWED_CATEGORIES = [
 	"Project",
 	"Other",
 ]
-_PLACEHOLDER_REASONS = {
+_CATEGORY_EXTENSIONS: dict[str, frozenset[str]] = {
+	"Document": frozenset({"pdf", "doc", "docx", "odt", "rtf", "pages", "txt", "md", "html", "htm"}),
+	"Presentation": frozenset({"ppt", "pptx", "odp"}),
+	"Data": frozenset({"xls", "xlsx", "ods", "csv", "tsv"}),
+	"Image": frozenset(
+		{"png", "jpg", "jpeg", "heic", "gif", "tif", "tiff", "bmp", "svg", "svgz", "odg"}
+	),
+	"Audio": frozenset({"mp3", "wav", "flac", "aiff", "ogg"}),
+	"Video": frozenset({"mp4", "mov", "mkv", "webm", "avi"}),
+	"Code": frozenset({"py", "m", "cpp", "js", "sh", "pl", "rb", "php"}),
+}
+# inverted once at import so pick_category is a single dict lookup
+_EXT_TO_CATEGORY: dict[str, str] = {
+	ext: category
+	for category, extensions in _CATEGORY_EXTENSIONS.items()
+	for ext in extensions
+}
+_PLACEHOLDER_REASONS = frozenset({
 	"short justification",
 	"short reason",
 	"one sentence. refer to one feature flag.",
 	"optional",
 	"n/a",
 	"na",
-}
-_NONPRINTABLE_RE = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+})
+_REASON_STRIP_RE = re.compile(r"[^a-z0-9 ]+")
+# code fences, tabs and control characters become spaces in one pass;
+# CR and LF are left for splitlines()
+_PROMPT_BLANK_RE = re.compile(r"```|[\x00-\x09\x0b\x0c\x0e-\x1f\x7f]")
 _PROMPT_MAX_TOKEN_LEN = 40
 _PROMPT_EXCERPT_CHARS = 240
 _UUID_RE = re.compile(
@@ -48,22 +74,30 @@ _UUID_RE = re.compile(
 _HEX_BLOB_RE = re.compile(r"\b[0-9a-fA-F]{8,}\b")
 _LONG_DIGIT_RUN_RE = re.compile(r"\d{8,}")
 _TOKEN_SPLIT_RE = re.compile(r"[-_.\s]+")
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]")
+_UUID_LENGTH = 36
 _GENERIC_LABEL_RE = re.compile(
 	r"^(img|dsc|scan|screenshot|document|download|file|image|photo|picture)[-_ .]*\d+$",
 	re.IGNORECASE,
 )
-
-_GUARDRAIL_ERRORS: tuple[type[BaseException], ...] = ()
-try:
-	from applefoundationmodels.exceptions import GuardrailViolationError
-
-	_GUARDRAIL_ERRORS = (GuardrailViolationError,)
-except Exception:
-	_GUARDRAIL_ERRORS = ()
-
+# digit runs that read as a date: 20240115, 2023-12, or a lone year
+_DATE_LIKE_RE = re.compile(r"\d{8}|\d{4}[-_]\d{2}|(?<!\d)(?:19|20)\d{2}(?!\d)")
+_HEX_ONLY_RE = re.compile(r"^[0-9a-fA-F]+$")
+_WORD_RUN_RE = re.compile(r"[A-Za-z]{4,}")
+# hex stems at least this long are opaque even if letters spell a word
+_LONG_HEX_LENGTH = 16
+_FILENAME_ALLOWED = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.-_"
+# byte table for bytes.translate: allowed ASCII maps to itself, everything else to "-"
+_FILENAME_TABLE = bytes(
+	code if chr(code) in _FILENAME_ALLOWED else ord("-") for code in range(256)
+)
+_DASH_RUN_RE = re.compile(r"-{2,}")
+_UNDERSCORE_RUN_RE = re.compile(r"_{2,}")
+_MEMORY_GB_RE = re.compile(r"Memory:\s+(\d+)\s*GB", re.IGNORECASE)
+_VRAM_MB_RE = re.compile(r"VRAM.*?:\s*(\d+)\s*MB", re.IGNORECASE)
 
 def _print_llm(label: str) -> None:
-	if sys.stdout.isatty():
+	if stdout_is_tty():
 		print(f"\033[36m[LLM]\033[0m {label}")
 	else:
 		print(f"[LLM] {label}")
@@ -109,24 +143,16 @@ def log_parse_failure(
 #============================================
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(name: str) -> str:
 	"""
 	Sanitize filename for macOS.
 	"""
-	allowed = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789.-_"
-	result_chars: list[str] = []
-	for ch in name:
-		if ch.isspace():
-			result_chars.append("-")
-		elif ch in allowed:
-			result_chars.append(ch)
-		else:
-			result_chars.append("-")
-	cleaned = "".join(result_chars)
-	while "--" in cleaned:
-		cleaned = cleaned.replace("--", "-")
-	while "__" in cleaned:
-		cleaned = cleaned.replace("__", "_")
+	# non-ASCII chars become "?" (one byte each), then the table maps them to "-"
+	encoded = name.encode("ascii", "replace")
+	cleaned = encoded.translate(_FILENAME_TABLE).decode("ascii")
+	cleaned = _DASH_RUN_RE.sub("-", cleaned)
+	cleaned = _UNDERSCORE_RUN_RE.sub("_", cleaned)
 	cleaned = cleaned.strip("-_.")
 	if len(cleaned) > MAX_FILENAME_CHARS:
 		cleaned = cleaned[:MAX_FILENAME_CHARS]
@@ -139,15 +165,19 @@ def normalize_reason(reason: str | None) -> str:
 	"""
 	if not reason:
 		return ""
+	# split/join already strips and collapses whitespace
 	cleaned = " ".join(str(reason).split())
-	lower = cleaned.lower().strip()
-	plain = re.sub(r"[^a-z0-9 ]+", "", lower).strip()
-	if lower in _PLACEHOLDER_REASONS or plain in _PLACEHOLDER_REASONS:
+	lower = cleaned.lower()
+	if lower in _PLACEHOLDER_REASONS:
+		return ""
+	plain = _REASON_STRIP_RE.sub("", lower).strip()
+	if plain in _PLACEHOLDER_REASONS:
 		return ""
 	if "short justification" in lower or "short reason" in lower:
 		if "original_stem=" not in lower and "feature_flag" not in lower:
 			return ""
-	if "justification" in lower and len(lower.split()) <= 3:
+	# single-spaced, so three words or fewer means at most two spaces
+	if "justification" in lower and lower.count(" ") <= 2:
 		return ""
 	return cleaned
 
@@ -162,17 +192,11 @@ def _sanitize_prompt_text(
 	text = str(value)
 	if not text:
 		return ""
-	text = text.replace("\r\n", "\n").replace("\r", "\n")
-	text = text.replace("```", " ")
-	text = _NONPRINTABLE_RE.sub(" ", text)
-	text = text.replace("\t", " ")
+	text = _PROMPT_BLANK_RE.sub(" ", text)
 	lines: list[str] = []
 	seen: set[str] = set()
 	for raw in text.splitlines():
-		compact = " ".join(raw.split())
-		if not compact:
-			continue
-		tokens = [token for token in compact.split(" ") if len(token) <= max_token_len]
+		tokens = [token for token in raw.split() if len(token) <= max_token_len]
 		if not tokens:
 			continue
 		line = " ".join(tokens)
@@ -219,19 +243,21 @@ def compute_stem_features(original_stem: str, suggested_name: str) -> dict[str,
 	Compute deterministic features for keep-original decisions.
 	"""
 	stem = original_stem.strip()
-	alnum = re.sub(r"[^A-Za-z0-9]", "", stem)
+	alnum = _NON_ALNUM_RE.sub("", stem)
 	alnum_length = len(alnum)
-	digits = sum(ch.isdigit() for ch in alnum)
-	letters = sum(ch.isalpha() for ch in alnum)
+	# alnum is ASCII letters and digits only, so one count gives both
+	digits = sum(map(str.isdigit, alnum))
+	letters = alnum_length - digits
 	digit_ratio = digits / max(1, alnum_length)
 	tokens = [t for t in _TOKEN_SPLIT_RE.split(stem) if t]
 	alpha_token_count = sum(1 for t in tokens if any(ch.isalpha() for ch in t))
 	token_count = len(tokens)
 	has_letter = letters > 0
 	is_numeric_only = bool(stem) and stem.isdigit()
-	long_digit_run = bool(_LONG_DIGIT_RUN_RE.search(stem))
-	uuid_like = bool(_UUID_RE.match(stem))
-	hex_blob = bool(_HEX_BLOB_RE.search(stem))
+	# length guards skip the regex engine for typical short stems
+	long_digit_run = len(stem) >= 8 and bool(_LONG_DIGIT_RUN_RE.search(stem))
+	uuid_like = len(stem) == _UUID_LENGTH and bool(_UUID_RE.match(stem))
+	hex_blob = alnum_length >= 8 and bool(_HEX_BLOB_RE.search(stem))
 	generic_label = bool(_GENERIC_LABEL_RE.match(stem))
 	stem_in_suggested = stem.lower() in suggested_name.lower() if stem and suggested_name else False
 	return {
@@ -250,30 +276,86 @@ def compute_stem_features(original_stem: str, suggested_name: str) -> dict[str,
 	}
 
 
+@functools.lru_cache(maxsize=32)
+def _tag_patterns(tag: str) -> tuple[re.Pattern[str], re.Pattern[str]]:
+	"""
+	Case-insensitive open and close token patterns for one tag name.
+	"""
+	escaped = re.escape(tag)
+	open_re = re.compile(f"<{escaped}", re.IGNORECASE)
+	close_re = re.compile(f"</{escaped}", re.IGNORECASE)
+	return open_re, close_re
+
+
+def _is_opaque_hex(stem: str) -> bool:
+	"""
+	True for a hex identifier, not a number, date, or word plus year.
+	"""
+	if not _HEX_ONLY_RE.match(stem):
+		return False
+	has_digit = any(ch.isdigit() for ch in stem)
+	has_letter = any(ch.isalpha() for ch in stem)
+	if not (has_digit and has_letter):
+		return False
+	if len(stem) >= _LONG_HEX_LENGTH:
+		return True
+	# short stems like Decade2024 are a word and a year, not hex
+	opaque = not _WORD_RUN_RE.search(stem) and not _DATE_LIKE_RE.search(stem)
+	return opaque
+
+
+def obvious_stem_action(original_stem: str, features: dict[str, object]) -> tuple[str, str] | None:
+	"""
+	Decide the stem action without the LLM when the stem carries no meaning.
+
+	Only opaque stems are decided here (camera or download counters,
+	UUIDs, a lone hex blob); anything that might hold a name, date, or
+	model number is left to the model.
+
+	Args:
+		original_stem: Original filename stem.
+		features: Output of compute_stem_features().
+
+	Returns:
+		Tuple of (stem_action, reason), or None to ask the LLM.
+	"""
+	stem = original_stem.strip()
+	if features.get("generic_label") and not _DATE_LIKE_RE.search(stem):
+		return ("drop", "stem is a generic camera or download label")
+	if features.get("uuid_like"):
+		return ("drop", "stem is a random UUID")
+	if features.get("token_count") == 1 and _is_opaque_hex(stem):
+		return ("drop", "stem is an opaque hex identifier")
+	return None
+
+
 def extract_xml_tag_content(raw_text: str, tag: str) -> str:
 	"""
 	Extract the last occurrence of a given XML-like tag.
 	"""
 	if not raw_text:
 		return ""
-	lower = raw_text.lower()
-	open_token = f"<{tag}"
-	close_token = f"</{tag}"
-	start_idx = lower.rfind(open_token)
+	open_re, close_re = _tag_patterns(tag)
+	# search in place instead of lowercasing a copy of the whole reply
+	start_idx = -1
+	for match in open_re.finditer(raw_text):
+		start_idx = match.start()
 	if start_idx == -1:
 		return ""
 	gt_idx = raw_text.find(">", start_idx)
 	if gt_idx == -1:
 		return ""
-	close_idx = lower.find(close_token, gt_idx + 1)
-	if close_idx == -1:
+	close_match = close_re.search(raw_text, gt_idx + 1)
+	if close_match is None:
 		content = raw_text[gt_idx + 1 :]
 		return content.strip()
-	content = raw_text[gt_idx + 1 : close_idx]
+	content = raw_text[gt_idx + 1 : close_match.start()]
 	return content.strip()
 
 
+@functools.lru_cache(maxsize=1)
 def _parse_macos_version() -> tuple[int, int, int]:
+	# platform.mac_ver() reads SystemVersion.plist on every call
 	version_str = platform.mac_ver()[0]
 	parts = [int(p) for p in version_str.split(".") if p.isdigit()]
 	while len(parts) < 3:
@@ -283,7 +365,11 @@ def _parse_macos_version() -> tuple[int, int, int]:
 	return 0, 0, 0
 
 
+@functools.lru_cache(maxsize=1)
 def apple_models_available() -> bool:
+	"""
+	Check once per process whether Apple Foundation Models can run here.
+	"""
 	try:
 		from applefoundationmodels import Session, apple_intelligence_available
 	except Exception:
@@ -304,9 +390,12 @@ def apple_models_available() -> bool:
 
 
 def _is_context_window_error(exc: Exception) -> bool:
-	name = exc.__class__.__name__.lower()
+	# the class name settles most cases without formatting the message
+	if "contextwindow" in exc.__class__.__name__.lower():
+		return True
+	# search the whole message: errors can echo the prompt before the wording
 	message = str(exc).lower()
-	if "contextwindow" in name or "contextwindow" in message:
+	if "contextwindow" in message:
 		return True
 	if "context window" in message or "context length" in message:
 		return True
@@ -315,6 +404,7 @@ def _is_context_window_error(exc: Exception) -> bool:
 	return False
 
 
+@functools.lru_cache(maxsize=1)
 def total_ram_bytes() -> int:
 	"""
 	Estimate total system memory.
@@ -332,31 +422,90 @@ def total_ram_bytes() -> int:
 	return 0
 
 
+def _sysctl_u64(name: str) -> int | None:
+	"""
+	Read a 64-bit integer sysctl through libc sysctlbyname (macOS) without forking.
+	"""
+	libc_path = ctypes.util.find_library("c")
+	if not libc_path:
+		return None
+	try:
+		sysctlbyname = ctypes.CDLL(libc_path).sysctlbyname
+	except (OSError, AttributeError):
+		return None
+	value = ctypes.c_uint64(0)
+	size = ctypes.c_size_t(ctypes.sizeof(value))
+	status = sysctlbyname(
+		name.encode("ascii"), ctypes.byref(value), ctypes.byref(size), None, ctypes.c_size_t(0)
+	)
+	if status != 0:
+		return None
+	return value.value
+
+
+def _sysctl_memsize_bytes() -> int | None:
+	"""
+	Read unified memory size via sysctl (fast compared to system_profiler).
+	"""
+	memsize = _sysctl_u64("hw.memsize")
+	if memsize:
+		return memsize
+	try:
+		output = subprocess.check_output(
+			["sysctl", "-n", "hw.memsize"], text=True, stderr=subprocess.DEVNULL
+		)
+	except Exception:
+		return None
+	value = output.strip()
+	if not value.isdigit():
+		return None
+	return int(value)
+
+
+def _parse_memory_gb(text: str) -> int | None:
+	"""
+	Parse the unified memory size from system_profiler SPHardwareDataType output.
+	"""
+	match = _MEMORY_GB_RE.search(text)
+	if not match:
+		return None
+	return int(match.group(1))
+
+
+def _parse_vram_gb(text: str) -> int | None:
+	"""
+	Parse discrete VRAM (in GB) from system_profiler SPDisplaysDataType output.
+	"""
+	match = _VRAM_MB_RE.search(text)
+	if not match:
+		return None
+	vram_mb = int(match.group(1))
+	return vram_mb // 1024
+
+
+@functools.lru_cache(maxsize=1)
 def get_vram_size_in_gb() -> int | None:
 	"""
 	Detect VRAM or unified memory size in GB.
+
+	Cached per process because the probes spawn subprocesses.
 	"""
 	try:
-		arch = subprocess.check_output(["uname", "-m"], text=True).strip()
-		is_apple_silicon = arch.startswith("arm64")
+		is_apple_silicon = platform.machine().lower().startswith("arm64")
 		if is_apple_silicon:
+			memsize = _sysctl_memsize_bytes()
+			if memsize:
+				return memsize // (1024 ** 3)
 			hardware_info = subprocess.check_output(
 				["system_profiler", "SPHardwareDataType"], text=True
 			)
-			match = re.search(r"Memory:\\s(\\d+)\\s?GB", hardware_info)
-			if match:
-				return int(match.group(1))
-		else:
-			display_info = subprocess.check_output(
-				["system_profiler", "SPDisplaysDataType"], text=True
-			)
-			vram_match = re.search(r"VRAM.*?: (\\d+)\\s?MB", display_info)
-			if vram_match:
-				vram_mb = int(vram_match.group(1))
-				return vram_mb // 1024
+			return _parse_memory_gb(hardware_info)
+		display_info = subprocess.check_output(
+			["system_profiler", "SPDisplaysDataType"], text=True
+		)
+		return _parse_vram_gb(display_info)
 	except Exception:
 		return None
-	return None
 
 
 def choose_model(model_override: str | None) -> str:
@@ -384,30 +533,92 @@ def choose_model(model_override: str | None) -> str:
 	return "llama3.2:1b-instruct-q4_K_M"
 
 
+@functools.lru_cache(maxsize=256)
 def pick_category(extension: str) -> str:
 	"""
 	Choose simple category from extension (broad buckets).
 	"""
-	ext = extension.lower()
-	if ext in {"pdf", "doc", "docx", "odt", "rtf", "pages", "txt", "md", "html", "htm"}:
-		return "Document"
-	if ext in {"ppt", "pptx", "odp"}:
-		return "Presentation"
-	if ext in {"xls", "xlsx", "ods", "csv", "tsv"}:
-		return "Data"
-	if ext in {"png", "jpg", "jpeg", "heic", "gif", "tif", "tiff", "bmp", "svg", "svgz", "odg"}:
-		return "Image"
-	if ext in {"mp3", "wav", "flac", "aiff", "ogg"}:
-		return "Audio"
-	if ext in {"mp4", "mov", "mkv", "webm", "avi"}:
-		return "Video"
-	if ext in {"py", "m", "cpp", "js", "sh", "pl", "rb", "php"}:
-		return "Code"
-	return "Other"
+	category = _EXT_TO_CATEGORY.get(extension.lower(), "Other")
+	return category
+
+
+# canonical category by lowercase name, also accepting simple plurals
+_CATEGORY_LOOKUP: dict[str, str] = {}
+for _category in ALLOWED_CATEGORIES:
+	_CATEGORY_LOOKUP[_category.lower()] = _category
+	_CATEGORY_LOOKUP[_category.lower() + "s"] = _category
+_CATEGORY_WORD_RE = re.compile(r"[A-Za-z]+")
+
+
+# words in a file name or title that point at one category; only trusted
+# when they agree with the extension's category
+_CATEGORY_KEYWORDS: dict[str, tuple[str, ...]] = {
+	"Document": ("invoice", "receipt", "resume", "contract", "statement", "manual", "syllabus"),
+	"Presentation": ("slides", "slideshow", "deck", "keynote"),
+	"Image": ("photo", "screenshot", "selfie", "wallpaper"),
+	"Audio": ("podcast", "song", "voicemail", "ringtone"),
+	"Video": ("movie", "trailer", "screencast"),
+	"Code": ("script",),
+	"Data": ("dataset",),
+}
+_KEYWORD_TO_CATEGORY: dict[str, str] = {
+	keyword: category
+	for category, keywords in _CATEGORY_KEYWORDS.items()
+	for keyword in keywords
+}
+# one alternation scans the text once for every keyword; letter lookarounds
+# (not \b) so "Screenshot_2024" and "tax-invoice" still match
+_CATEGORY_KEYWORD_RE = re.compile(
+	r"(?<![a-z])("
+	+ "|".join(sorted(_KEYWORD_TO_CATEGORY, key=len, reverse=True))
+	+ r")s?(?![a-z])",
+	re.IGNORECASE,
+)
+
+
+def keyword_category(text: str, extension: str) -> tuple[str, str] | None:
+	"""
+	Pick a category from keywords when the answer is unambiguous.
+
+	Args:
+		text: File name and description to scan.
+		extension: File extension without the dot.
+
+	Returns:
+		Tuple of (category, matched keyword), or None when no keyword fires,
+		keywords disagree, or they contradict the extension.
+	"""
+	matches = {match.lower() for match in _CATEGORY_KEYWORD_RE.findall(text)}
+	categories = {_KEYWORD_TO_CATEGORY[match] for match in matches}
+	if len(categories) != 1:
+		return None
+	category = categories.pop()
+	if category != pick_category(extension):
+		return None
+	return (category, min(matches))
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_category(value: str) -> str:
+	"""
+	Map a model category reply onto ALLOWED_CATEGORIES with one dict lookup.
+
+	Only the first word counts, so "Document/Invoices", "documents (pdf)",
+	and "Image - photo" all resolve directly.
+	"""
+	match = _CATEGORY_WORD_RE.search(value or "")
+	if not match:
+		return "Other"
+	category = _CATEGORY_LOOKUP.get(match.group(0).lower(), "Other")
+	return category
 
 
 def _is_guardrail_error(exc: Exception) -> bool:
-	if _GUARDRAIL_ERRORS and isinstance(exc, _GUARDRAIL_ERRORS):
+	# an error raised by applefoundationmodels means it is imported already;
+	# never import it here, it is slow to load at CLI startup
+	exceptions_module = sys.modules.get("applefoundationmodels.exceptions")
+	guardrail_error = getattr(exceptions_module, "GuardrailViolationError", None)
+	if guardrail_error is not None and isinstance(exc, guardrail_error):
 		return True
 	name = exc.__class__.__name__.lower()
 	if "guardrail" in name:
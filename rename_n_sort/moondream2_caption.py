@@ -98,12 +98,33 @@ def setup_ai_components(prompt: str | None = None) -> dict:
 	}
 
 
-def generate_caption(image_path: str, ai_components: dict) -> str:
+def load_image(image_path: str) -> Image.Image:
 	"""
-	Generate a caption for an image using Moondream2.
+	Decode and downsize an image for captioning.
+
+	Kept apart from caption_image so callers can decode upcoming images on
+	other threads while the model is busy (the model API takes one image
+	per call, so there is no batched forward pass to feed).
 	"""
 	image = Image.open(image_path)
+	image.load()
 	image = _resize_image(image, 1280)
+	return image
+
+
+def generate_caption(image_path: str, ai_components: dict) -> str:
+	"""
+	Generate a caption for an image using Moondream2.
+	"""
+	image = load_image(image_path)
+	caption = caption_image(image, ai_components)
+	return caption
+
+
+def caption_image(image: Image.Image, ai_components: dict) -> str:
+	"""
+	Caption an already loaded image.
+	"""
 	model = ai_components["model"]
 	prompt = ai_components.get("prompt")
 	if prompt:
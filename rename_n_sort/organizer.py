@@ -8,21 +8,46 @@ import logging
 import re
 from datetime import datetime, timezone
 from dataclasses import dataclass
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+import itertools
 import sys
 import os
+import stat
+import threading
 
 # local repo modules
 from .config import AppConfig
 from .llm_engine import LLMEngine
+from .llm_parsers import SortResult
 from .llm_prompts import SortItem
-from .llm_utils import normalize_reason, sanitize_filename
+from .llm_utils import (
+	keyword_category,
+	normalize_category,
+	normalize_reason,
+	pick_category,
+	sanitize_filename,
+)
 from .plugins import FileMetadata, PluginRegistry, build_registry
+from .plugins.cache import MetadataCache
+from .plugins.mdls_utils import mdls_batch
+from .path_utils import extension_of
 from .renamer import apply_move
 from .scanner import iter_files
+from .term_utils import stdout_is_tty
 
 logger = logging.getLogger(__name__)
 _DOC_TYPE_TOKENS = {"invoice", "receipt", "order"}
+_ALNUM_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+# metadata keys that carry real content; without any of them the LLM would
+# only see the file name and extension
+_CONTENT_KEYS = ("description", "caption", "ocr_text", "pdf_text")
+# files per mdls prefetch; one process each instead of one per file
+_MDLS_PREFETCH_CHUNK = 500
+# --parallel workers append to KEEP_ORIGINAL.log; keep their records whole
+_KEEP_LOG_LOCK = threading.Lock()
 
 #============================================
 
@@ -44,6 +69,10 @@ class PlannedChange:
 	stem_reason: str = ""
 	stem_raw: str = ""
 	category_reason: str = ""
+	pdf_text_sample: str = ""
+	llm_skipped: bool = False
+	# category from the combined rename prompt; None when not asked for
+	suggested_category: str | None = None
 
 
 #============================================
@@ -56,7 +85,7 @@ class Organizer:
 
 	#============================================
 	def _color(self, text: str, code: str) -> str:
-		if sys.stdout.isatty():
+		if self._use_color:
 			return f"\033[{code}m{text}\033[0m"
 		return text
 
@@ -66,9 +95,10 @@ class Organizer:
 
 	#============================================
 	def _display_path(self, path: Path) -> str:
+		# normalized roots are already resolved
 		for root in self.config.normalized_roots():
 			try:
-				return str(path.resolve().relative_to(root.resolve()))
+				return str(path.resolve().relative_to(root))
 			except Exception:
 				continue
 		return path.name
@@ -94,7 +124,7 @@ class Organizer:
 			return self.config.normalized_target_root()
 		for root in self.config.normalized_roots():
 			try:
-				source.resolve().relative_to(root.resolve())
+				source.resolve().relative_to(root)
 				return root / "Organized"
 			except Exception:
 				continue
@@ -165,7 +195,7 @@ class Organizer:
 		if raw_text is None:
 			return
 		try:
-			with open("KEEP_ORIGINAL.log", "a", encoding="utf-8") as handle:
+			with _KEEP_LOG_LOCK, open("KEEP_ORIGINAL.log", "a", encoding="utf-8") as handle:
 				handle.write("=" * 80 + "\n")
 				handle.write(f"FILE: {self._display_path(path)}\n")
 				handle.write(f"stem_action={stem_action}\n")
@@ -196,6 +226,7 @@ class Organizer:
 		total = len(plans)
 		fewer_tokens = 0
 		keep_count = 0
+		llm_skipped = sum(1 for plan in plans if plan.llm_skipped)
 		invoice_files = 0
 		receipt_files = 0
 		for plan in plans:
@@ -218,6 +249,7 @@ class Organizer:
 				handle.write(f"total_files={total}\n")
 				handle.write(f"fewer_tokens={fewer_tokens} ({_pct(fewer_tokens)})\n")
 				handle.write(f"stem_action_keep={keep_count} ({_pct(keep_count)})\n")
+				handle.write(f"llm_skipped={llm_skipped} ({_pct(llm_skipped)})\n")
 				handle.write(f"invoice_files={invoice_files}\n")
 				handle.write(f"receipt_files={receipt_files}\n")
 		except Exception:
@@ -240,7 +272,7 @@ class Organizer:
 	def _tokenize(self, text: str) -> set[str]:
 		if not text:
 			return set()
-		return {token.lower() for token in re.findall(r"[A-Za-z0-9]+", text)}
+		return {token.lower() for token in _ALNUM_TOKEN_RE.findall(text)}
 
 	#============================================
 	def _collect_doc_type_text(self, meta_payload: dict, path: Path, orig_stem: str) -> str:
@@ -290,22 +322,105 @@ class Organizer:
 		print(f"{tag} {label}: {self._shorten(value)}")
 
 	#============================================
-	def _plan_one(self, path: Path) -> tuple[PlannedChange, SortItem]:
-		metadata = self._collect_metadata(path)
+	def _print_skip(self, plan: PlannedChange) -> None:
+		tag = self._color("[SKIP]", "36")
+		print(f"{tag} LLM skipped: no descriptive metadata (category={plan.category})")
+
+	#============================================
+	def _is_trivial(self, metadata: FileMetadata, path: Path) -> bool:
+		"""
+		True when the file has no descriptive metadata and a known category.
+		"""
+		if pick_category(path.suffix.lstrip(".")) == "Other":
+			return False
+		if metadata.title or metadata.keywords:
+			return False
+		if any(metadata.extra.get(key) for key in _CONTENT_KEYS):
+			return False
+		summary = (metadata.summary or "").lower()
+		hint = str(metadata.extra.get("filetype_hint") or "").lower()
+		# plugin boilerplate such as "Audio file mp3" says nothing new
+		if summary and not (hint and summary.startswith(hint)):
+			return False
+		return True
+
+	#============================================
+	def _trivial_plan(self, path: Path, metadata: FileMetadata) -> tuple[PlannedChange, SortItem]:
+		"""
+		Plan a file without LLM calls: keep its name, category from extension.
+		"""
+		new_name = self._normalize_new_name(path.name, path.stem)
+		plan = PlannedChange(
+			source=path,
+			target=path,
+			category=pick_category(path.suffix.lstrip(".")),
+			plugin=metadata.plugin_name,
+			dry_run=self.config.dry_run,
+			new_name=new_name,
+			stem_action="keep",
+			rename_reason="no descriptive metadata; kept original name",
+			category_reason="category from extension",
+			llm_skipped=True,
+		)
+		summary = SortItem(
+			path=str(path.resolve()),
+			name=new_name,
+			ext=path.suffix.lstrip("."),
+			description=str(metadata.extra.get("filetype_hint") or ""),
+		)
+		return (plan, summary)
+
+	#============================================
+	def _apply_keyword_category(self, plan: PlannedChange, item: SortItem) -> bool:
+		"""
+		Set the category from name keywords when they are unambiguous.
+
+		Returns:
+			True when the category was set and the sort prompt can be skipped.
+		"""
+		if not self.config.fast_path:
+			return False
+		match = keyword_category(f"{item.name} {item.description}", item.ext)
+		if match is None:
+			return False
+		category, keyword = match
+		plan.category = category
+		plan.category_reason = f"keyword '{keyword}' matches {category}"
+		return True
+
+	#============================================
+	def _plan_one(
+		self, path: Path, metadata: FileMetadata | None = None, with_category: bool = False
+	) -> tuple[PlannedChange, SortItem]:
+		if metadata is None:
+			metadata = self._collect_metadata(path)
+		if self.config.fast_path and self._is_trivial(metadata, path):
+			return self._trivial_plan(path, metadata)
 		pdf_text = metadata.extra.get("pdf_text") if metadata else None
+		pdf_text_sample = ""
 		if pdf_text:
 			if self._normalize_text(metadata.summary) != self._normalize_text(pdf_text):
-				self._print_meta("raw_pdf_text_sample", pdf_text)
-		meta_payload = self._to_payload(metadata, path)
-		rename_result = self.llm.rename(path.name, meta_payload)
+				# printed by the caller so parallel planning keeps per-file output together
+				pdf_text_sample = pdf_text
+		meta_payload = metadata.to_payload()
+		# one LLM call answers both the new name and what to do with the old
+		# stem, and with_category also the category
+		sort_result: SortResult | None = None
+		if with_category:
+			rename_result, keep_result, sort_result = self.llm.rename_stem_action_and_category(
+				path.name,
+				meta_payload,
+				extension=path.suffix.lstrip("."),
+			)
+		else:
+			rename_result, keep_result = self.llm.rename_and_stem_action(
+				path.name,
+				meta_payload,
+				extension=path.suffix.lstrip("."),
+			)
 		new_name = self._normalize_new_name(path.name, rename_result.new_name)
 		rename_reason = rename_result.reason
 		orig_stem = Path(path.name).stem
-		keep_result = self.llm.stem_action(
-			orig_stem,
-			new_name,
-			extension=path.suffix.lstrip("."),
-		)
 		stem_action = keep_result.stem_action
 		stem_reason = keep_result.reason
 		stem_raw = keep_result.raw_text
@@ -341,7 +456,11 @@ class Organizer:
 			rename_reason=rename_reason,
 			stem_reason=stem_reason,
 			stem_raw=stem_raw,
+			pdf_text_sample=pdf_text_sample,
 		)
+		if sort_result is not None:
+			plan.suggested_category = sort_result.assignments.get(path.name)
+			plan.category_reason = sort_result.reasons.get(path.name, "")
 		self._log_keep_original_raw(path, stem_raw, stem_action, stem_reason)
 		sort_description = self._build_sort_description(meta_payload)
 		summary = SortItem(
@@ -355,7 +474,11 @@ class Organizer:
 	#============================================
 	def __init__(self, config: AppConfig, llm: LLMEngine | None = None) -> None:
 		self.config = config
+		# checked once; every report line is colored through _color
+		self._use_color = stdout_is_tty()
 		self.registry: PluginRegistry = build_registry()
+		# set by the CLI; None extracts every file from scratch
+		self.metadata_cache: MetadataCache | None = None
 		self._supported_extensions = self._collect_supported_extensions()
 		if not llm:
 			raise RuntimeError("Organizer requires a configured LLM backend.")
@@ -378,7 +501,113 @@ class Organizer:
 				continue
 
 	#============================================
-	def plan(self, files: list[Path] | None = None) -> list[PlannedChange]:
+	def _is_plannable(self, path: Path) -> bool:
+		return path.is_file() and self._is_supported_extension(path)
+
+	#============================================
+	def _prefetch_mdls(self, candidates: Iterable[Path]) -> Iterator[Path]:
+		"""
+		Pass paths through, reading Spotlight fields a chunk at a time.
+		"""
+		iterator = iter(candidates)
+		while True:
+			chunk = list(itertools.islice(iterator, _MDLS_PREFETCH_CHUNK))
+			if not chunk:
+				return
+			mdls_batch([path for path in chunk if self._needs_mdls(path)])
+			yield from chunk
+
+	#============================================
+	def _needs_mdls(self, path: Path) -> bool:
+		"""
+		True for plannable files whose metadata is not cached yet.
+		"""
+		# extension first; it needs no system call
+		if not self._is_supported_extension(path):
+			return False
+		try:
+			stat_result = path.stat()
+		except OSError:
+			return False
+		if not stat.S_ISREG(stat_result.st_mode):
+			return False
+		if self.metadata_cache is None:
+			return True
+		return not self.metadata_cache.contains(path, stat_result)
+
+	#============================================
+	def _iter_plan_jobs(
+		self, candidates: Iterable[Path], with_category: bool = False
+	) -> Iterator[tuple[Path, Future | None]]:
+		"""
+		Yield (path, future) in input order with _plan_one started ahead of time.
+
+		With config.parallel above 1, up to that many files have their rename
+		and stem prompts in flight at once, so LLM round trips overlap instead
+		of adding up. Pass each pair to _planned with the same with_category;
+		the future is None when nothing was started ahead for the path.
+		"""
+		if self.config.parallel <= 1:
+			yield from self._iter_serial_jobs(candidates)
+			return
+		window: deque[tuple[Path, Future | None]] = deque()
+		with ThreadPoolExecutor(max_workers=self.config.parallel) as pool:
+			for path in candidates:
+				future = None
+				if self._is_plannable(path):
+					future = pool.submit(self._plan_one, path, None, with_category)
+				window.append((path, future))
+				if len(window) >= self.config.parallel:
+					yield window.popleft()
+			while window:
+				yield window.popleft()
+
+	#============================================
+	def _iter_serial_jobs(
+		self, candidates: Iterable[Path]
+	) -> Iterator[tuple[Path, Future | None]]:
+		"""
+		Serial planning with metadata for upcoming files read in the background.
+
+		Plugin extraction is mostly I/O and subprocess waits (mdls, PDF text,
+		OCR), so it overlaps well with the LLM call for the current file. The
+		LLM prompts themselves still run one file at a time.
+		"""
+		workers = self.config.metadata_workers
+		if workers <= 1:
+			for path in candidates:
+				yield (path, None)
+			return
+		window: deque[tuple[Path, Future | None]] = deque()
+		with ThreadPoolExecutor(max_workers=workers) as pool:
+			for path in candidates:
+				future = pool.submit(self._collect_metadata, path) if self._is_plannable(path) else None
+				window.append((path, future))
+				if len(window) > workers:
+					yield window.popleft()
+			while window:
+				yield window.popleft()
+
+	#============================================
+	def _planned(
+		self, path: Path, job: Future | None, with_category: bool = False
+	) -> tuple[PlannedChange, SortItem]:
+		"""
+		Finish planning a path from the job _iter_plan_jobs yielded for it.
+
+		The job holds either a whole plan (parallel mode) or prefetched
+		metadata (serial mode), in which case the LLM calls happen here so
+		their output follows the file header.
+		"""
+		if job is None:
+			return self._plan_one(path, with_category=with_category)
+		result = job.result()
+		if isinstance(result, FileMetadata):
+			return self._plan_one(path, result, with_category)
+		return result
+
+	#============================================
+	def plan(self, files: Iterable[Path] | None = None) -> list[PlannedChange]:
 		"""
 		Build plan for all files.
 
@@ -387,23 +616,24 @@ class Organizer:
 		"""
 		plans: list[PlannedChange] = []
 		summaries: list[SortItem] = []
-		candidates = files if files is not None else iter_files(self.config)
+		candidates = self._prefetch_mdls(files if files is not None else iter_files(self.config))
 		first = True
-		for idx, path in enumerate(candidates):
+		for path, future in self._iter_plan_jobs(candidates):
 			if not first:
 				self._print_separator()
 			first = False
 			print(f"{self._color('[FILE]', '34')} {self._display_path(path)}")
-			if not path.exists() or not path.is_file():
+			if not path.is_file():
 				self._print_why("error", "Path is not a file")
 				self._print_why("action", "skipping path")
 				continue
 			if not self._is_supported_extension(path):
-				ext = path.suffix.lower().lstrip(".")
+				ext = extension_of(path.name)
 				self._print_why("error", f"Unsupported extension: .{ext}")
 				self._print_why("action", "skipping file due to unsupported extension")
 				continue
-			plan, summary = self._plan_one(path)
+			plan, summary = self._planned(path, future)
+			self._print_meta("raw_pdf_text_sample", plan.pdf_text_sample)
 			title = summary.description or ""
 			self._print_meta("text sample", title)
 			self._print_why("rename_reason", plan.rename_reason)
@@ -420,6 +650,8 @@ class Organizer:
 				plan.new_name,
 				f"(plugin={plan.plugin})",
 			)
+			if plan.llm_skipped:
+				self._print_skip(plan)
 			summaries.append(summary)
 		self._assign_categories(plans, summaries)
 		for plan in plans:
@@ -436,33 +668,37 @@ class Organizer:
 		return plans
 
 	#============================================
-	def process_one_by_one(self, files: list[Path] | None = None) -> list[PlannedChange]:
+	def process_one_by_one(self, files: Iterable[Path] | None = None) -> list[PlannedChange]:
 		"""
 		Process files to completion one by one (RENAME -> DEST -> DRY RUN/APPLY).
+
+		Each file's category is asked for in its rename prompt, so a file
+		costs one LLM call instead of a rename call and a sort call.
 		"""
 		plans: list[PlannedChange] = []
-		candidates = files if files is not None else iter_files(self.config)
+		candidates = self._prefetch_mdls(files if files is not None else iter_files(self.config))
 		first = True
-		for path in candidates:
+		for path, future in self._iter_plan_jobs(candidates, with_category=True):
 			if not first:
 				self._print_separator()
 			first = False
 			print(f"{self._color('[FILE]', '34')} {self._display_path(path)}")
-			if not path.exists() or not path.is_file():
+			if not path.is_file():
 				self._print_why("error", "Path is not a file")
 				self._print_why("action", "skipping path")
 				continue
 			if not self._is_supported_extension(path):
-				ext = path.suffix.lower().lstrip(".")
+				ext = extension_of(path.name)
 				self._print_why("error", f"Unsupported extension: .{ext}")
 				self._print_why("action", "skipping file due to unsupported extension")
 				continue
 			try:
-				plan, summary = self._plan_one(path)
+				plan, summary = self._planned(path, future, with_category=True)
 			except Exception as exc:
 				self._print_why("error", f"{exc.__class__.__name__}: {exc}")
 				self._print_why("action", "skipping file due to LLM error")
 				continue
+			self._print_meta("raw_pdf_text_sample", plan.pdf_text_sample)
 			desc = summary.description or ""
 			self._print_meta("text sample", desc)
 			self._print_why("rename_reason", plan.rename_reason)
@@ -478,16 +714,27 @@ class Organizer:
 				plan.new_name,
 				f"(plugin={plan.plugin})",
 			)
-			try:
-				result = self.llm.sort([summary])
-				selection = result.assignments.get(summary.path, "Other")
-				sort_reason = result.reasons.get(summary.path, "")
-			except Exception as exc:
-				self._print_why("error", f"{exc.__class__.__name__}: {exc}")
-				self._print_why("action", "using fallback category Other")
-				selection = "Other"
-				sort_reason = ""
-			category = selection.split("/")[0] if selection else "Other"
+			if plan.llm_skipped:
+				self._print_skip(plan)
+				selection = plan.category
+				sort_reason = plan.category_reason
+			elif self._apply_keyword_category(plan, summary):
+				selection = plan.category
+				sort_reason = plan.category_reason
+			elif plan.suggested_category is not None:
+				selection = plan.suggested_category
+				sort_reason = plan.category_reason
+			else:
+				try:
+					result = self.llm.sort([summary])
+					selection = result.assignments.get(summary.path, "Other")
+					sort_reason = result.reasons.get(summary.path, "")
+				except Exception as exc:
+					self._print_why("error", f"{exc.__class__.__name__}: {exc}")
+					self._print_why("action", "using fallback category Other")
+					selection = "Other"
+					sort_reason = ""
+			category = normalize_category(selection)
 			plan.category = category
 			plan.category_reason = sort_reason
 			plan.target = self._target_path(plan.source, plan.new_name, category)
@@ -526,24 +773,31 @@ class Organizer:
 		"""
 		Assign categories in batches and update targets.
 		"""
-		if not summaries:
-			return
-		batch_size = 50
-		for start in range(0, len(summaries), batch_size):
-			batch = summaries[start : start + batch_size]
-			result = self.llm.sort(batch)
-			for offset, item in enumerate(batch):
+		pending: list[tuple[PlannedChange, SortItem]] = []
+		for plan, item in zip(plans, summaries):
+			if plan.llm_skipped or self._apply_keyword_category(plan, item):
+				# category already came from the extension or a keyword
+				plan.target = self._target_path(plan.source, plan.new_name, plan.category)
+				self._log_sort_decision(plan)
+				continue
+			pending.append((plan, item))
+		# one sort prompt per batch; keep it small enough for the Apple context window
+		batch_size = 16
+		batches = [pending[start : start + batch_size] for start in range(0, len(pending), batch_size)]
+		requests = [[item for _plan, item in batch] for batch in batches]
+		if self.config.parallel > 1 and len(batches) > 1:
+			# batches are independent; overlap their round trips like planning does
+			with ThreadPoolExecutor(max_workers=self.config.parallel) as pool:
+				results = list(pool.map(self.llm.sort, requests))
+		else:
+			results = [self.llm.sort(request) for request in requests]
+		for batch, result in zip(batches, results):
+			for plan, item in batch:
 				category_text = result.assignments.get(item.path, "Other")
-				category = category_text.split("/")[0] if category_text else "Other"
-				sort_reason = result.reasons.get(item.path, "")
-				plan_index = start + offset
-				if plan_index < len(plans):
-					plans[plan_index].category = category
-					plans[plan_index].category_reason = sort_reason
-					plans[plan_index].target = self._target_path(
-						plans[plan_index].source, plans[plan_index].new_name, category
-					)
-					self._log_sort_decision(plans[plan_index])
+				plan.category = normalize_category(category_text)
+				plan.category_reason = result.reasons.get(item.path, "")
+				plan.target = self._target_path(plan.source, plan.new_name, plan.category)
+				self._log_sort_decision(plan)
 
 	#============================================
 	def apply(self, plans: list[PlannedChange]) -> list[PlannedChange]:
@@ -582,17 +836,20 @@ class Organizer:
 		Returns:
 			FileMetadata object.
 		"""
+		# one stat per file; plugins reuse it for size and timestamps
+		stat_result = path.stat()
+		if self.metadata_cache is not None:
+			cached = self.metadata_cache.get(path, stat_result)
+			if cached is not None:
+				return cached
 		plugin = self.registry.for_path(path)
-		meta = plugin.extract_metadata(path)
+		meta = plugin.extract_metadata(path, stat_result)
 		meta.plugin_name = plugin.name
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.extension = path.suffix.lstrip(".")
 		if "filetype_hint" not in meta.extra and getattr(plugin, "filetype_hint", None):
 			meta.extra["filetype_hint"] = plugin.filetype_hint
-		if "extension" not in meta.extra:
-			meta.extra["extension"] = path.suffix.lstrip(".")
-		meta.extra["keywords"] = meta.keywords
-		meta.extra["title"] = meta.title
-		meta.extra["summary"] = meta.summary
+		if self.metadata_cache is not None:
+			self.metadata_cache.put(path, stat_result, meta)
 		return meta
 
 	#============================================
@@ -607,33 +864,11 @@ class Organizer:
 
 	#============================================
 	def _is_supported_extension(self, path: Path) -> bool:
-		ext = path.suffix.lower().lstrip(".")
+		ext = extension_of(path.name)
 		if not ext:
 			return True
 		return ext in self._supported_extensions
 
-	#============================================
-	def _to_payload(self, meta: FileMetadata, path: Path) -> dict:
-		"""
-		Convert metadata object to dictionary for LLMs.
-
-		Args:
-			meta: FileMetadata object.
-			path: Source path.
-
-		Returns:
-			Dictionary payload.
-		"""
-		payload: dict = {
-			"title": meta.title,
-			"keywords": meta.keywords,
-			"summary": meta.summary,
-			"extension": path.suffix.lstrip("."),
-			"plugin": meta.plugin_name,
-		}
-		payload.update(meta.extra)
-		return payload
-
 	#============================================
 	def _target_path(self, path: Path, suggested_name: str, category: str) -> Path:
 		"""
@@ -672,8 +907,14 @@ class Organizer:
 		if "-current_name" in lower_name:
 			name = name[: lower_name.index("-current_name")]
 			name = name.rstrip("-_.")
-		while ext and name.lower().endswith(ext + ext):
-			name = name[: -len(ext)]
+		if ext:
+			# count trailing copies of the extension in one pass, then keep just one
+			lower_name = name.lower()
+			end = len(name)
+			while lower_name.endswith(ext, 0, end):
+				end -= len(ext)
+			if len(name) - end >= 2 * len(ext):
+				name = name[: end + len(ext)]
 		if not name:
 			name = stem
 		return sanitize_filename(name)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+File name helpers shared by the scanner, registry, and plugins.
+"""
+
+# Standard Library
+import functools
+import sys
+
+#============================================
+
+
+@functools.lru_cache(maxsize=1024)
+def extension_of(name: str) -> str:
+	"""
+	Lowercase extension of a file name without building a Path suffix.
+
+	Matches Path(name).suffix.lower().lstrip("."). The result is interned,
+	so the set and dict lookups that follow compare by identity first, and
+	the cache covers the repeated probes made for the same file.
+
+	Args:
+		name: File name (not a full path).
+
+	Returns:
+		Extension without the dot, or "" when there is none.
+	"""
+	stem, _dot, ext = name.rpartition(".")
+	# no dot, or a leading-dot name like ".bashrc", has no extension
+	if not stem:
+		return ""
+	return sys.intern(ext.lower())
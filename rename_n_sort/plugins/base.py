@@ -2,7 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
+import os
+
+# local repo modules
+from ..path_utils import extension_of
 
 #============================================
 
@@ -18,14 +23,27 @@ class FileMetadata:
 		keywords: Keyword hints.
 		summary: Short text preview.
 		plugin_name: Name of plugin used.
-		extra: Extra metadata.
+		size_bytes: File size in bytes.
+		extension: File suffix without the dot.
+		created_ts: Creation timestamp, or 0.0 when the plugin does not read it.
+		modified_ts: Modification timestamp, or 0.0 when the plugin does not read it.
+		extra: Plugin-specific metadata.
+		complete: False when an optional tool or dependency was missing or
+			failed, so the result is not cached.
 	"""
 	path: Path
 	title: str | None = None
 	keywords: list[str] = field(default_factory=list)
 	summary: str | None = None
 	plugin_name: str = "generic"
+	# fields every plugin sets live in slots, not in the per-file extra dict
+	size_bytes: int = 0
+	extension: str = ""
+	# raw timestamps; formatted only when a payload is built
+	created_ts: float = 0.0
+	modified_ts: float = 0.0
 	extra: dict[str, object] = field(default_factory=dict)
+	complete: bool = True
 
 	#============================================
 	def safe_title(self) -> str:
@@ -39,6 +57,47 @@ class FileMetadata:
 			return self.title
 		return self.path.stem
 
+	#============================================
+	def formatted_created(self) -> str:
+		"""
+		Creation time as an ISO string, or "" when unknown.
+		"""
+		if not self.created_ts:
+			return ""
+		return datetime.fromtimestamp(self.created_ts).isoformat()
+
+	#============================================
+	def formatted_modified(self) -> str:
+		"""
+		Modification time as an ISO string, or "" when unknown.
+		"""
+		if not self.modified_ts:
+			return ""
+		return datetime.fromtimestamp(self.modified_ts).isoformat()
+
+	#============================================
+	def to_payload(self) -> dict[str, object]:
+		"""
+		Flatten metadata into the dictionary sent to the LLM prompts.
+
+		Returns:
+			Core fields merged with the extra metadata.
+		"""
+		payload: dict[str, object] = {
+			"title": self.title,
+			"keywords": self.keywords,
+			"summary": self.summary,
+			"plugin": self.plugin_name,
+			"size_bytes": self.size_bytes,
+			"extension": self.extension,
+		}
+		if self.created_ts:
+			payload["created"] = self.formatted_created()
+		if self.modified_ts:
+			payload["modified"] = self.formatted_modified()
+		payload.update(self.extra)
+		return payload
+
 
 class FileMetadataPlugin:
 	"""
@@ -50,25 +109,30 @@ class FileMetadataPlugin:
 	filetype_hint: str | None = None
 
 	#============================================
-	def supports(self, path: Path) -> bool:
+	def supports(self, path: Path, ext: str) -> bool:
 		"""
 		Determine if this plugin can handle the file.
 
+		The registry only asks plugins that list ext in supported_suffixes,
+		so overrides can decline specific files but not add extensions.
+
 		Args:
 			path: File path.
+			ext: Lowercase extension without the dot.
 
 		Returns:
 			True if supported.
 		"""
-		return False
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		"""
 		Extract metadata for the file.
 
 		Args:
 			path: File path.
+			stat_result: Stat of path from the caller, if already taken.
 
 		Returns:
 			FileMetadata payload.
@@ -84,6 +148,10 @@ class PluginRegistry:
 	#============================================
 	def __init__(self) -> None:
 		self._plugins: list[FileMetadataPlugin] = []
+		# plugins per extension in registration order, so lookup is one dict get
+		self._by_ext: dict[str, list[FileMetadataPlugin]] = {}
+		# plugin with no suffixes (generic) that accepts everything else
+		self._fallback: FileMetadataPlugin | None = None
 
 	#============================================
 	def register(self, plugin: FileMetadataPlugin) -> None:
@@ -94,11 +162,17 @@ class PluginRegistry:
 			plugin: Plugin instance.
 		"""
 		self._plugins.append(plugin)
+		if not plugin.supported_suffixes:
+			if self._fallback is None:
+				self._fallback = plugin
+			return
+		for suffix in plugin.supported_suffixes:
+			self._by_ext.setdefault(suffix.lower(), []).append(plugin)
 
 	#============================================
 	def for_path(self, path: Path) -> FileMetadataPlugin:
 		"""
-		Find the first plugin that supports the path.
+		Find the first registered plugin for the path's extension that supports it.
 
 		Args:
 			path: File path.
@@ -106,9 +180,12 @@ class PluginRegistry:
 		Returns:
 			Plugin instance.
 		"""
-		for plugin in self._plugins:
-			if plugin.supports(path):
+		ext = extension_of(path.name)
+		for plugin in self._by_ext.get(ext, ()):
+			if plugin.supports(path, ext):
 				return plugin
+		if self._fallback is not None and self._fallback.supports(path, ext):
+			return self._fallback
 		raise LookupError(f"No plugin registered for {path.suffix or 'unknown'}")
 
 	#============================================
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Persistent FileMetadata store so unchanged files skip extraction on rescans.
+"""
+
+from __future__ import annotations
+
+# Standard Library
+from pathlib import Path
+import json
+import os
+import sqlite3
+import threading
+
+# local repo modules
+from .base import FileMetadata
+
+#============================================
+
+
+DEFAULT_METADATA_CACHE_PATH = Path("~/.cache/macos_llm_file_cleanup/metadata.sqlite")
+# bump when FileMetadata fields or the table layout change; older entries are dropped on open
+_SCHEMA_VERSION = 1
+
+#============================================
+
+
+def _file_key(path: Path, stat_result: os.stat_result) -> tuple[str, int, int, int, int]:
+	"""
+	Identity of one file version: path, device, inode, mtime and size.
+
+	The path is part of the key because plugin output depends on it
+	(extension, plugin choice, fallback title), so a renamed file is
+	extracted again.
+	"""
+	key = (
+		str(path),
+		stat_result.st_dev,
+		stat_result.st_ino,
+		stat_result.st_mtime_ns,
+		stat_result.st_size,
+	)
+	return key
+
+
+#============================================
+
+
+def _encode(meta: FileMetadata) -> str | None:
+	"""
+	JSON text for a FileMetadata, or None when extra holds non-JSON values.
+
+	FileMetadata.to_payload() is not used because it formats the
+	timestamps and merges extra into the core fields, which cannot be
+	read back.
+	"""
+	fields = {
+		"title": meta.title,
+		"keywords": meta.keywords,
+		"summary": meta.summary,
+		"plugin_name": meta.plugin_name,
+		"size_bytes": meta.size_bytes,
+		"extension": meta.extension,
+		"created_ts": meta.created_ts,
+		"modified_ts": meta.modified_ts,
+		"extra": meta.extra,
+	}
+	try:
+		text = json.dumps(fields)
+	except (TypeError, ValueError):
+		return None
+	return text
+
+
+#============================================
+
+
+def _decode(path: Path, text: str) -> FileMetadata | None:
+	"""
+	FileMetadata from JSON text, or None when the text is not usable.
+	"""
+	try:
+		fields = json.loads(text)
+		meta = FileMetadata(path=path, **fields)
+	except (json.JSONDecodeError, TypeError):
+		return None
+	return meta
+
+
+#============================================
+
+
+class MetadataCache:
+	"""
+	SQLite-backed metadata store shared by all threads of one run.
+
+	Each path holds one entry, stored with its stat identity, so any edit
+	(new mtime or size) or rename is a miss and storing the new version
+	replaces the old one. Results a plugin marked as
+	incomplete, for example because an optional dependency was missing,
+	are never stored.
+	"""
+
+	def __init__(self, path: Path = DEFAULT_METADATA_CACHE_PATH) -> None:
+		self.path = path.expanduser()
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+		(version,) = self._conn.execute("PRAGMA user_version").fetchone()
+		if version != _SCHEMA_VERSION:
+			self._conn.execute("DROP TABLE IF EXISTS metadata")
+			self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+		self._conn.execute(
+			"CREATE TABLE IF NOT EXISTS metadata "
+			"(path TEXT PRIMARY KEY, dev INTEGER, inode INTEGER, mtime_ns INTEGER, size INTEGER, payload TEXT NOT NULL)"
+		)
+		self._conn.commit()
+
+	#============================================
+	def get(self, path: Path, stat_result: os.stat_result) -> FileMetadata | None:
+		"""
+		Return stored metadata for this file version, or None when missing.
+
+		Args:
+			path: File path.
+			stat_result: Stat of path.
+
+		Returns:
+			FileMetadata or None.
+		"""
+		with self._lock:
+			row = self._conn.execute(
+				"SELECT payload FROM metadata WHERE path = ? AND dev = ? AND inode = ? AND mtime_ns = ? AND size = ?",
+				_file_key(path, stat_result),
+			).fetchone()
+		if row is None:
+			return None
+		meta = _decode(path, row[0])
+		return meta
+
+	#============================================
+	def contains(self, path: Path, stat_result: os.stat_result) -> bool:
+		"""
+		Check for an entry without loading it.
+		"""
+		with self._lock:
+			row = self._conn.execute(
+				"SELECT 1 FROM metadata WHERE path = ? AND dev = ? AND inode = ? AND mtime_ns = ? AND size = ?",
+				_file_key(path, stat_result),
+			).fetchone()
+		return row is not None
+
+	#============================================
+	def put(self, path: Path, stat_result: os.stat_result, meta: FileMetadata) -> None:
+		"""
+		Store metadata for this file version unless it is incomplete.
+		"""
+		if not meta.complete:
+			return
+		payload = _encode(meta)
+		if payload is None:
+			return
+		with self._lock:
+			self._conn.execute(
+				"INSERT OR REPLACE INTO metadata (path, dev, inode, mtime_ns, size, payload) VALUES (?, ?, ?, ?, ?, ?)",
+				(*_file_key(path, stat_result), payload),
+			)
+			self._conn.commit()
+
+	#============================================
+	def close(self) -> None:
+		with self._lock:
+			self._conn.close()
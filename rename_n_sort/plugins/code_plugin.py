@@ -3,9 +3,11 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
+import os
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from .read_utils import flatten_whitespace, read_head
 
 #============================================
 
@@ -29,14 +31,14 @@ class CodePlugin(FileMetadataPlugin):
 	}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+	def supports(self, path: Path, ext: str) -> bool:
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
 		meta.title = path.stem
 		snippet = self._read_preview(path)
 		if snippet:
@@ -49,12 +51,12 @@ class CodePlugin(FileMetadataPlugin):
 		Read first chunk of code for context.
 		"""
 		try:
-			text_blob = path.read_text(encoding="utf-8", errors="ignore")
+			text_blob = read_head(path)
 		except Exception:
 			return None
 		lines = text_blob.splitlines()
 		head = "\n".join(lines[:10])
-		flat = " ".join(head.split())
+		flat = flatten_whitespace(head)
 		if not flat:
 			return None
 		return flat[:800]
@@ -3,10 +3,12 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
-import csv
+import os
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from ..path_utils import extension_of
+from .read_utils import flatten_whitespace, read_delimited_rows
 
 #============================================
 
@@ -21,14 +23,14 @@ class CSVPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"csv", "tsv"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+	def supports(self, path: Path, ext: str) -> bool:
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
 		meta.title = path.stem
 		preview = self._read_preview(path)
 		if preview:
@@ -40,20 +42,14 @@ class CSVPlugin(FileMetadataPlugin):
 		"""
 		Read first few rows for context.
 		"""
-		delimiter = "\t" if path.suffix.lower().lstrip(".") == "tsv" else ","
+		delimiter = "\t" if extension_of(path.name) == "tsv" else ","
 		try:
-			with path.open("r", encoding="utf-8", errors="ignore") as handle:
-				reader = csv.reader(handle, delimiter=delimiter)
-				rows = []
-				for idx, row in enumerate(reader):
-					rows.append(row)
-					if idx >= 2:
-						break
+			rows = read_delimited_rows(path, delimiter)
 			if not rows:
 				return None
 			joined = [" | ".join(row) for row in rows]
 			flat = " || ".join(joined)
-			flat = " ".join(flat.split())
+			flat = flatten_whitespace(flat)
 			if not flat:
 				return None
 			return flat[:800]
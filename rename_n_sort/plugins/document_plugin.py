@@ -3,23 +3,35 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
+from types import ModuleType
+import os
 import shutil
 import subprocess
 import tempfile
 
-# PIP3 modules
-try:
-	import docx
-except Exception:
-	docx = None
-
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from ..path_utils import extension_of
+from .read_utils import flatten_whitespace, read_head
 from .mdls_utils import mdls_field
 
 #============================================
 
 
+def _docx_module() -> ModuleType | None:
+	"""
+	Import python-docx on first use; it is slow to import at CLI startup.
+	"""
+	try:
+		import docx
+	except Exception:
+		return None
+	return docx
+
+
+#============================================
+
+
 class DocumentPlugin(FileMetadataPlugin):
 	"""
 	Plugin for common document formats.
@@ -29,21 +41,21 @@ class DocumentPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"doc", "docx", "odt", "rtf", "pages", "txt", "md"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
+	def supports(self, path: Path, ext: str) -> bool:
 		"""
 		Check if this plugin supports the extension.
 		"""
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		"""
 		Extract simple metadata from documents.
 		"""
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
-		ext = path.suffix.lower().lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
+		ext = extension_of(path.name)
 		if ext in {"txt", "md", "rtf"}:
 			meta.extra["filetype_hint"] = "Plain-text Document"
 		elif ext in {"doc", "pages"}:
@@ -54,6 +66,9 @@ class DocumentPlugin(FileMetadataPlugin):
 		snippet = self._read_preview(path)
 		if snippet:
 			meta.summary = snippet
+		elif ext == "doc":
+			# python-docx or LibreOffice missing or failed; do not cache
+			meta.complete = False
 		return meta
 
 	#============================================
@@ -65,22 +80,22 @@ class DocumentPlugin(FileMetadataPlugin):
 		"""
 		Read a short preview for text-like documents.
 		"""
-		ext = path.suffix.lower().lstrip(".")
+		ext = extension_of(path.name)
 		if ext == "doc":
 			return self._read_doc_via_soffice(path)
 		if ext not in {"txt", "md", "rtf"}:
 			return None
 		try:
-			text_blob = path.read_text(encoding="utf-8", errors="ignore")
+			text_blob = read_head(path)
 		except Exception:
 			return None
-		flattened = " ".join(text_blob.split())
+		flattened = flatten_whitespace(text_blob)
 		if not flattened:
 			return None
 		return flattened[:800]
 
 	def _read_doc_via_soffice(self, path: Path) -> str | None:
-		if not docx:
+		if _docx_module() is None:
 			self._print_why(path, "python-docx not installed; skipping DOC conversion")
 			return None
 		soffice = shutil.which("soffice")
@@ -114,7 +129,8 @@ class DocumentPlugin(FileMetadataPlugin):
 			return self._extract_docx_summary(output_path)
 
 	def _extract_docx_summary(self, path: Path) -> str | None:
-		if not docx:
+		docx = _docx_module()
+		if docx is None:
 			return None
 		try:
 			document = docx.Document(path)
@@ -1,18 +1,21 @@
 #!/usr/bin/env python3
 # Standard Library
 from pathlib import Path
-
-# PIP3 modules
-try:
-	import docx
-except Exception:
-	docx = None
+from collections.abc import Iterator
+from typing import IO
+import os
+import xml.etree.ElementTree as ET
+import zipfile
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from .read_utils import head_tail_summary
 
 #============================================
 
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DC_NS = "{http://purl.org/dc/elements/1.1/}"
+
 
 class DocxPlugin(FileMetadataPlugin):
 	"""
@@ -24,49 +27,79 @@ class DocxPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"docx"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
+	def supports(self, path: Path, ext: str) -> bool:
 		"""
 		Check support for docx files.
 
 		Args:
 			path: File path.
+			ext: Lowercase extension without the dot.
 
 		Returns:
 			True when extension is docx.
 		"""
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		"""
 		Extract core properties and preview.
 
 		Args:
 			path: File path.
+			stat_result: Stat of path from the caller, if already taken.
 
 		Returns:
 			FileMetadata with available info.
 		"""
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
-		if not docx:
-			return meta
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
+		# read the two XML parts directly; python-docx would build the whole
+		# document model (styles, numbering, every run) for a 512-char preview
 		try:
-			document = docx.Document(path)
-			if document.core_properties.title:
-				meta.title = document.core_properties.title
-			if document.core_properties.author:
-				meta.keywords.append(document.core_properties.author)
-			all_text: list[str] = []
-			for paragraph in document.paragraphs:
-				if paragraph.text:
-					all_text.append(paragraph.text.strip())
-			if all_text:
-				full = " ".join(all_text)
-				head = full[:256]
-				tail = full[-256:] if len(full) > 256 else ""
-				meta.summary = f"{head} ... {tail}".strip()
+			with zipfile.ZipFile(path) as archive:
+				self._read_core_properties(archive, meta)
+				with archive.open("word/document.xml") as handle:
+					summary = head_tail_summary(self._iter_paragraphs(handle))
 		except Exception:
+			# corrupt, encrypted, or truncated archives raise many types
+			# (zlib.error, RuntimeError, NotImplementedError, EOFError, ...)
 			return meta
+		if summary:
+			meta.summary = summary
 		return meta
+
+	#============================================
+	def _read_core_properties(self, archive: zipfile.ZipFile, meta: FileMetadata) -> None:
+		"""
+		Fill title and author from docProps/core.xml when present.
+		"""
+		if "docProps/core.xml" not in archive.namelist():
+			return
+		core = ET.fromstring(archive.read("docProps/core.xml"))
+		title = (core.findtext(f"{_DC_NS}title") or "").strip()
+		if title:
+			meta.title = title
+		author = (core.findtext(f"{_DC_NS}creator") or "").strip()
+		if author:
+			meta.keywords.append(author)
+
+	#============================================
+	def _iter_paragraphs(self, handle: IO[bytes]) -> Iterator[str]:
+		"""
+		Stream word/document.xml and yield each non-empty paragraph text.
+
+		Args:
+			handle: Open binary stream of word/document.xml.
+
+		Yields:
+			Paragraph text with surrounding whitespace stripped.
+		"""
+		for _event, elem in ET.iterparse(handle, events=("end",)):
+			if elem.tag != f"{_WORD_NS}p":
+				continue
+			text = "".join(node.text or "" for node in elem.iter(f"{_WORD_NS}t")).strip()
+			elem.clear()
+			if text:
+				yield text
@@ -3,10 +3,12 @@ from __future__ import annotations
 
 from html import unescape
 from pathlib import Path
+import os
 import xml.etree.ElementTree as ET
 import zipfile
 
 from .base import FileMetadata, FileMetadataPlugin
+from .read_utils import flatten_whitespace
 from .mdls_utils import mdls_field
 
 #============================================
@@ -22,14 +24,14 @@ class EpubPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"epub"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+	def supports(self, path: Path, ext: str) -> bool:
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
 		title = mdls_field(path, "kMDItemTitle")
 		if title:
 			meta.title = title
@@ -153,5 +155,5 @@ class EpubPlugin(FileMetadataPlugin):
 	def _clean_text(self, text: str | None) -> str | None:
 		if not text:
 			return None
-		flat = " ".join(unescape(text).split())
+		flat = flatten_whitespace(unescape(text))
 		return flat or None
@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 # Standard Library
-from datetime import datetime
 from pathlib import Path
+import os
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
@@ -22,12 +22,13 @@ class GenericPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = set()
 
 	#============================================
-	def supports(self, path: Path) -> bool:
+	def supports(self, path: Path, ext: str) -> bool:
 		"""
 		Always supports the file as a fallback.
 
 		Args:
 			path: File path.
+			ext: Lowercase extension without the dot.
 
 		Returns:
 			True for all files.
@@ -35,25 +36,26 @@ class GenericPlugin(FileMetadataPlugin):
 		return True
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		"""
 		Collect basic stat and mdls fields.
 
 		Args:
 			path: File path.
+			stat_result: Stat of path from the caller, if already taken.
 
 		Returns:
 			Populated FileMetadata.
 		"""
-		file_stat = path.stat()
+		file_stat = stat_result or path.stat()
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = file_stat.st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = file_stat.st_size
+		meta.extension = path.suffix.lstrip(".")
 		created_ts = getattr(file_stat, "st_birthtime", None)
 		if not created_ts:
 			created_ts = file_stat.st_mtime
-		meta.extra["created"] = datetime.fromtimestamp(created_ts).isoformat()
-		meta.extra["modified"] = datetime.fromtimestamp(file_stat.st_mtime).isoformat()
+		meta.created_ts = created_ts
+		meta.modified_ts = file_stat.st_mtime
 		mdls_data = mdls_fields(
 			path,
 			[
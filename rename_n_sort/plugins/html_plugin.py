@@ -3,15 +3,25 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
-
-# PIP3 modules
-try:
-	from bs4 import BeautifulSoup
-except Exception:
-	BeautifulSoup = None
+import os
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from .read_utils import flatten_whitespace
+
+#============================================
+
+
+def _beautiful_soup_class() -> type | None:
+	"""
+	Import BeautifulSoup on first use; it pulls in lxml at import time.
+	"""
+	try:
+		from bs4 import BeautifulSoup
+	except Exception:
+		return None
+	return BeautifulSoup
+
 
 #============================================
 
@@ -26,14 +36,16 @@ class HtmlPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"html", "htm"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+	def supports(self, path: Path, ext: str) -> bool:
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
+		# without BeautifulSoup the page is not read; do not cache that
+		meta.complete = _beautiful_soup_class() is not None
 		text, title = self._read_html_text(path)
 		if title:
 			meta.title = title
@@ -43,23 +55,24 @@ class HtmlPlugin(FileMetadataPlugin):
 
 	#============================================
 	def _read_html_text(self, path: Path) -> tuple[str | None, str | None]:
-		if not BeautifulSoup:
+		soup_class = _beautiful_soup_class()
+		if soup_class is None:
 			return (None, None)
 		try:
 			raw = path.read_text(encoding="utf-8", errors="ignore")
 		except Exception:
 			return (None, None)
 		try:
-			soup = BeautifulSoup(raw, "html.parser")
+			soup = soup_class(raw, "html.parser")
 		except Exception:
 			return (None, None)
 		for tag in soup(["script", "style", "noscript"]):
 			tag.decompose()
 		title = None
 		if soup.title and soup.title.string:
-			title = " ".join(soup.title.string.split())
+			title = flatten_whitespace(soup.title.string)
 		text = soup.get_text(separator=" ")
-		flattened = " ".join(text.split())
+		flattened = flatten_whitespace(text)
 		if not flattened:
 			return (None, title)
 		return (flattened[:800], title)
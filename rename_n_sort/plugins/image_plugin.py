@@ -3,19 +3,56 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
-import xml.etree.ElementTree as ET
-import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
+import functools
+import os
+import threading
 import time
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from ..path_utils import extension_of
+from .read_utils import flatten_whitespace, read_svg_text
 from .mdls_utils import mdls_field
+from ..term_utils import stdout_is_tty
 
-import pillow_heif
-from PIL import Image
-import pytesseract
+if TYPE_CHECKING:
+	from PIL import Image
 
-pillow_heif.register_heif_opener()
+# Moondream2 setup and inference are not thread-safe; metadata is read
+# from worker threads, so captions run one at a time
+_CAPTION_LOCK = threading.Lock()
+
+#============================================
+
+
+@functools.lru_cache(maxsize=1)
+def _moondream2() -> tuple[ModuleType, dict]:
+	"""
+	Load Moondream2 once per process; every ImagePlugin (including the ones
+	the PDF plugin creates) shares it. Failures are not cached.
+	"""
+	from rename_n_sort import moondream2_caption
+	try:
+		components = moondream2_caption.setup_ai_components()
+	except Exception as exc:
+		raise RuntimeError(f"Failed to initialize Moondream2: {exc}") from exc
+	return (moondream2_caption, components)
+
+#============================================
+
+
+@functools.lru_cache(maxsize=1)
+def _pillow_image() -> ModuleType:
+	"""
+	Import Pillow and register the HEIF opener on the first image probe,
+	so runs without images never load either.
+	"""
+	import pillow_heif
+	from PIL import Image
+	pillow_heif.register_heif_opener()
+	return Image
 
 #============================================
 
@@ -39,15 +76,14 @@ class ImagePlugin(FileMetadataPlugin):
 	}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
-		ext = path.suffix.lower().lstrip(".")
+	def supports(self, path: Path, ext: str) -> bool:
 		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
 		title = mdls_field(path, "kMDItemTitle")
 		if title:
 			meta.title = title
@@ -71,7 +107,7 @@ class ImagePlugin(FileMetadataPlugin):
 
 	#============================================
 	def _color(self, text: str, code: str) -> str:
-		if sys.stdout.isatty():
+		if stdout_is_tty():
 			return f"\033[{code}m{text}\033[0m"
 		return text
 
@@ -79,7 +115,7 @@ class ImagePlugin(FileMetadataPlugin):
 	def _shorten(self, text: str, limit: int = 160) -> str:
 		if not text:
 			return ""
-		cleaned = " ".join(str(text).split())
+		cleaned = flatten_whitespace(str(text))
 		if len(cleaned) <= limit:
 			return cleaned
 		return cleaned[: limit - 3] + "..."
@@ -101,16 +137,17 @@ class ImagePlugin(FileMetadataPlugin):
 		if parts:
 			joined = " | ".join(parts)
 			return joined[:800]
-		return f"Image file {path.suffix.lower().lstrip('.')}"
+		return f"Image file {extension_of(path.name)}"
 
 	#============================================
 	def _extract_ocr_text(self, path: Path) -> str | None:
 		"""
 		Extract OCR text for bitmap images using Tesseract.
 		"""
-		with Image.open(path) as image:
+		import pytesseract
+		with _pillow_image().open(path) as image:
 			text = pytesseract.image_to_string(image)
-		text = " ".join(text.split())
+		text = flatten_whitespace(text)
 		return text or None
 
 	#============================================
@@ -118,22 +155,28 @@ class ImagePlugin(FileMetadataPlugin):
 		"""
 		Caption using Moondream2 (required).
 		"""
-		ext = path.suffix.lower().lstrip(".")
+		ext = extension_of(path.name)
 		if ext in {"svg", "svgz"}:
 			return None
-		if not hasattr(self, "_moondream2_module"):
-			from rename_n_sort import moondream2_caption
-			self._moondream2_module = moondream2_caption
-		moondream2 = self._moondream2_module
-		if not hasattr(self, "_ai_components"):
-			try:
-				self._ai_components = moondream2.setup_ai_components()
-			except Exception as exc:
-				raise RuntimeError(f"Failed to initialize Moondream2: {exc}") from exc
+		from rename_n_sort import moondream2_caption
+		# HEIC decoding needs the opener registered before Image.open
+		_pillow_image()
+		# decode and resize outside the lock so metadata workers prepare the
+		# next images while the model captions this one
+		try:
+			image = moondream2_caption.load_image(str(path))
+		except Exception as exc:
+			raise RuntimeError(f"Moondream2 captioning failed for {path.name}: {exc}") from exc
+		with _CAPTION_LOCK:
+			return self._caption_locked(path, image)
+
+	#============================================
+	def _caption_locked(self, path: Path, image: Image.Image) -> str | None:
+		moondream2, components = _moondream2()
 		start = time.monotonic()
 		print(f"\033[35m[CAPTION]\033[0m {path.name}: running Moondream2...")
 		try:
-			caption = moondream2.generate_caption(str(path), self._ai_components)
+			caption = moondream2.caption_image(image, components)
 		except Exception as exc:
 			duration = time.monotonic() - start
 			print(
@@ -152,16 +195,4 @@ class ImagePlugin(FileMetadataPlugin):
 		"""
 		Extract visible text from SVG.
 		"""
-		try:
-			tree = ET.parse(path)
-			root = tree.getroot()
-			text_nodes = []
-			for elem in root.iter():
-				if elem.text and elem.text.strip():
-					text_nodes.append(elem.text.strip())
-			if not text_nodes:
-				return None
-			joined = " ".join(text_nodes)
-			return joined[:256]
-		except Exception:
-			return None
+		return read_svg_text(path)
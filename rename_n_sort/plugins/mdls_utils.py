@@ -2,26 +2,92 @@
 from __future__ import annotations
 
 # Standard Library
+import functools
+import shutil
 import subprocess
+import threading
 from pathlib import Path
 
 #============================================
 
+# every field the plugins read, fetched together by mdls_batch
+PREFETCH_FIELDS = (
+	"kMDItemTitle",
+	"kMDItemAuthors",
+	"kMDItemKeywords",
+	"kMDItemPageCount",
+	"kMDItemKind",
+	"kMDItemContentType",
+	"kMDItemWhereFroms",
+)
+# stay far below ARG_MAX (1 MB on macOS, shared with the environment)
+_ARGV_BUDGET_BYTES = 200_000
+# path text -> {field: value or None} filled by mdls_batch, oldest first
+_prefetched: dict[str, dict[str, str | None]] = {}
+# entries kept for the plugins; older ones fall back to per-file lookups
+_PREFETCH_MAX_ENTRIES = 2048
+_prefetched_lock = threading.Lock()
 
-def mdls_field(path: Path, field: str) -> str | None:
+
+@functools.lru_cache(maxsize=1)
+def _mdls_available() -> bool:
 	"""
-	Read a single mdls field.
+	Check once whether the mdls tool exists (it does not off macOS).
+	"""
+	available = shutil.which("mdls") is not None
+	return available
 
-	Args:
-		path: File path.
-		field: Field name.
+
+def _prefetched_values(path_text: str, fields: tuple[str, ...]) -> tuple[str | None, ...] | None:
+	"""
+	Values stored by mdls_batch, or None unless every field was fetched.
+	"""
+	with _prefetched_lock:
+		entry = _prefetched.get(path_text)
+	if entry is None or any(field not in entry for field in fields):
+		return None
+	return tuple(entry[field] for field in fields)
+
+
+def _run_mdls_raw(path_texts: list[str], fields: tuple[str, ...]) -> list[str | None] | None:
+	"""
+	Run one mdls process for all paths and fields.
 
 	Returns:
-		Value string or None.
+		Values in path-major order, or None when the call fails or the
+		output does not have one value per (path, field).
 	"""
+	cmd = ["mdls", "-raw"]
+	for field in fields:
+		cmd.extend(["-name", field])
+	cmd.extend(path_texts)
+	try:
+		result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+	except FileNotFoundError:
+		return None
+	if result.returncode != 0:
+		return None
+	# with -raw, mdls separates every value with a NUL byte
+	expected = len(path_texts) * len(fields)
+	raw_values = result.stdout.split("\0")
+	if raw_values and raw_values[-1] == "" and len(raw_values) == expected + 1:
+		raw_values = raw_values[:-1]
+	if len(raw_values) != expected:
+		return None
+	values: list[str | None] = []
+	for raw in raw_values:
+		value = raw.strip()
+		values.append(value if value and value != "(null)" else None)
+	return values
+
+
+@functools.lru_cache(maxsize=8192)
+def _mdls_field_cached(path_text: str, field: str) -> str | None:
+	if not _mdls_available():
+		return None
 	try:
 		result = subprocess.run(
-			["mdls", "-name", field, "-raw", str(path)],
+			["mdls", "-name", field, "-raw", path_text],
 			capture_output=True,
 			text=True,
 			check=False,
@@ -36,9 +102,44 @@ def mdls_field(path: Path, field: str) -> str | None:
 	return value
 
 
+def mdls_field(path: Path, field: str) -> str | None:
+	"""
+	Read a single mdls field.
+
+	Results are cached per (path, field), so plugins that ask for the same
+	field of the same file do not spawn mdls again.
+
+	Args:
+		path: File path.
+		field: Field name.
+
+	Returns:
+		Value string or None.
+	"""
+	path_text = str(path)
+	prefetched = _prefetched_values(path_text, (field,))
+	if prefetched is not None:
+		return prefetched[0]
+	value = _mdls_field_cached(path_text, field)
+	return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _mdls_fields_cached(path_text: str, fields: tuple[str, ...]) -> tuple[str | None, ...] | None:
+	"""
+	Read several fields with one mdls call, or None if the batch call fails.
+	"""
+	if not _mdls_available():
+		return tuple(None for _field in fields)
+	values = _run_mdls_raw([path_text], fields)
+	if values is None:
+		return None
+	return tuple(values)
+
+
 def mdls_fields(path: Path, fields: list[str]) -> dict[str, str]:
 	"""
-	Read multiple mdls fields.
+	Read multiple mdls fields with a single mdls process.
 
 	Args:
 		path: File path.
@@ -47,9 +148,60 @@ def mdls_fields(path: Path, fields: list[str]) -> dict[str, str]:
 	Returns:
 		Dictionary of field values.
 	"""
+	path_text = str(path)
+	values = _prefetched_values(path_text, tuple(fields))
+	if values is None:
+		values = _mdls_fields_cached(path_text, tuple(fields))
+	if values is None:
+		# unexpected batch output; fall back to one call per field
+		values = tuple(_mdls_field_cached(path_text, field) for field in fields)
 	data: dict[str, str] = {}
-	for field in fields:
-		val = mdls_field(path, field)
+	for field, val in zip(fields, values):
 		if val:
 			data[field] = val
 	return data
+
+
+def mdls_batch(paths: list[Path], fields: tuple[str, ...] = PREFETCH_FIELDS) -> dict[Path, dict[str, str]]:
+	"""
+	Read fields for many files with one mdls process per argv-sized chunk.
+
+	Results are kept so later mdls_field/mdls_fields calls for these paths
+	do not spawn mdls again. Chunks whose output cannot be split per file
+	are skipped and those files fall back to per-file lookups.
+
+	Args:
+		paths: Files to read.
+		fields: Field names.
+
+	Returns:
+		Dictionary of path -> field values that were found.
+	"""
+	found: dict[Path, dict[str, str]] = {}
+	if not paths or not _mdls_available():
+		return found
+	chunks: list[list[Path]] = [[]]
+	used = 0
+	for path in paths:
+		cost = len(str(path).encode("utf-8")) + 1
+		if chunks[-1] and used + cost > _ARGV_BUDGET_BYTES:
+			chunks.append([])
+			used = 0
+		chunks[-1].append(path)
+		used += cost
+	for chunk in chunks:
+		path_texts = [str(path) for path in chunk]
+		values = _run_mdls_raw(path_texts, fields)
+		if values is None:
+			continue
+		width = len(fields)
+		for index, (path, path_text) in enumerate(zip(chunk, path_texts)):
+			row = dict(zip(fields, values[index * width : (index + 1) * width]))
+			with _prefetched_lock:
+				# re-insert so the entry counts as newest
+				_prefetched.pop(path_text, None)
+				_prefetched[path_text] = row
+				while len(_prefetched) > _PREFETCH_MAX_ENTRIES:
+					del _prefetched[next(iter(_prefetched))]
+			found[path] = {field: value for field, value in row.items() if value}
+	return found
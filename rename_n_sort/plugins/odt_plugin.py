@@ -1,19 +1,41 @@
 #!/usr/bin/env python3
 # Standard Library
+from collections.abc import Iterator
 from pathlib import Path
-
-# PIP3 modules
-try:
-	from odf import text
-	from odf.opendocument import load
-	from odf import teletype
-except Exception:
-	text = None
-	load = None
-	teletype = None
+from typing import IO
+import os
+import xml.etree.ElementTree as ET
+import zipfile
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from .read_utils import head_tail_summary
+
+#============================================
+
+_TEXT_NS = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+# whitespace elements odf.teletype expands when extracting text
+_SPACE_TAG = f"{_TEXT_NS}s"
+_TAB_TAG = f"{_TEXT_NS}tab"
+_LINE_BREAK_TAG = f"{_TEXT_NS}line-break"
+# upper bound for text:c so a corrupt count cannot allocate a huge string
+_MAX_SPACE_RUN = 100
+
+#============================================
+
+
+def _space_count(value: str | None) -> int:
+	"""
+	Number of spaces for a text:s element; 1 when text:c is missing or malformed.
+	"""
+	if value is None:
+		return 1
+	try:
+		count = int(value)
+	except ValueError:
+		return 1
+	return max(1, min(count, _MAX_SPACE_RUN))
+
 
 #============================================
 
@@ -28,47 +50,80 @@ class OdtPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"odt"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
+	def supports(self, path: Path, ext: str) -> bool:
 		"""
 		Check support for odt files.
 
 		Args:
 			path: File path.
+			ext: Lowercase extension without the dot.
 
 		Returns:
 			True when extension is odt.
 		"""
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		"""
-		Extract preview text when odf is installed.
+		Extract preview text from content.xml.
 
 		Args:
 			path: File path.
+			stat_result: Stat of path from the caller, if already taken.
 
 		Returns:
 			FileMetadata with summary when possible.
 		"""
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
-		if not load or not text or not teletype:
-			return meta
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
+		# stream content.xml; odfpy would load the whole document tree
 		try:
-			document = load(str(path))
-			paras = document.getElementsByType(text.P)
-			snippets: list[str] = []
-			for para in paras:
-				para_text = teletype.extractText(para).strip()
-				if para_text:
-					snippets.append(para_text)
-			if snippets:
-				full = " ".join(snippets)
-				head = full[:256]
-				tail = full[-256:] if len(full) > 256 else ""
-				meta.summary = f"{head} ... {tail}".strip()
+			with zipfile.ZipFile(path) as archive:
+				with archive.open("content.xml") as handle:
+					summary = head_tail_summary(self._iter_paragraphs(handle))
 		except Exception:
+			# corrupt, encrypted, or truncated archives raise many types
+			# (zlib.error, RuntimeError, NotImplementedError, EOFError, ...)
 			return meta
+		if summary:
+			meta.summary = summary
 		return meta
+
+	#============================================
+	def _iter_paragraphs(self, handle: IO[bytes]) -> Iterator[str]:
+		"""
+		Stream content.xml and yield each non-empty text:p text.
+
+		Args:
+			handle: Open binary stream of content.xml.
+
+		Yields:
+			Paragraph text with surrounding whitespace stripped.
+		"""
+		for _event, elem in ET.iterparse(handle, events=("end",)):
+			if elem.tag != f"{_TEXT_NS}p":
+				continue
+			text = self._element_text(elem).strip()
+			elem.clear()
+			if text:
+				yield text
+
+	#============================================
+	def _element_text(self, elem: ET.Element) -> str:
+		"""
+		Text of an element with ODF space, tab, and line-break markup expanded.
+		"""
+		parts: list[str] = [elem.text or ""]
+		for child in elem:
+			if child.tag == _SPACE_TAG:
+				parts.append(" " * _space_count(child.get(f"{_TEXT_NS}c")))
+			elif child.tag == _TAB_TAG:
+				parts.append("\t")
+			elif child.tag == _LINE_BREAK_TAG:
+				parts.append("\n")
+			else:
+				parts.append(self._element_text(child))
+			parts.append(child.tail or "")
+		return "".join(parts)
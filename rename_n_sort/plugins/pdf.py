@@ -2,16 +2,38 @@
 from __future__ import annotations
 # Standard Library
 from pathlib import Path
+from types import ModuleType
+import functools
+import os
+import threading
 from tempfile import TemporaryDirectory
-import sys
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from .read_utils import flatten_whitespace
 from .mdls_utils import mdls_fields
 from .image_plugin import ImagePlugin
+from ..term_utils import stdout_is_tty
+
+#============================================
+
+# pages whose text goes into the preview
+_PREVIEW_PAGES = 2
+# PDFium is not thread-safe; every pypdfium2 call holds this lock
+_PDFIUM_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _pdfium() -> ModuleType | None:
+	"""
+	Import pypdfium2 on first use, or None when it is not installed.
+	"""
+	try:
+		import pypdfium2
+	except ImportError:
+		return None
+	return pypdfium2
 
-from pypdf import PdfReader
-from pdf2image import convert_from_path
 
 #============================================
 
@@ -26,32 +48,34 @@ class PDFPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"pdf"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
+	def supports(self, path: Path, ext: str) -> bool:
 		"""
 		Check extension support.
 
 		Args:
 			path: File path.
+			ext: Lowercase extension without the dot.
 
 		Returns:
 			True when file is pdf.
 		"""
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		"""
 		Extract PDF metadata and preview.
 
 		Args:
 			path: File path.
+			stat_result: Stat of path from the caller, if already taken.
 
 		Returns:
 			FileMetadata populated with metadata.
 		"""
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
 		mdls_data = mdls_fields(
 			path,
 			[
@@ -76,34 +100,101 @@ class PDFPlugin(FileMetadataPlugin):
 	#============================================
 	def _read_preview(self, path: Path, meta: FileMetadata) -> None:
 		"""
-		Read first couple pages when pypdf exists.
+		Read text from the first couple of pages.
+
+		PDFium (pypdfium2) is used when installed, since its native text
+		extraction is much faster than pypdf's pure-Python parser.
 
 		Args:
 			path: File path.
 			meta: Metadata object to populate.
 		"""
+		known_pages = self._mdls_page_count(meta)
 		try:
-			with path.open("rb") as handle:
-				reader = PdfReader(handle)
-				pages = reader.pages
-				text_bits: list[str] = []
-				for page in pages[:2]:
-					extracted = page.extract_text()
-					if extracted:
-						text_bits.append(extracted.strip())
-				joined = ""
-				if text_bits:
-					joined = " ".join(text_bits)
-					meta.extra["pdf_text"] = joined[:2000]
-				page_count = len(pages)
-				meta.extra["page_count"] = page_count
-				if page_count > 0:
-					self._summarize_with_images(path, page_count, meta, max_pages=2)
-				if not meta.summary and joined:
-					meta.summary = joined[:1500]
+			pdfium = _pdfium()
+			if pdfium is not None:
+				text_bits, page_count = self._read_pages_pdfium(pdfium, path, known_pages)
+			else:
+				text_bits, page_count = self._read_pages_pypdf(path, known_pages)
+			joined = ""
+			if text_bits:
+				joined = " ".join(text_bits)
+				meta.extra["pdf_text"] = joined[:2000]
+			meta.extra["page_count"] = page_count
+			if page_count > 0:
+				self._summarize_with_images(path, page_count, meta, max_pages=_PREVIEW_PAGES)
+			if not meta.summary and joined:
+				meta.summary = joined[:1500]
 		except Exception:
+			# missing pypdf, pdf2image or OCR; try again on a later run
+			meta.complete = False
 			return
 
+	#============================================
+	def _mdls_page_count(self, meta: FileMetadata) -> int | None:
+		"""
+		Page count from Spotlight, so the PDF page tree need not be counted.
+		"""
+		value = meta.extra.get("kMDItemPageCount")
+		if not value:
+			return None
+		try:
+			return int(str(value))
+		except ValueError:
+			return None
+
+	#============================================
+	def _read_pages_pdfium(
+		self, pdfium: ModuleType, path: Path, known_pages: int | None
+	) -> tuple[list[str], int]:
+		"""
+		Extract preview text with PDFium.
+
+		The whole open, read and close sequence runs under _PDFIUM_LOCK,
+		since metadata workers and --parallel planning call this from
+		several threads.
+
+		Returns:
+			Tuple of (non-empty page texts, page count).
+		"""
+		with _PDFIUM_LOCK:
+			document = pdfium.PdfDocument(str(path))
+			try:
+				page_count = known_pages if known_pages is not None else len(document)
+				text_bits: list[str] = []
+				for index in range(min(_PREVIEW_PAGES, page_count)):
+					page = document[index]
+					textpage = page.get_textpage()
+					extracted = textpage.get_text_range().strip()
+					textpage.close()
+					page.close()
+					if extracted:
+						text_bits.append(extracted)
+			finally:
+				document.close()
+		return (text_bits, page_count)
+
+	#============================================
+	def _read_pages_pypdf(self, path: Path, known_pages: int | None) -> tuple[list[str], int]:
+		"""
+		Extract preview text with pypdf.
+
+		Returns:
+			Tuple of (non-empty page texts, page count).
+		"""
+		# imported on first use; pypdf is slow to import at CLI startup
+		from pypdf import PdfReader
+		with path.open("rb") as handle:
+			reader = PdfReader(handle)
+			pages = reader.pages
+			page_count = known_pages if known_pages is not None else len(pages)
+			text_bits: list[str] = []
+			for index in range(min(_PREVIEW_PAGES, page_count)):
+				extracted = pages[index].extract_text()
+				if extracted:
+					text_bits.append(extracted.strip())
+		return (text_bits, page_count)
+
 	#============================================
 	def _summarize_with_images(
 		self, path: Path, page_count: int, meta: FileMetadata, max_pages: int = 2
@@ -115,6 +206,7 @@ class PDFPlugin(FileMetadataPlugin):
 		if render_pages <= 0:
 			return
 		self._print_meta("pdf_render", f"rendering {render_pages} page(s) for OCR/captioning")
+		from pdf2image import convert_from_path
 		image_plugin = ImagePlugin()
 		captions: list[str] = []
 		ocr_bits: list[str] = []
@@ -157,7 +249,7 @@ class PDFPlugin(FileMetadataPlugin):
 
 	#============================================
 	def _color(self, text: str, code: str) -> str:
-		if sys.stdout.isatty():
+		if stdout_is_tty():
 			return f"\033[{code}m{text}\033[0m"
 		return text
 
@@ -165,7 +257,7 @@ class PDFPlugin(FileMetadataPlugin):
 	def _shorten(self, text: str, limit: int = 160) -> str:
 		if not text:
 			return ""
-		cleaned = " ".join(str(text).split())
+		cleaned = flatten_whitespace(str(text))
 		if len(cleaned) <= limit:
 			return cleaned
 		return cleaned[: limit - 3] + "..."
@@ -3,32 +3,34 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
+import os
 import shutil
 import subprocess
 import tempfile
 
-# PIP3 modules
-try:
-	from pptx import Presentation
-except Exception:
-	Presentation = None
-
-try:
-	from odf import text as odf_text
-	from odf.opendocument import load as odf_load
-	from odf import teletype as odf_teletype
-except Exception:
-	odf_text = None
-	odf_load = None
-	odf_teletype = None
-
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from ..path_utils import extension_of
+from .read_utils import flatten_whitespace
 from .mdls_utils import mdls_field
 
 #============================================
 
 
+def _pptx_presentation_class() -> type | None:
+	"""
+	Import python-pptx on first use; it is slow to import at CLI startup.
+	"""
+	try:
+		from pptx import Presentation
+	except Exception:
+		return None
+	return Presentation
+
+
+#============================================
+
+
 class PresentationPlugin(FileMetadataPlugin):
 	"""
 	Plugin for presentation files.
@@ -39,14 +41,14 @@ class PresentationPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"ppt", "pptx", "odp"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+	def supports(self, path: Path, ext: str) -> bool:
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
 		title = mdls_field(path, "kMDItemTitle")
 		if title:
 			meta.title = title
@@ -63,12 +65,19 @@ class PresentationPlugin(FileMetadataPlugin):
 
 	#============================================
 	def _read_preview(self, path: Path) -> str | None:
-		ext = path.suffix.lower().lstrip(".")
+		ext = extension_of(path.name)
 		if ext == "pptx":
 			return self._read_pptx_preview(path)
 		if ext == "ppt":
 			return self._read_ppt_via_soffice(path)
-		if ext == "odp" and odf_load and odf_text and odf_teletype:
+		if ext == "odp":
+			# imported on first use; odfpy is slow to import at CLI startup
+			try:
+				from odf import text as odf_text
+				from odf.opendocument import load as odf_load
+				from odf import teletype as odf_teletype
+			except Exception:
+				return None
 			try:
 				document = odf_load(str(path))
 			except Exception:
@@ -84,15 +93,16 @@ class PresentationPlugin(FileMetadataPlugin):
 			if not snippets:
 				return None
 			full = " ".join(snippets)
-			flat = " ".join(full.split())
+			flat = flatten_whitespace(full)
 			return flat[:1200] if flat else None
 		return None
 
 	def _read_pptx_preview(self, path: Path) -> str | None:
-		if not Presentation:
+		presentation_class = _pptx_presentation_class()
+		if presentation_class is None:
 			return None
 		try:
-			prs = Presentation(str(path))
+			prs = presentation_class(str(path))
 		except Exception:
 			return None
 		text_runs: list[str] = []
@@ -107,11 +117,11 @@ class PresentationPlugin(FileMetadataPlugin):
 		if not text_runs:
 			return None
 		full = " ".join(text_runs)
-		flat = " ".join(full.split())
+		flat = flatten_whitespace(full)
 		return flat[:1200] if flat else None
 
 	def _read_ppt_via_soffice(self, path: Path) -> str | None:
-		if not Presentation:
+		if _pptx_presentation_class() is None:
 			self._print_why(path, "python-pptx not installed; skipping PPT conversion")
 			return None
 		soffice = shutil.which("soffice")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+# Standard Library
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+import csv
+import io
+import itertools
+import re
+import xml.etree.ElementTree as ET
+
+#============================================
+
+# previews keep at most ~1800 characters, so 16 KiB is plenty
+PREVIEW_READ_BYTES = 16384
+_WHITESPACE_RE = re.compile(r"\s+")
+# characters kept from the start and the end of a document body
+SUMMARY_EDGE_CHARS = 256
+
+
+def flatten_whitespace(text: str) -> str:
+	"""
+	Collapse whitespace runs to single spaces in one regex pass.
+
+	Same result as " ".join(text.split()) without the token list.
+	"""
+	flat = _WHITESPACE_RE.sub(" ", text).strip()
+	return flat
+
+
+def read_head(path: Path, nbytes: int = PREVIEW_READ_BYTES) -> str:
+	"""
+	Read and decode only the start of a file.
+
+	Args:
+		path: File path.
+		nbytes: Maximum bytes to read.
+
+	Returns:
+		Decoded text; invalid UTF-8 (including a character cut at the
+		boundary) is dropped.
+	"""
+	with path.open("rb") as handle:
+		blob = handle.read(nbytes)
+	text = blob.decode("utf-8", errors="ignore")
+	return text
+
+
+def read_delimited_rows(path: Path, delimiter: str, max_rows: int = 3) -> list[list[str]]:
+	"""
+	Split the first rows of a CSV/TSV file from its head.
+
+	A plain split is enough unless the head contains quotes, in which case
+	the csv module handles quoted delimiters and newlines.
+
+	Args:
+		path: File path.
+		delimiter: Field separator.
+		max_rows: Number of rows to return at most.
+
+	Returns:
+		List of rows, each a list of fields.
+	"""
+	head = read_head(path)
+	if '"' in head:
+		reader = csv.reader(io.StringIO(head), delimiter=delimiter)
+		return list(itertools.islice(reader, max_rows))
+	rows = [line.split(delimiter) for line in head.splitlines()[:max_rows]]
+	return rows
+
+
+def read_svg_text(path: Path, limit: int = 256) -> str | None:
+	"""
+	Collect visible text from an SVG with a streaming parse.
+
+	Elements are cleared as soon as their text is read, and parsing stops
+	once limit characters are gathered, so large drawings are never held
+	in memory as a whole tree.
+
+	Args:
+		path: SVG file path.
+		limit: Maximum characters to return.
+
+	Returns:
+		Joined text, or None when there is none or the XML is unreadable.
+	"""
+	text_nodes: list[str] = []
+	total = 0
+	try:
+		for _event, elem in ET.iterparse(path, events=("end",)):
+			if elem.text and elem.text.strip():
+				text_nodes.append(elem.text.strip())
+				total += len(text_nodes[-1]) + 1
+			elem.clear()
+			if total > limit:
+				break
+	except (ET.ParseError, OSError):
+		return None
+	if not text_nodes:
+		return None
+	joined = " ".join(text_nodes)
+	return joined[:limit]
+
+
+def head_tail_summary(pieces: Iterable[str], edge_chars: int = SUMMARY_EDGE_CHARS) -> str | None:
+	"""
+	Build a "head ... tail" preview from streamed paragraph texts.
+
+	The result equals slicing " ".join(pieces), but only edge_chars
+	characters from each end are ever held, so long documents cost no
+	more memory than short ones.
+
+	Args:
+		pieces: Non-empty paragraph texts in document order.
+		edge_chars: Characters kept from each end.
+
+	Returns:
+		Preview string, or None when there was no text.
+	"""
+	head_parts: list[str] = []
+	head_len = 0
+	tail: deque[str] = deque(maxlen=edge_chars)
+	total = 0
+	for text in pieces:
+		piece = text if total == 0 else f" {text}"
+		total += len(piece)
+		if head_len < edge_chars:
+			chunk = piece[: edge_chars - head_len]
+			head_parts.append(chunk)
+			head_len += len(chunk)
+		tail.extend(piece[-edge_chars:])
+	if total == 0:
+		return None
+	head = "".join(head_parts)
+	tail_text = "".join(tail) if total > edge_chars else ""
+	summary = f"{head} ... {tail_text}".strip()
+	return summary
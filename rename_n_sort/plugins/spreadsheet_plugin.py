@@ -3,29 +3,12 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
-import csv
-
-try:
-	from odf import table as odf_table
-	from odf import text as odf_text
-	from odf.opendocument import load as odf_load
-except Exception:
-	odf_table = None
-	odf_text = None
-	odf_load = None
-
-try:
-	import openpyxl
-except Exception:
-	openpyxl = None
-
-try:
-	import xlrd
-except Exception:
-	xlrd = None
+import os
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from ..path_utils import extension_of
+from .read_utils import flatten_whitespace, read_delimited_rows
 from .mdls_utils import mdls_field
 
 #============================================
@@ -41,14 +24,14 @@ class SpreadsheetPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"xls", "xlsx", "ods", "csv", "tsv"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+	def supports(self, path: Path, ext: str) -> bool:
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
 		title = mdls_field(path, "kMDItemTitle")
 		if title:
 			meta.title = title
@@ -60,7 +43,7 @@ class SpreadsheetPlugin(FileMetadataPlugin):
 		"""
 		Construct a summary using headers/rows or sheet names.
 		"""
-		ext = path.suffix.lower().lstrip(".")
+		ext = extension_of(path.name)
 		if ext in {"csv", "tsv"}:
 			preview = self._read_delimited(path, delimiter="\t" if ext == "tsv" else ",")
 			if preview:
@@ -85,18 +68,12 @@ class SpreadsheetPlugin(FileMetadataPlugin):
 		Read first few lines for delimited text.
 		"""
 		try:
-			with path.open("r", encoding="utf-8", errors="ignore") as handle:
-				reader = csv.reader(handle, delimiter=delimiter)
-				rows = []
-				for idx, row in enumerate(reader):
-					rows.append(row)
-					if idx >= 2:
-						break
+			rows = read_delimited_rows(path, delimiter)
 			if not rows:
 				return None
 			joined_rows = [" | ".join(r) for r in rows]
 			head = " || ".join(joined_rows)
-			head = " ".join(head.split())
+			head = flatten_whitespace(head)
 			if not head:
 				return None
 			return head[:800]
@@ -109,7 +86,10 @@ class SpreadsheetPlugin(FileMetadataPlugin):
 		"""
 		Extract sheet names plus first row and first column previews.
 		"""
-		if not openpyxl:
+		# openpyxl is imported on first use; it is slow to import at CLI startup
+		try:
+			import openpyxl
+		except Exception:
 			return None
 		try:
 			wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
@@ -149,7 +129,9 @@ class SpreadsheetPlugin(FileMetadataPlugin):
 
 	#============================================
 	def _xls_preview(self, path: Path) -> str | None:
-		if not xlrd:
+		try:
+			import xlrd
+		except Exception:
 			return None
 		try:
 			book = xlrd.open_workbook(path)
@@ -179,7 +161,12 @@ class SpreadsheetPlugin(FileMetadataPlugin):
 
 	#============================================
 	def _ods_preview(self, path: Path) -> str | None:
-		if not odf_load or not odf_table or not odf_text:
+		# imported on first use; odfpy is slow to import at CLI startup
+		try:
+			from odf import table as odf_table
+			from odf import text as odf_text
+			from odf.opendocument import load as odf_load
+		except Exception:
 			return None
 		try:
 			document = odf_load(str(path))
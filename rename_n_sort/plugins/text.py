@@ -3,9 +3,11 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
+import os
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from .read_utils import flatten_whitespace, read_head
 from .mdls_utils import mdls_field
 
 #============================================
@@ -21,32 +23,34 @@ class TextDocumentPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"txt", "md", "rtf"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
+	def supports(self, path: Path, ext: str) -> bool:
 		"""
 		Check if this plugin supports the extension.
 
 		Args:
 			path: File path.
+			ext: Lowercase extension without the dot.
 
 		Returns:
 			True when supported.
 		"""
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		"""
 		Extract title and preview.
 
 		Args:
 			path: File path.
+			stat_result: Stat of path from the caller, if already taken.
 
 		Returns:
 			FileMetadata with summary.
 		"""
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
 		title = mdls_field(path, "kMDItemTitle")
 		if title:
 			meta.title = title
@@ -67,10 +71,10 @@ class TextDocumentPlugin(FileMetadataPlugin):
 			Text snippet or None.
 		"""
 		try:
-			text_blob = path.read_text(encoding="utf-8", errors="ignore")
+			text_blob = read_head(path)
 		except Exception:
 			return None
-		cleaned = " ".join(text_blob.split())
+		cleaned = flatten_whitespace(text_blob)
 		if not cleaned:
 			return None
 		return cleaned[:1800]
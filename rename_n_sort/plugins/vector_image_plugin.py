@@ -3,20 +3,12 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
-import xml.etree.ElementTree as ET
-
-# PIP3 modules
-try:
-	from odf import text as odf_text
-	from odf.opendocument import load as odf_load
-	from odf import teletype as odf_teletype
-except Exception:
-	odf_text = None
-	odf_load = None
-	odf_teletype = None
+import os
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from ..path_utils import extension_of
+from .read_utils import flatten_whitespace, read_svg_text
 
 #============================================
 
@@ -31,15 +23,15 @@ class VectorImagePlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"svg", "svgz", "odg"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+	def supports(self, path: Path, ext: str) -> bool:
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		ext = path.suffix.lower().lstrip(".")
-		meta.extra["extension"] = ext
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		ext = extension_of(path.name)
+		meta.extension = ext
 		meta.title = path.stem
 		if ext in {"svg", "svgz"}:
 			text_bits = self._read_svg_text(path)
@@ -60,22 +52,15 @@ class VectorImagePlugin(FileMetadataPlugin):
 
 	#============================================
 	def _read_svg_text(self, path: Path) -> str | None:
-		try:
-			tree = ET.parse(path)
-			root = tree.getroot()
-			text_nodes = []
-			for elem in root.iter():
-				if elem.text and elem.text.strip():
-					text_nodes.append(elem.text.strip())
-			if not text_nodes:
-				return None
-			joined = " ".join(text_nodes)
-			return joined[:256]
-		except Exception:
-			return None
+		return read_svg_text(path)
 
 	def _read_odg_text(self, path: Path) -> str | None:
-		if not odf_load or not odf_text or not odf_teletype:
+		# imported on first use; odfpy is slow to import at CLI startup
+		try:
+			from odf import text as odf_text
+			from odf.opendocument import load as odf_load
+			from odf import teletype as odf_teletype
+		except Exception:
 			return None
 		try:
 			document = odf_load(str(path))
@@ -92,5 +77,5 @@ class VectorImagePlugin(FileMetadataPlugin):
 		if not snippets:
 			return None
 		full = " ".join(snippets)
-		flat = " ".join(full.split())
+		flat = flatten_whitespace(full)
 		return flat[:256] if flat else None
@@ -3,9 +3,11 @@ from __future__ import annotations
 
 # Standard Library
 from pathlib import Path
+import os
 
 # local repo modules
 from .base import FileMetadata, FileMetadataPlugin
+from ..path_utils import extension_of
 from .mdls_utils import mdls_field
 
 #============================================
@@ -21,16 +23,16 @@ class VideoPlugin(FileMetadataPlugin):
 	supported_suffixes: set[str] = {"mp4", "mov", "mkv", "webm", "avi"}
 
 	#============================================
-	def supports(self, path: Path) -> bool:
-		return path.suffix.lower().lstrip(".") in self.supported_suffixes
+	def supports(self, path: Path, ext: str) -> bool:
+		return ext in self.supported_suffixes
 
 	#============================================
-	def extract_metadata(self, path: Path) -> FileMetadata:
+	def extract_metadata(self, path: Path, stat_result: os.stat_result | None = None) -> FileMetadata:
 		meta = FileMetadata(path=path, plugin_name=self.name)
-		meta.extra["size_bytes"] = path.stat().st_size
-		meta.extra["extension"] = path.suffix.lstrip(".")
+		meta.size_bytes = (stat_result or path.stat()).st_size
+		meta.extension = path.suffix.lstrip(".")
 		title = mdls_field(path, "kMDItemTitle")
 		if title:
 			meta.title = title
-		meta.summary = f"Video file {path.suffix.lower().lstrip('.')}"
+		meta.summary = f"Video file {extension_of(path.name)}"
 		return meta
@@ -4,28 +4,80 @@ Safe rename and move utilities.
 """
 
 # Standard Library
+import os
 import shutil
 from pathlib import Path
 
 #============================================
 
 
+def _taken_names(directory: Path) -> set[str]:
+	"""
+	Case-folded names in a directory, read with one scandir.
+
+	Case-folding matches the default case-insensitive APFS volumes.
+	"""
+	try:
+		with os.scandir(directory) as entries:
+			names = {entry.name.casefold() for entry in entries}
+	except OSError:
+		return set()
+	return names
+
+
+#============================================
+
+
 def dedupe_path(target: Path) -> Path:
 	"""
 	Append counter to avoid collisions.
 
+	The directory is listed once and counters are checked against that
+	snapshot, instead of one stat per counter.
+
 	Args:
 		target: Desired target path.
 
 	Returns:
 		Unique target path.
 	"""
+	# lexists: a dangling symlink still occupies the name
+	if not os.path.lexists(target):
+		return target
+	taken = _taken_names(target.parent)
 	counter = 1
-	candidate = target
-	while candidate.exists():
-		candidate = candidate.with_stem(f"{target.stem} ({counter})")
+	while True:
+		candidate = target.with_stem(f"{target.stem} ({counter})")
+		if candidate.name.casefold() not in taken:
+			return candidate
 		counter += 1
-	return candidate
+
+
+#============================================
+
+
+def _reserve_path(target: Path) -> Path:
+	"""
+	Claim a unique path by creating an empty placeholder with O_EXCL.
+
+	A file created by another process between the directory scan and the
+	move can then never be overwritten.
+
+	Args:
+		target: Desired target path.
+
+	Returns:
+		Path of the placeholder, to be replaced by the moved file.
+	"""
+	while True:
+		candidate = dedupe_path(target)
+		try:
+			handle = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+		except FileExistsError:
+			# taken since the scan; list the directory again
+			continue
+		os.close(handle)
+		return candidate
 
 
 #============================================
@@ -45,12 +97,18 @@ def apply_move(source: Path, target: Path, dry_run: bool) -> Path:
 	"""
 	if source.resolve() == target.resolve():
 		return target
-	dest = dedupe_path(target)
 	if dry_run:
-		return dest
-	dest.parent.mkdir(parents=True, exist_ok=True)
+		return dedupe_path(target)
+	target.parent.mkdir(parents=True, exist_ok=True)
+	dest = _reserve_path(target)
 	try:
-		source.rename(dest)
-	except Exception:
-		shutil.move(str(source), str(dest))
+		try:
+			os.replace(source, dest)
+		except OSError:
+			# other volume: copy over the placeholder, then remove the source
+			shutil.move(str(source), str(dest))
+	except BaseException:
+		# do not leave the empty placeholder (or a partial copy) behind
+		dest.unlink(missing_ok=True)
+		raise
 	return dest
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+LLM response caches: exact (persistent, keyed on model and prompt) and
+semantic (in-memory, keyed on prompt embeddings).
+"""
+
+from __future__ import annotations
+
+# Standard Library
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+import hashlib
+import json
+import math
+import operator
+import sqlite3
+import threading
+import time
+
+#============================================
+
+
+DEFAULT_CACHE_PATH = Path("~/.cache/macos_llm_file_cleanup/responses.sqlite")
+DEFAULT_CACHE_TTL_SECONDS = 30 * 24 * 3600
+# replies kept in memory so repeats within a run skip the SQLite lookup
+DEFAULT_MEMORY_ENTRIES = 4096
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+
+#============================================
+
+
+def cache_key(
+	transport_name: str,
+	model: str,
+	prompt: str,
+	max_tokens: int,
+	options: dict[str, object] | None = None,
+) -> str:
+	"""
+	Content-addressed key for one prompt on one backend.
+
+	Args:
+		transport_name: Transport display name.
+		model: Model name, or empty when the transport has none.
+		prompt: Full prompt text.
+		max_tokens: Token limit for the reply.
+		options: Other settings that change the reply (temperature,
+			system message), JSON-serializable.
+
+	Returns:
+		Hex SHA-256 digest.
+	"""
+	payload = {
+		"transport": transport_name,
+		"model": model,
+		"prompt": prompt,
+		"max_tokens": max_tokens,
+		"options": options or {},
+	}
+	encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+	digest = hashlib.sha256(encoded).hexdigest()
+	return digest
+
+
+#============================================
+
+
+class ResponseCache:
+	"""
+	SQLite-backed response store shared by all threads of one run.
+
+	Recently used entries are also held in a bounded in-memory LRU, so
+	files with identical metadata in one run reuse the reply directly.
+	"""
+
+	def __init__(
+		self,
+		path: Path = DEFAULT_CACHE_PATH,
+		ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+		memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+	) -> None:
+		self.path = path.expanduser()
+		self.ttl_seconds = ttl_seconds
+		self.memory_entries = memory_entries
+		# key -> (body, stored_at), least recently used first
+		self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+		self.path.parent.mkdir(parents=True, exist_ok=True)
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+		self._conn.execute(
+			"CREATE TABLE IF NOT EXISTS responses "
+			"(key TEXT PRIMARY KEY, body TEXT NOT NULL, ts REAL NOT NULL)"
+		)
+		self._conn.commit()
+
+	#============================================
+	def get(self, key: str) -> str | None:
+		"""
+		Return the cached body for key, or None when missing or expired.
+		"""
+		with self._lock:
+			row = self._memory.get(key)
+			if row is not None:
+				self._memory.move_to_end(key)
+			else:
+				row = self._conn.execute(
+					"SELECT body, ts FROM responses WHERE key = ?", (key,)
+				).fetchone()
+				if row is not None:
+					self._remember(key, row[0], row[1])
+		if row is None:
+			return None
+		body, stored_at = row
+		if time.time() - stored_at >= self.ttl_seconds:
+			return None
+		return body
+
+	#============================================
+	def put(self, key: str, body: str) -> None:
+		"""
+		Store a response body under key.
+		"""
+		stored_at = time.time()
+		with self._lock:
+			self._remember(key, body, stored_at)
+			self._conn.execute(
+				"INSERT OR REPLACE INTO responses (key, body, ts) VALUES (?, ?, ?)",
+				(key, body, stored_at),
+			)
+			self._conn.commit()
+
+	#============================================
+	def _remember(self, key: str, body: str, stored_at: float) -> None:
+		"""
+		Add an entry to the in-memory LRU; the caller holds the lock.
+		"""
+		if self.memory_entries <= 0:
+			return
+		self._memory[key] = (body, stored_at)
+		self._memory.move_to_end(key)
+		while len(self._memory) > self.memory_entries:
+			self._memory.popitem(last=False)
+
+	#============================================
+	def close(self) -> None:
+		with self._lock:
+			self._conn.close()
+
+
+#============================================
+
+
+def _unit_vector(vector: list[float]) -> list[float]:
+	norm = math.sqrt(sum(value * value for value in vector))
+	if norm == 0.0:
+		return vector
+	unit = [value / norm for value in vector]
+	return unit
+
+
+#============================================
+
+
+class SemanticCache:
+	"""
+	Reuse replies for requests whose embeddings are nearly identical.
+
+	Entries live only for the current run and are grouped by scope
+	(transport and model), so replies never cross backends.
+	"""
+
+	def __init__(
+		self,
+		embed: Callable[[str], list[float]],
+		threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+	) -> None:
+		self._embed = embed
+		self.threshold = threshold
+		self._lock = threading.Lock()
+		self._entries: dict[str, list[tuple[list[float], str]]] = {}
+
+	#============================================
+	def lookup(self, scope: str, text: str) -> tuple[str | None, list[float] | None]:
+		"""
+		Find a stored reply for a request similar to this one.
+
+		Args:
+			scope: Transport and model label.
+			text: Per-request text to embed, without shared prompt boilerplate.
+
+		Returns:
+			Tuple of (cached reply or None, text vector for store() or None
+			when the embedding call failed).
+		"""
+		try:
+			query = _unit_vector(self._embed(text))
+		except (OSError, RuntimeError, ValueError):
+			return (None, None)
+		with self._lock:
+			entries = list(self._entries.get(scope, ()))
+		best_reply: str | None = None
+		best_score = self.threshold
+		for vector, reply in entries:
+			score = sum(map(operator.mul, vector, query))
+			if score > best_score:
+				best_score = score
+				best_reply = reply
+		return (best_reply, query)
+
+	#============================================
+	def store(self, scope: str, vector: list[float], reply: str) -> None:
+		with self._lock:
+			self._entries.setdefault(scope, []).append((vector, reply))
@@ -4,43 +4,113 @@ Directory scanner for cleanup.
 """
 
 # Standard Library
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 # local repo modules
 from .config import AppConfig
+from .path_utils import extension_of
 
 #============================================
 
 
-def iter_files(config: AppConfig) -> list[Path]:
+def _size_in_bounds(entry: os.DirEntry, config: AppConfig) -> bool:
 	"""
-	Iterate over files according to config.
+	Check a file entry against the configured size bounds.
+
+	DirEntry.stat() caches its result, and skipping empty or huge files
+	here keeps them from ever reaching the LLM.
 
 	Args:
+		entry: Directory entry for a regular file.
 		config: Application configuration.
 
 	Returns:
-		List of file paths.
+		True when the file size is within bounds.
+	"""
+	if config.min_size <= 0 and config.max_size is None:
+		return True
+	try:
+		# follow links like entry.is_file() does, so a symlinked file is
+		# measured by its target's size
+		size = entry.stat().st_size
+	except OSError:
+		return False
+	if size < config.min_size:
+		return False
+	if config.max_size is not None and size > config.max_size:
+		return False
+	return True
+
+
+#============================================
+
+
+def _walk_root(root: Path, config: AppConfig) -> Iterator[Path]:
+	"""
+	Walk one root with os.scandir, yielding files within max_depth.
+
+	DirEntry.is_dir()/is_file() reuse the d_type from the directory read,
+	so most entries never need a separate stat() call.
+
+	Args:
+		root: Normalized root directory.
+		config: Application configuration.
+
+	Yields:
+		File paths under the root.
+	"""
+	# config lookups hoisted out of the per-entry loop
+	include_extensions = config.include_extensions
+	exclude_hidden = config.exclude_hidden
+	max_depth = config.max_depth
+	# stack of (directory path string, depth of files inside it)
+	stack: list[tuple[str, int]] = [(str(root), 0)]
+	while stack:
+		dir_path, depth = stack.pop()
+		try:
+			with os.scandir(dir_path) as entries:
+				for entry in entries:
+					# name checks first; they cost no syscall
+					if exclude_hidden and entry.name.startswith("."):
+						continue
+					try:
+						if entry.is_dir(follow_symlinks=False):
+							# prune at the source instead of filtering deep files later
+							if depth < max_depth:
+								stack.append((entry.path, depth + 1))
+							continue
+						if not entry.is_file():
+							continue
+					except OSError:
+						continue
+					if include_extensions and extension_of(entry.name) not in include_extensions:
+						continue
+					if not _size_in_bounds(entry, config):
+						continue
+					yield Path(entry.path)
+		except OSError:
+			continue
+
+
+#============================================
+
+
+def iter_files(config: AppConfig) -> Iterator[Path]:
+	"""
+	Iterate over files according to config.
+
+	Files are yielded lazily so callers can count, sample, or process them
+	without holding the whole tree in memory.
+
+	Args:
+		config: Application configuration.
+
+	Yields:
+		File paths.
 	"""
-	paths: list[Path] = []
 	for root in config.normalized_roots():
-		if not root.exists():
+		if not root.is_dir():
 			continue
-		for path in root.rglob("*"):
-			if not path.is_file():
-				continue
-			try:
-				rel = path.relative_to(root)
-			except Exception:
-				rel = path
-			depth = max(len(rel.parts) - 1, 0)
-			if depth > config.max_depth:
-				continue
-			if config.exclude_hidden and path.name.startswith("."):
-				continue
-			if config.include_extensions:
-				ext = path.suffix.lower().lstrip(".")
-				if ext not in config.include_extensions:
-					continue
-			paths.append(path)
-	return paths
+		yield from _walk_root(root, config)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Terminal helpers shared by the CLI, LLM logging, and plugins.
+"""
+
+# Standard Library
+import functools
+import sys
+
+#============================================
+
+
+@functools.lru_cache(maxsize=4)
+def _stream_is_tty(stream: object) -> bool:
+	is_tty: bool = stream.isatty()
+	return is_tty
+
+
+def stdout_is_tty() -> bool:
+	"""
+	Check whether stdout is a terminal, once per stdout object.
+
+	isatty() is an fstat/ioctl per call and status lines are printed for
+	every file. Keying on the stream object keeps the answer right when
+	stdout is swapped (tests, redirection inside the process).
+
+	Returns:
+		True when color escapes should be printed.
+	"""
+	return _stream_is_tty(sys.stdout)
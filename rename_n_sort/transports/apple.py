@@ -6,19 +6,96 @@ Apple Foundation Models transport.
 from __future__ import annotations
 
 # Standard Library
+from typing import TYPE_CHECKING
 import platform
+import threading
 
 # local repo modules
-from ..llm_utils import MIN_MACOS_MAJOR, _parse_macos_version
+from ..llm_utils import MIN_MACOS_MAJOR, _is_guardrail_error, _parse_macos_version
+
+if TYPE_CHECKING:
+	from applefoundationmodels import Session
+
+
+def _exit_session(session: Session) -> None:
+	"""
+	Close a session; errors are ignored so they never mask the one being raised.
+	"""
+	try:
+		session.__exit__(None, None, None)
+	except Exception:
+		pass
 
 
 class AppleTransport:
+	"""
+	Transport for the on-device Apple Foundation Models.
+
+	Each calling thread keeps one Session open across prompts instead of
+	creating one per prompt. The session history is cleared after every
+	prompt, because engine prompts are self-contained and a growing
+	transcript would leak earlier files into later ones and fill the
+	context window. A session that fails with anything but a guardrail
+	refusal is closed, and the next prompt starts a fresh one.
+	"""
+
 	name = "AppleLLM"
 
 	def __init__(self) -> None:
-		pass
+		# set after the first successful check; generate() runs once per prompt
+		self._ready = False
+		# one open Session per calling thread
+		self._local = threading.local()
+		# every open Session by id, so close() reaches worker threads too
+		self._sessions: dict[int, Session] = {}
+		self._sessions_lock = threading.Lock()
+		# sampling settings; also part of the response cache key
+		self.generation_options: dict[str, object] = {"temperature": 0.2}
+
+	def close(self) -> None:
+		"""
+		Close every open session, including those of --parallel workers.
+		"""
+		with self._sessions_lock:
+			sessions = list(self._sessions.values())
+			self._sessions.clear()
+		self._local.session = None
+		for session in sessions:
+			_exit_session(session)
+
+	def __enter__(self) -> AppleTransport:
+		return self
+
+	def __exit__(self, *exc_info: object) -> None:
+		self.close()
+
+	def _session(self) -> Session:
+		session = getattr(self._local, "session", None)
+		with self._sessions_lock:
+			# a session closed by close() on another thread is not reused
+			if session is not None and self._sessions.get(id(session)) is session:
+				return session
+		from applefoundationmodels import Session
+
+		session = Session().__enter__()
+		self._local.session = session
+		with self._sessions_lock:
+			self._sessions[id(session)] = session
+		return session
+
+	def _discard(self, session: Session) -> None:
+		"""
+		Close one session and forget it, so this thread opens a new one.
+		"""
+		with self._sessions_lock:
+			self._sessions.pop(id(session), None)
+		if getattr(self._local, "session", None) is session:
+			self._local.session = None
+		_exit_session(session)
 
 	def _require_apple_intelligence(self) -> None:
+		if self._ready:
+			return
 		try:
 			from applefoundationmodels import Session, apple_intelligence_available
 		except Exception as exc:
@@ -39,11 +116,33 @@ class AppleTransport:
 			except Exception:
 				reason = "Apple Intelligence not available or not enabled."
 			raise RuntimeError(str(reason))
+		self._ready = True
 
 	def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
 		self._require_apple_intelligence()
-		from applefoundationmodels import Session
-
-		with Session() as session:
-			response = session.generate(prompt, max_tokens=max_tokens, temperature=0.2)
+		session = self._session()
+		try:
+			response = session.generate(prompt, max_tokens=max_tokens, **self.generation_options)
+		except Exception as exc:
+			if _is_guardrail_error(exc):
+				# guardrail refusals keep the session; only its transcript is reset
+				self._reset(session)
+			else:
+				self._discard(session)
+			raise
+		self._reset(session)
 		return response.text.strip()
+
+	def _reset(self, session: Session) -> None:
+		"""
+		Clear the transcript, or drop the session when it cannot be cleared.
+		"""
+		clear_history = getattr(session, "clear_history", None)
+		if clear_history is None:
+			# this binding cannot reset a transcript; use each session once
+			self._discard(session)
+			return
+		try:
+			clear_history()
+		except Exception:
+			self._discard(session)
@@ -7,12 +7,57 @@ from __future__ import annotations
 
 # Standard Library
 import json
-import random
-import time
-import urllib.request
+import threading
+import http.client
+import urllib.parse
+
+# PIP3 modules
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+# keep the model resident between per-file calls instead of reloading it
+OLLAMA_KEEP_ALIVE = "30m"
+# small local embedding model used for near-duplicate prompt lookups
+OLLAMA_EMBED_MODEL = "nomic-embed-text"
+# errors that mean the kept-alive socket was closed by the server
+_STALE_CONNECTION_ERRORS = (
+	http.client.RemoteDisconnected,
+	http.client.BadStatusLine,
+	ConnectionResetError,
+	BrokenPipeError,
+)
+
+
+def _dumps(payload: dict) -> bytes:
+	"""
+	Encode a request body, using orjson when it is installed.
+	"""
+	if orjson is not None:
+		return orjson.dumps(payload)
+	return json.dumps(payload).encode("utf-8")
+
+
+def _loads(body: bytes) -> dict:
+	if orjson is not None:
+		return orjson.loads(body)
+	return json.loads(body.decode("utf-8"))
 
 
 class OllamaTransport:
+	"""
+	Chat transport for a local Ollama server.
+
+	Each prompt is sent on its own (system message plus the prompt) unless
+	conversational is set, since every engine prompt is self-contained and a
+	growing history only inflates request bodies and prefill work.
+
+	Safe to call from several threads: each thread keeps its own connection,
+	and the shared message history is updated under a lock. The server only
+	runs requests side by side when OLLAMA_NUM_PARALLEL is above 1.
+	"""
+
 	name = "Ollama"
 
 	def __init__(
@@ -20,35 +65,125 @@ class OllamaTransport:
 		model: str,
 		base_url: str = "http://localhost:11434",
 		system_message: str = "",
+		conversational: bool = False,
 	) -> None:
 		self.model = model
+		self.conversational = conversational
+		self.system_message = system_message
+		# extra Ollama sampling options (temperature, top_p, ...); also part
+		# of the response cache key
+		self.generation_options: dict[str, object] = {}
 		self.base_url = base_url.rstrip("/")
+		parts = urllib.parse.urlsplit(self.base_url)
+		self._host = parts.hostname or "localhost"
+		self._port = parts.port or 11434
+		self._path_prefix = parts.path.rstrip("/")
+		# one kept-alive connection per calling thread, all tracked for close()
+		self._local = threading.local()
+		self._connections: list[http.client.HTTPConnection] = []
+		self._connections_lock = threading.Lock()
+		self._messages_lock = threading.Lock()
 		self.messages: list[dict[str, str]] = []
 		if system_message:
 			self.messages.append({"role": "system", "content": system_message})
 
+	def close(self) -> None:
+		"""
+		Close every open connection, including those of --parallel workers.
+		"""
+		with self._connections_lock:
+			connections = list(self._connections)
+			self._connections.clear()
+		self._local.conn = None
+		for conn in connections:
+			conn.close()
+
+	def _drop_connection(self) -> None:
+		"""
+		Close this thread's connection so the next request opens a new one.
+		"""
+		conn = getattr(self._local, "conn", None)
+		if conn is None:
+			return
+		self._local.conn = None
+		with self._connections_lock:
+			if conn in self._connections:
+				self._connections.remove(conn)
+		conn.close()
+
+	def __enter__(self) -> OllamaTransport:
+		return self
+
+	def __exit__(self, *exc_info: object) -> None:
+		self.close()
+
+	def _connection(self) -> http.client.HTTPConnection:
+		conn = getattr(self._local, "conn", None)
+		with self._connections_lock:
+			# a connection closed by close() on another thread is not reused
+			if conn is not None and conn in self._connections:
+				return conn
+			conn = http.client.HTTPConnection(self._host, self._port, timeout=30)
+			self._connections.append(conn)
+		self._local.conn = conn
+		return conn
+
+	def _post_json(self, path: str, body: bytes) -> bytes:
+		"""
+		POST a JSON body over the kept-alive connection, reconnecting once if stale.
+		"""
+		headers = {"Content-Type": "application/json"}
+		for attempt in range(2):
+			conn = self._connection()
+			try:
+				conn.request("POST", f"{self._path_prefix}{path}", body=body, headers=headers)
+				response = conn.getresponse()
+				response_body = response.read()
+			except _STALE_CONNECTION_ERRORS:
+				self._drop_connection()
+				if attempt:
+					raise
+				continue
+			except BaseException:
+				# a timeout or other failure mid-request leaves the connection
+				# unusable (CannotSendRequest on every later call); drop it
+				self._drop_connection()
+				raise
+			if response.status >= 400:
+				raise RuntimeError(f"Ollama error: status {response.status} for {path}")
+			return response_body
+		raise RuntimeError("Ollama request failed.")
+
+	def embed(self, text: str, model: str = OLLAMA_EMBED_MODEL) -> list[float]:
+		"""
+		Return the embedding vector for text from /api/embed.
+		"""
+		payload = {"model": model, "input": text, "keep_alive": OLLAMA_KEEP_ALIVE}
+		parsed = _loads(self._post_json("/api/embed", _dumps(payload)))
+		embeddings = parsed.get("embeddings") or []
+		if not embeddings:
+			raise RuntimeError("Ollama embed returned no vectors")
+		vector = [float(value) for value in embeddings[0]]
+		return vector
+
 	def generate(self, prompt: str, *, purpose: str, max_tokens: int) -> str:
-		self.messages.append({"role": "user", "content": prompt})
+		user_message = {"role": "user", "content": prompt}
+		with self._messages_lock:
+			messages = self.messages + [user_message]
 		payload: dict[str, object] = {
 			"model": self.model,
-			"messages": self.messages,
+			"messages": messages,
 			"stream": False,
-			"options": {"num_predict": max_tokens},
+			"keep_alive": OLLAMA_KEEP_ALIVE,
+			"options": {"num_predict": max_tokens, **self.generation_options},
 		}
-		time.sleep(random.random())
-		request = urllib.request.Request(
-			f"{self.base_url}/api/chat",
-			data=json.dumps(payload).encode("utf-8"),
-			headers={"Content-Type": "application/json"},
-			method="POST",
-		)
-		with urllib.request.urlopen(request, timeout=30) as response:
-			if response.status >= 400:
-				raise RuntimeError(f"Ollama chat error: status {response.status}")
-			response_body = response.read()
-		parsed = json.loads(response_body.decode("utf-8"))
+		parsed = _loads(self._post_json("/api/chat", _dumps(payload)))
 		assistant_message = parsed.get("message", {}).get("content", "")
 		if not assistant_message:
 			raise RuntimeError("Ollama chat returned empty content")
-		self.messages.append({"role": "assistant", "content": assistant_message})
+		if not self.conversational:
+			return assistant_message
+		with self._messages_lock:
+			self.messages.append(user_message)
+			self.messages.append({"role": "assistant", "content": assistant_message})
 		return assistant_message
@@ -1,7 +1,12 @@
 import os
+import threading
+import time
+from pathlib import Path
 
 import pytest
 
+from rename_n_sort.llm_parsers import KeepResult, RenameResult, SortResult
+
 
 REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 SKIP_ENV = "SKIP_REPO_HYGIENE"
@@ -45,3 +50,45 @@ def ascii_fix_enabled(request) -> bool:
 	Check whether ASCII compliance auto-fix is enabled.
 	"""
 	return not request.config.getoption("--no-ascii-fix")
+
+
+#============================================
+class SlowEngine:
+	"""
+	Engine stand-in whose rename call blocks briefly and tracks overlap.
+	"""
+
+	def __init__(self) -> None:
+		self.lock = threading.Lock()
+		self.active = 0
+		self.max_active = 0
+
+	def rename(self, current_name: str, metadata: dict) -> RenameResult:
+		with self.lock:
+			self.active += 1
+			self.max_active = max(self.max_active, self.active)
+		time.sleep(0.05)
+		with self.lock:
+			self.active -= 1
+		stem = Path(current_name).stem
+		return RenameResult(new_name=f"renamed-{stem}", reason="", raw_text="")
+
+	def stem_action(self, original_stem: str, suggested_name: str, extension: str | None = None) -> KeepResult:
+		return KeepResult(stem_action="drop", reason="not useful", raw_text="")
+
+	def rename_and_stem_action(
+		self, current_name: str, metadata: dict, extension: str | None = None
+	) -> tuple[RenameResult, KeepResult]:
+		rename_result = self.rename(current_name, metadata)
+		keep_result = self.stem_action(Path(current_name).stem, rename_result.new_name, extension)
+		return (rename_result, keep_result)
+
+	def rename_stem_action_and_category(
+		self, current_name: str, metadata: dict, extension: str | None = None
+	) -> tuple[RenameResult, KeepResult, SortResult | None]:
+		rename_result, keep_result = self.rename_and_stem_action(current_name, metadata, extension)
+		return (rename_result, keep_result, None)
+
+	def sort(self, files: list) -> SortResult:
+		assignments = {item.path: "Document" for item in files}
+		return SortResult(assignments=assignments, raw_text="")
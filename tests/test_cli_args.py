@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for CLI argument parsing and config building.
+"""
+
+import sys
+from pathlib import Path
+
+from rename_n_sort.cli import build_config, parse_args
+
+
+def test_paths_are_expanded_by_argparse(monkeypatch):
+	monkeypatch.setattr(sys, "argv", ["prog", "-p", "~/Downloads", "-t", "~/Organized"])
+	args = parse_args()
+	config = build_config(args)
+	assert config.roots == [Path("~/Downloads").expanduser()]
+	assert config.target_root == Path("~/Organized").expanduser()
+	assert config.dry_run is True
+
+
+def test_size_flags(monkeypatch):
+	monkeypatch.setattr(sys, "argv", ["prog", "-p", ".", "--min-size", "0", "--max-size", "2048"])
+	config = build_config(parse_args())
+	assert config.min_size == 0
+	assert config.max_size == 2048
+
+
+def test_mode_and_order_flags(monkeypatch):
+	monkeypatch.setattr(sys, "argv", ["prog", "-p", ".", "-a", "-S"])
+	config = build_config(parse_args())
+	assert config.dry_run is False
+	assert config.randomize is False
+	assert config.include_extensions is None
+
+
+def test_help_does_not_load_engine_or_plugins():
+	import subprocess
+
+	code = (
+		"import sys; from rename_n_sort import cli\n"
+		"try:\n"
+		"    cli.parse_args(['--help'])\n"
+		"except SystemExit:\n"
+		"    pass\n"
+		"print(any(name in sys.modules for name in "
+		"('rename_n_sort.organizer', 'rename_n_sort.llm_engine', 'rename_n_sort.plugins')))"
+	)
+	result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+	assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_stdout_tty_check_is_cached_per_stream(monkeypatch):
+	from rename_n_sort import term_utils
+
+	class _Stream:
+		def __init__(self, is_tty):
+			self.is_tty = is_tty
+			self.calls = 0
+
+		def isatty(self):
+			self.calls += 1
+			return self.is_tty
+
+	term_utils._stream_is_tty.cache_clear()
+	tty = _Stream(True)
+	monkeypatch.setattr(term_utils.sys, "stdout", tty)
+	assert term_utils.stdout_is_tty() is True
+	assert term_utils.stdout_is_tty() is True
+	assert tty.calls == 1
+	monkeypatch.setattr(term_utils.sys, "stdout", _Stream(False))
+	assert term_utils.stdout_is_tty() is False
+	term_utils._stream_is_tty.cache_clear()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for CLI file selection (streaming count, sampling, sorting).
+"""
+
+from pathlib import Path
+
+from rename_n_sort.cli import select_files
+from rename_n_sort.config import AppConfig
+
+
+def _make_files(root: Path, count: int) -> list[Path]:
+	paths: list[Path] = []
+	for idx in range(count):
+		path = root / f"file_{idx:02d}.txt"
+		path.write_text("x", encoding="utf-8")
+		paths.append(path)
+	(root / "notes.md").write_text("x", encoding="utf-8")
+	return paths
+
+
+def test_select_sorted_limit_matches_full_sort(tmp_path: Path) -> None:
+	_make_files(tmp_path, 12)
+	cfg = AppConfig(roots=[tmp_path], max_files=5, randomize=False)
+	selected, ext_counter = select_files(cfg)
+	expected = sorted(tmp_path.iterdir())[:5]
+	assert [path.name for path in selected] == [path.name for path in expected]
+	assert ext_counter["txt"] == 12
+	assert ext_counter["md"] == 1
+
+
+def test_select_random_limit_is_subset(tmp_path: Path) -> None:
+	_make_files(tmp_path, 12)
+	cfg = AppConfig(roots=[tmp_path], max_files=4, randomize=True)
+	selected, ext_counter = select_files(cfg)
+	names = {path.name for path in tmp_path.iterdir()}
+	assert len(selected) == 4
+	assert len(set(selected)) == 4
+	assert {path.name for path in selected} <= names
+	assert sum(ext_counter.values()) == 13
+
+
+def test_select_without_limit_returns_all(tmp_path: Path) -> None:
+	_make_files(tmp_path, 3)
+	cfg = AppConfig(roots=[tmp_path], max_files=None, randomize=False)
+	selected, _ext_counter = select_files(cfg)
+	assert len(selected) == 4
+	assert selected == sorted(selected)
+
+
+def test_extension_of_matches_path_suffix() -> None:
+	from rename_n_sort.path_utils import extension_of
+
+	for name in ("a.TXT", "archive.tar.gz", "noext", ".bashrc", "..pdf", "trailing."):
+		expected = Path(name).suffix.lower().lstrip(".")
+		assert extension_of(name) == expected
+
+
+def test_reservoir_sample_is_uniform_and_consumes_all() -> None:
+	import random
+	from rename_n_sort.cli import _reservoir_sample
+
+	random.seed(7)
+	items = [Path(f"f{idx}") for idx in range(20)]
+	hits = {path: 0 for path in items}
+	for _ in range(4000):
+		seen: list[Path] = []
+
+		def _tracked():
+			for path in items:
+				seen.append(path)
+				yield path
+
+		sample = _reservoir_sample(_tracked(), 5)
+		assert len(set(sample)) == 5
+		assert len(seen) == 20
+		for path in sample:
+			hits[path] += 1
+	# each item should land in the sample about 1000 times (5/20 of 4000)
+	assert all(800 < count < 1200 for count in hits.values())
+	assert _reservoir_sample(iter(items[:3]), 5) == items[:3]
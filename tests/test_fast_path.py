@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for planning files without LLM calls when metadata is empty.
+"""
+
+# Standard Library
+from pathlib import Path
+
+# local repo modules
+import conftest
+import rename_n_sort.config
+import rename_n_sort.llm_utils
+import rename_n_sort.organizer
+
+
+class RefusingEngine:
+	"""
+	Engine stand-in that fails the test if any prompt is sent.
+	"""
+
+	def __getattr__(self, name: str):
+		raise AssertionError(f"LLM call not expected: {name}")
+
+
+def test_fast_path_skips_llm_for_bare_audio(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.chdir(tmp_path)
+	source = tmp_path / "Track 07.mp3"
+	source.write_bytes(b"ID3")
+	cfg = rename_n_sort.config.AppConfig(roots=[tmp_path], target_root=tmp_path / "out", dry_run=True)
+	org = rename_n_sort.organizer.Organizer(cfg, llm=RefusingEngine())
+
+	plans = org.process_one_by_one([source])
+
+	assert len(plans) == 1
+	assert plans[0].llm_skipped
+	assert plans[0].category == "Audio"
+	assert plans[0].stem_action == "keep"
+	assert plans[0].target.parent.name == "Audio"
+
+
+def test_fast_path_batch_plan_mixes_with_llm_files(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.chdir(tmp_path)
+	song = tmp_path / "song.mp3"
+	song.write_bytes(b"ID3")
+	note = tmp_path / "note.txt"
+	note.write_text("meeting notes for tuesday", encoding="utf-8")
+	cfg = rename_n_sort.config.AppConfig(roots=[tmp_path], target_root=tmp_path / "out", dry_run=True)
+	org = rename_n_sort.organizer.Organizer(cfg, llm=conftest.SlowEngine())
+
+	plans = org.plan([song, note])
+
+	assert [plan.llm_skipped for plan in plans] == [True, False]
+	assert plans[0].category == "Audio"
+	assert plans[1].category == "Document"
+
+
+def test_fast_path_can_be_disabled(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.chdir(tmp_path)
+	renamed: list[str] = []
+
+	class RecordingEngine(conftest.SlowEngine):
+		def rename(self, current_name: str, metadata: dict):
+			renamed.append(current_name)
+			return super().rename(current_name, metadata)
+
+	source = tmp_path / "song.mp3"
+	source.write_bytes(b"ID3")
+	cfg = rename_n_sort.config.AppConfig(roots=[tmp_path], target_root=tmp_path / "out", dry_run=True, fast_path=False)
+	org = rename_n_sort.organizer.Organizer(cfg, llm=RecordingEngine())
+
+	plans = org.process_one_by_one([source])
+
+	assert renamed == ["song.mp3"]
+	assert not plans[0].llm_skipped
+	assert plans[0].new_name == "renamed-song"
+
+
+def test_keyword_category_needs_agreement_with_extension() -> None:
+	assert rename_n_sort.llm_utils.keyword_category("Screenshot_2024-01-01.png", "png") == ("Image", "screenshot")
+	assert rename_n_sort.llm_utils.keyword_category("tax-invoices-2023.pdf", "pdf") == ("Document", "invoice")
+	# keyword contradicts the extension
+	assert rename_n_sort.llm_utils.keyword_category("song_lyrics.pdf", "pdf") is None
+	# two categories fire
+	assert rename_n_sort.llm_utils.keyword_category("photo_of_receipt.pdf", "pdf") is None
+	assert rename_n_sort.llm_utils.keyword_category("notes.pdf", "pdf") is None
+
+
+def test_keyword_category_skips_sort_prompt(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.chdir(tmp_path)
+	class CountingEngine(conftest.SlowEngine):
+		def __init__(self) -> None:
+			super().__init__()
+			self.sorted_paths: list[str] = []
+
+		def sort(self, files: list):
+			self.sorted_paths.extend(item.path for item in files)
+			return super().sort(files)
+
+	invoice = tmp_path / "march_invoice.txt"
+	invoice.write_text("amount due: 40 dollars", encoding="utf-8")
+	note = tmp_path / "note.txt"
+	note.write_text("meeting notes for tuesday", encoding="utf-8")
+	engine = CountingEngine()
+	cfg = rename_n_sort.config.AppConfig(roots=[tmp_path], target_root=tmp_path / "out", dry_run=True)
+	org = rename_n_sort.organizer.Organizer(cfg, llm=engine)
+
+	plans = org.plan([invoice, note])
+
+	assert not plans[0].llm_skipped
+	assert plans[0].category == "Document"
+	assert "invoice" in plans[0].category_reason
+	assert engine.sorted_paths == [str(note.resolve())]
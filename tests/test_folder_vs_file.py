@@ -15,7 +15,7 @@ def test_scanner_skips_directories(tmp_path: Path) -> None:
 	dir_path.mkdir()
 	file_path.write_text("hello", encoding="utf-8")
 	config = AppConfig(roots=[tmp_path], randomize=False)
-	paths = iter_files(config)
+	paths = list(iter_files(config))
 	assert dir_path not in paths
 	assert file_path in paths
 
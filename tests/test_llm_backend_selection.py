@@ -3,6 +3,8 @@
 Tests for CLI LLM backend selection.
 """
 
+import pytest
+
 from rename_n_sort.cli import build_llm
 from rename_n_sort.config import AppConfig
 from rename_n_sort.llm_engine import LLMEngine
@@ -69,3 +71,100 @@ def test_backend_ollama_unavailable_raises(monkeypatch):
 	cfg.llm_backend = "ollama"
 	with pytest.raises(RuntimeError):
 		build_llm(cfg)
+
+
+def test_ollama_probe_uses_tcp_connect():
+	import socket
+	import rename_n_sort.cli as cli
+
+	with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+		server.bind(("127.0.0.1", 0))
+		server.listen(1)
+		port = server.getsockname()[1]
+		assert cli._ollama_available(f"http://127.0.0.1:{port}")
+	assert not cli._ollama_available(f"http://127.0.0.1:{port}")
+
+
+def test_apple_transport_reuses_one_session_and_clears_history(monkeypatch):
+	import sys
+	import types
+
+	opened: list[object] = []
+
+	class FakeSession:
+		def __init__(self):
+			self.history: list[str] = []
+			opened.append(self)
+
+		def __enter__(self):
+			return self
+
+		def __exit__(self, *exc_info):
+			return None
+
+		def generate(self, prompt, max_tokens, temperature):
+			self.history.append(prompt)
+			return types.SimpleNamespace(text=f" {prompt} reply ")
+
+		def clear_history(self):
+			self.history.clear()
+
+	fake_module = types.ModuleType("applefoundationmodels")
+	fake_module.Session = FakeSession
+	monkeypatch.setitem(sys.modules, "applefoundationmodels", fake_module)
+	transport = AppleTransport()
+	transport._ready = True
+	assert transport.generate("one", purpose="test", max_tokens=10) == "one reply"
+	assert transport.generate("two", purpose="test", max_tokens=10) == "two reply"
+	assert len(opened) == 1
+	assert opened[0].history == []
+
+
+def test_apple_transport_drops_failed_sessions_and_closes_all(monkeypatch):
+	import sys
+	import threading
+	import types
+
+	opened: list[object] = []
+
+	class FakeSession:
+		def __init__(self):
+			self.closed = False
+			opened.append(self)
+
+		def __enter__(self):
+			return self
+
+		def __exit__(self, *exc_info):
+			self.closed = True
+
+		def generate(self, prompt, max_tokens, temperature):
+			if prompt == "boom":
+				raise OSError("daemon went away")
+			return types.SimpleNamespace(text=prompt)
+
+		def clear_history(self):
+			raise RuntimeError("clear failed")
+
+	fake_module = types.ModuleType("applefoundationmodels")
+	fake_module.Session = FakeSession
+	monkeypatch.setitem(sys.modules, "applefoundationmodels", fake_module)
+	transport = AppleTransport()
+	transport._ready = True
+	# the generate error is raised, not the clear_history error
+	with pytest.raises(OSError):
+		transport.generate("boom", purpose="test", max_tokens=10)
+	assert opened[0].closed
+	assert transport.generate("ok", purpose="test", max_tokens=10) == "ok"
+	assert len(opened) == 2
+	# a session that cannot be cleared is not reused
+	assert opened[1].closed
+	monkeypatch.setattr(FakeSession, "clear_history", lambda self: None)
+	transport.generate("main", purpose="test", max_tokens=10)
+	worker = threading.Thread(target=transport.generate, args=("worker",), kwargs={"purpose": "test", "max_tokens": 10})
+	worker.start()
+	worker.join()
+	assert len(opened) == 4
+	assert not any(session.closed for session in opened[2:])
+	transport.close()
+	assert all(session.closed for session in opened)
@@ -4,6 +4,7 @@ Tests for LLMEngine retry and fallback behavior.
 """
 
 from rename_n_sort.llm_engine import LLMEngine
+from rename_n_sort.llm_utils import compute_stem_features, obvious_stem_action
 
 
 class GuardrailViolationError(Exception):
@@ -142,3 +143,296 @@ def test_keep_original_requires_reason():
 	assert result.stem_action == "keep"
 	assert "meaningful" in result.reason
 	assert transport.calls[0][1] != transport.calls[1][1]
+
+
+def test_stem_action_skips_llm_for_opaque_stems():
+	transport = DummyTransport(
+		responses=["<stem_action>keep</stem_action><reason>camera counter</reason>"]
+	)
+	engine = LLMEngine(transports=[transport])
+	result = engine.stem_action("IMG_4821", "Beach_Sunset.jpg", "jpg")
+	assert result.stem_action == "drop"
+	assert transport.calls == []
+	engine.fast_path = False
+	assert engine.stem_action("IMG_4821", "Beach_Sunset.jpg", "jpg").stem_action == "keep"
+	assert len(transport.calls) == 1
+	engine.fast_path = True
+	for stem in ("3f9a2c7e", "550e8400-e29b-41d4-a716-446655440000", "DSC_0042", "d41d8cd98f00b204e9800998ecf8427e"):
+		assert engine.stem_action(stem, "Beach_Sunset.jpg", "jpg").stem_action == "drop"
+	assert len(transport.calls) == 1
+	# dates, plain numbers and word-plus-year stems still go to the model
+	meaningful = ("20240115", "12345678", "Decade2024", "Facade2019", "IMG_20240115", "Screenshot_20231231", "scan 2024")
+	for stem in meaningful:
+		features = compute_stem_features(stem, "Beach_Sunset.jpg")
+		assert obvious_stem_action(stem, features) is None, stem
+
+
+def test_sort_batches_multiple_files_into_one_call():
+	from rename_n_sort.llm_prompts import SortItem
+
+	transport = DummyTransport(
+		responses=["<file_1>Document</file_1><file_2>Image</file_2>"]
+	)
+	engine = LLMEngine(transports=[transport])
+	items = [
+		SortItem(path="/tmp/a.pdf", name="a.pdf", ext="pdf", description="manual"),
+		SortItem(path="/tmp/b.png", name="b.png", ext="png", description="photo"),
+	]
+	result = engine.sort(items)
+	assert result.assignments == {"/tmp/a.pdf": "Document", "/tmp/b.png": "Image"}
+	assert len(transport.calls) == 1
+
+
+def test_sort_batch_falls_back_to_per_file():
+	from rename_n_sort.llm_prompts import SortItem
+
+	transport = DummyTransport(
+		responses=[
+			"no tags",
+			"still no tags",
+			"<category>Document</category>",
+			"<category>Image</category>",
+		]
+	)
+	engine = LLMEngine(transports=[transport])
+	items = [
+		SortItem(path="/tmp/a.pdf", name="a.pdf", ext="pdf", description="manual"),
+		SortItem(path="/tmp/b.png", name="b.png", ext="png", description="photo"),
+	]
+	result = engine.sort(items)
+	assert result.assignments == {"/tmp/a.pdf": "Document", "/tmp/b.png": "Image"}
+	assert len(transport.calls) == 4
+
+
+def test_rename_and_stem_action_single_call():
+	transport = DummyTransport(
+		responses=[
+			"<new_name>Fan_Manual.pdf</new_name><reason>manual</reason>"
+			"<stem_action>drop</stem_action><stem_reason>generic scan label</stem_reason>"
+		]
+	)
+	engine = LLMEngine(transports=[transport])
+	rename_result, keep_result = engine.rename_and_stem_action("scan001.pdf", {"extension": "pdf"}, "pdf")
+	assert rename_result.new_name == "Fan_Manual.pdf"
+	assert keep_result.stem_action == "drop"
+	assert len(transport.calls) == 1
+
+
+def test_rename_and_stem_action_falls_back_to_separate_calls():
+	transport = DummyTransport(
+		responses=[
+			"<new_name>Fan_Manual.pdf</new_name>",
+			"<new_name>Fan_Manual.pdf</new_name>",
+			"<new_name>Fan_Manual.pdf</new_name><reason>manual</reason>",
+			"<stem_action>keep</stem_action><reason>model number</reason>",
+		]
+	)
+	engine = LLMEngine(transports=[transport])
+	rename_result, keep_result = engine.rename_and_stem_action("GV60.pdf", {"extension": "pdf"}, "pdf")
+	assert rename_result.new_name == "Fan_Manual.pdf"
+	assert keep_result.stem_action == "keep"
+	assert len(transport.calls) == 4
+
+
+def test_rename_stem_action_and_category_single_call():
+	transport = DummyTransport(
+		responses=[
+			"<new_name>Fan_Manual.pdf</new_name><reason>manual</reason>"
+			"<stem_action>drop</stem_action><stem_reason>generic scan label</stem_reason>"
+			"<category>Document</category><category_reason>product manual</category_reason>"
+		]
+	)
+	engine = LLMEngine(transports=[transport])
+	rename_result, keep_result, sort_result = engine.rename_stem_action_and_category(
+		"scan001.pdf", {"extension": "pdf"}, "pdf"
+	)
+	assert rename_result.new_name == "Fan_Manual.pdf"
+	assert keep_result.stem_action == "drop"
+	assert sort_result.assignments == {"scan001.pdf": "Document"}
+	assert sort_result.reasons == {"scan001.pdf": "product manual"}
+	assert len(transport.calls) == 1
+
+
+def test_rename_stem_action_and_category_falls_back_without_category():
+	calls: list[str] = []
+
+	class TwoCallEngine(LLMEngine):
+		def rename_and_stem_action(self, current_name, metadata, extension=None):
+			calls.append(current_name)
+			return ("rename", "keep")
+
+	engine = TwoCallEngine(transports=[DummyTransport(error=GuardrailViolationError("guardrail"))])
+	assert engine.rename_stem_action_and_category("a.pdf", {"extension": "pdf"}) == ("rename", "keep", None)
+	assert calls == ["a.pdf"]
+
+
+def test_response_cache_skips_repeat_prompts(tmp_path):
+	from rename_n_sort.response_cache import ResponseCache
+
+	cache = ResponseCache(path=tmp_path / "responses.sqlite")
+	transport = DummyTransport(
+		responses=["<new_name>Good.pdf</new_name><reason>title</reason>"]
+	)
+	engine = LLMEngine(transports=[transport], cache=cache)
+	first = engine.rename("old.pdf", {"extension": "pdf"})
+	second = engine.rename("old.pdf", {"extension": "pdf"})
+	assert first.new_name == second.new_name == "Good.pdf"
+	assert len(transport.calls) == 1
+	cache.close()
+
+
+def test_response_cache_expires_entries(tmp_path):
+	from rename_n_sort.response_cache import ResponseCache
+
+	cache = ResponseCache(path=tmp_path / "responses.sqlite", ttl_seconds=0)
+	cache.put("key", "body")
+	assert cache.get("key") is None
+	cache.close()
+
+
+def test_response_cache_stores_only_parsed_replies(tmp_path):
+	from rename_n_sort.response_cache import ResponseCache
+
+	cache = ResponseCache(path=tmp_path / "responses.sqlite")
+	transport = DummyTransport(
+		responses=[
+			"not xml",
+			"<new_name>Good.pdf</new_name><reason>title</reason>",
+		]
+	)
+	engine = LLMEngine(transports=[transport], cache=cache)
+	assert engine.rename("old.pdf", {"extension": "pdf"}).new_name == "Good.pdf"
+	assert len(transport.calls) == 2
+	# the fixed reply is stored under the original prompt; the rerun skips
+	# both the first prompt and the format fix
+	assert engine.rename("old.pdf", {"extension": "pdf"}).new_name == "Good.pdf"
+	assert len(transport.calls) == 2
+	cache.close()
+
+
+def test_cache_key_includes_transport_options():
+	from rename_n_sort.response_cache import cache_key
+
+	base = cache_key("Ollama", "m", "prompt", 100)
+	assert cache_key("Ollama", "m", "prompt", 100, {}) == base
+	warm = cache_key("Ollama", "m", "prompt", 100, {"temperature": 0.8})
+	assert warm != base
+	assert warm != cache_key("Ollama", "m", "prompt", 100, {"temperature": 0.2})
+
+
+def test_response_cache_keeps_bounded_memory_lru(tmp_path):
+	from rename_n_sort.response_cache import ResponseCache
+
+	cache = ResponseCache(path=tmp_path / "responses.sqlite", memory_entries=2)
+	cache.put("a", "body a")
+	cache.put("b", "body b")
+	assert cache.get("a") == "body a"
+	cache.put("c", "body c")
+	# "b" was least recently used; it stays in SQLite but leaves memory
+	assert list(cache._memory) == ["a", "c"]
+	assert cache.get("b") == "body b"
+	assert list(cache._memory) == ["c", "b"]
+	cache.close()
+
+
+def test_engine_close_closes_transports_and_cache(tmp_path):
+	import sqlite3
+
+	import pytest
+
+	from rename_n_sort.response_cache import ResponseCache
+
+	class ClosingTransport(DummyTransport):
+		closed = False
+
+		def close(self) -> None:
+			self.closed = True
+
+	closing = ClosingTransport()
+	cache = ResponseCache(path=tmp_path / "responses.sqlite")
+	# transports without close() are skipped
+	llm = LLMEngine(transports=[DummyTransport(), closing], cache=cache)
+	llm.close()
+	assert closing.closed
+	with pytest.raises(sqlite3.ProgrammingError):
+		cache.get("missing")
+
+
+def _letter_embedding(text: str) -> list[float]:
+	# crude bag-of-letters vector; near-identical prompts score close to 1.0
+	lowered = text.lower()
+	return [float(lowered.count(letter)) for letter in "abcdefghijklmnopqrstuvwxyz"]
+
+
+def test_semantic_cache_reuses_category_for_similar_prompt():
+	from rename_n_sort.llm_prompts import SortItem
+	from rename_n_sort.response_cache import SemanticCache
+
+	transport = DummyTransport(
+		responses=["<category>Image</category><reason>photo</reason>"]
+	)
+	engine = LLMEngine(transports=[transport], semantic_cache=SemanticCache(_letter_embedding))
+	first = engine.sort([SortItem(path="/tmp/IMG_0001.jpg", name="IMG_0001", ext="jpg", description="Image")])
+	second = engine.sort([SortItem(path="/tmp/IMG_0002.jpg", name="IMG_0002", ext="jpg", description="Image")])
+	assert first.assignments["/tmp/IMG_0001.jpg"] == "Image"
+	assert second.assignments["/tmp/IMG_0002.jpg"] == "Image"
+	assert len(transport.calls) == 1
+
+
+def test_semantic_cache_ignores_shared_prompt_header():
+	from rename_n_sort.llm_prompts import SortItem
+	from rename_n_sort.response_cache import SemanticCache
+
+	transport = DummyTransport(
+		responses=[
+			"<category>Image</category><reason>photo</reason>",
+			"<category>Document</category><reason>invoice</reason>",
+		]
+	)
+	engine = LLMEngine(transports=[transport], semantic_cache=SemanticCache(_letter_embedding))
+	engine.sort([SortItem(path="/tmp/IMG_0001.jpg", name="IMG_0001", ext="jpg", description="Image")])
+	other = engine.sort([SortItem(path="/tmp/tax.pdf", name="tax", ext="pdf", description="Quarterly invoice")])
+	assert other.assignments["/tmp/tax.pdf"] == "Document"
+	assert len(transport.calls) == 2
+
+
+def test_sort_batch_retries_halves_before_per_file():
+	from rename_n_sort.llm_prompts import SortItem
+
+	transport = DummyTransport(
+		responses=[
+			"no tags",
+			"still no tags",
+			"<file_1>Document</file_1><file_2>Image</file_2>",
+			"<file_1>Audio</file_1><file_2>Video</file_2>",
+		]
+	)
+	engine = LLMEngine(transports=[transport])
+	items = [
+		SortItem(path="/tmp/a.pdf", name="a.pdf", ext="pdf", description="manual"),
+		SortItem(path="/tmp/b.png", name="b.png", ext="png", description="photo"),
+		SortItem(path="/tmp/c.mp3", name="c.mp3", ext="mp3", description="song"),
+		SortItem(path="/tmp/d.mp4", name="d.mp4", ext="mp4", description="movie"),
+	]
+	result = engine.sort(items)
+	assert result.assignments == {
+		"/tmp/a.pdf": "Document",
+		"/tmp/b.png": "Image",
+		"/tmp/c.mp3": "Audio",
+		"/tmp/d.mp4": "Video",
+	}
+	assert len(transport.calls) == 4
+	# both halves' replies are kept
+	assert "Document" in result.raw_text and "Video" in result.raw_text
+
+
+def test_error_classifiers_read_whole_message():
+	from rename_n_sort.llm_utils import _is_context_window_error, _is_guardrail_error
+
+	assert _is_guardrail_error(RuntimeError("Guardrail: unsafe content"))
+	assert _is_context_window_error(RuntimeError("context length exceeded"))
+	# errors that echo a long prompt before the keywords still classify
+	echoed = "prompt: " + "x" * 5000
+	assert _is_context_window_error(RuntimeError(echoed + " context length exceeded"))
+	assert _is_guardrail_error(RuntimeError(echoed + " guardrail flagged unsafe content"))
+	assert not _is_guardrail_error(RuntimeError("connection refused"))
@@ -52,3 +52,9 @@ def test_extracts_last_response_block():
 	raw = "<response>first</response> chatter <response>second</response>"
 	result = extract_xml_tag_content(raw, "response")
 	assert result == "second"
+
+
+def test_extract_tag_is_case_insensitive_and_tolerates_missing_close():
+	assert extract_xml_tag_content("<Response>Mixed</RESPONSE>", "response") == "Mixed"
+	assert extract_xml_tag_content("<response>a</response><response> open ended", "response") == "open ended"
+	assert extract_xml_tag_content("no tags here", "response") == ""
@@ -88,3 +88,18 @@ def test_parse_sort_without_response_wrapper():
 	text = "<category>Image</category>"
 	result = parse_sort_response(text, ["/tmp/a.pdf"])
 	assert result.assignments["/tmp/a.pdf"] == "Image"
+
+
+def test_parse_rename_with_cdata_values():
+	text = "<new_name><![CDATA[Tax_Return_2023.pdf]]></new_name><reason><![CDATA[year & form]]></reason>"
+	result = parse_rename_response(text)
+	assert result.new_name == "Tax_Return_2023.pdf"
+	assert result.reason == "year & form"
+
+
+def test_parse_sort_batch_with_nested_category_tags():
+	from rename_n_sort.llm_parsers import parse_sort_batch_response
+
+	text = "<file_1><category>Image</category></file_1><file_2>Document</file_2>"
+	result = parse_sort_batch_response(text, ["/tmp/a.png", "/tmp/b.pdf"])
+	assert result.assignments == {"/tmp/a.png": "Image", "/tmp/b.pdf": "Document"}
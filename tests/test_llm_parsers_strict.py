@@ -88,3 +88,70 @@ def test_parse_sort_duplicate_reason_raises():
 			"<category>Document</category><reason>one</reason><reason>two</reason>",
 			["/tmp/a.pdf"],
 		)
+
+
+def test_parse_sort_batch_assigns_each_file():
+	from rename_n_sort.llm_parsers import parse_sort_batch_response
+
+	result = parse_sort_batch_response(
+		"<file_1>Document</file_1>\n<file_2>Image</file_2>",
+		["/tmp/a.pdf", "/tmp/b.png"],
+	)
+	assert result.assignments == {"/tmp/a.pdf": "Document", "/tmp/b.png": "Image"}
+
+
+def test_parse_sort_batch_missing_file_raises():
+	from rename_n_sort.llm_parsers import parse_sort_batch_response
+
+	with pytest.raises(ParseError):
+		parse_sort_batch_response("<file_1>Document</file_1>", ["/tmp/a.pdf", "/tmp/b.png"])
+
+
+def test_parse_sort_batch_double_digit_and_duplicate_tags():
+	from rename_n_sort.llm_parsers import parse_sort_batch_response
+
+	paths = [f"/tmp/f{idx}.txt" for idx in range(1, 11)]
+	text = "\n".join(f"<file_{idx}>Cat{idx}</file_{idx}>" for idx in range(10, 0, -1))
+	result = parse_sort_batch_response(text, paths)
+	assert result.assignments["/tmp/f1.txt"] == "Cat1"
+	assert result.assignments["/tmp/f10.txt"] == "Cat10"
+	with pytest.raises(ParseError):
+		parse_sort_batch_response(text + "\n<file_2>Other</file_2>", paths)
+
+
+def test_parse_rename_keep_response_reads_both_parts():
+	from rename_n_sort.llm_parsers import parse_rename_keep_response
+
+	rename_result, keep_result = parse_rename_keep_response(
+		"<new_name>A.pdf</new_name><reason>title</reason>"
+		"<stem_action>Normalize</stem_action><stem_reason>long stem</stem_reason>"
+	)
+	assert rename_result.reason == "title"
+	assert keep_result.stem_action == "normalize"
+	assert keep_result.reason == "long stem"
+	with pytest.raises(ParseError):
+		parse_rename_keep_response("<new_name>A.pdf</new_name><stem_reason>x</stem_reason>")
+
+
+def test_parse_rename_keep_sort_response_reads_category():
+	from rename_n_sort.llm_parsers import parse_rename_keep_sort_response
+
+	text = (
+		"<new_name>A.pdf</new_name><reason>title</reason>"
+		"<stem_action>drop</stem_action><stem_reason>noise</stem_reason>"
+		"<category>Document</category><category_reason>a letter</category_reason>"
+	)
+	_rename, keep_result, sort_result = parse_rename_keep_sort_response(text, "scan.pdf")
+	assert keep_result.stem_action == "drop"
+	assert sort_result.assignments == {"scan.pdf": "Document"}
+	assert sort_result.reasons == {"scan.pdf": "a letter"}
+	with pytest.raises(ParseError):
+		parse_rename_keep_sort_response(text.replace("<category>Document</category>", ""), "scan.pdf")
+
+
+def test_parse_rename_inside_wrapper_and_mixed_case():
+	result = parse_rename_response(
+		"<response><NEW_NAME>Trip.jpg</new_name><Reason>beach photo</Reason></response>"
+	)
+	assert result.new_name == "Trip.jpg"
+	assert result.reason == "beach photo"
@@ -13,7 +13,7 @@ from rename_n_sort.llm_prompts import (
 	build_rename_prompt,
 	build_sort_prompt,
 )
-from rename_n_sort.llm_utils import _sanitize_prompt_text
+from rename_n_sort.llm_utils import _sanitize_prompt_text, compute_stem_features, normalize_reason
 
 
 def test_format_fix_prompt_includes_example():
@@ -36,6 +36,11 @@ def test_sanitize_prompt_text_removes_long_tokens_and_duplicates():
 	assert cleaned.count("short") == 1
 
 
+def test_sanitize_prompt_text_blanks_controls_and_fences():
+	raw = "Title\tOne\r\n```code```\rend\x00mark\x0c"
+	assert _sanitize_prompt_text(raw) == "Title One\ncode\nend mark"
+
+
 def test_rename_prompt_uses_sanitized_description():
 	req = RenameRequest(metadata={"description": "Line1\nLine1\n" + ("y" * 90)}, current_name="a.txt")
 	prompt = build_rename_prompt(req)
@@ -75,3 +80,29 @@ def test_sort_prompt_includes_reason():
 	assert "<reason>" in prompt
 	assert "<file" not in prompt
 	assert "<response>" not in prompt
+
+
+def test_sort_prompts_share_static_prefix():
+	from rename_n_sort.llm_prompts import build_sort_batch_prompt
+
+	first = build_sort_batch_prompt(SortRequest(files=[SortItem("/a", "a", "pdf", "")], context="Taxes"))
+	second = build_sort_batch_prompt(SortRequest(files=[SortItem("/b", "b", "png", "")], context="Taxes"))
+	prefix = first[: first.index("Files:")]
+	assert second.startswith(prefix)
+	assert "- Document" in prefix
+	assert "Context: Taxes" in prefix
+
+
+def test_stem_features_count_digits_and_letters():
+	features = compute_stem_features("IMG_2024-0101", "photo.jpg")
+	assert features["alnum_length"] == 11
+	assert features["digit_ratio"] == round(8 / 11, 3)
+	assert features["has_letter"] is True
+	assert compute_stem_features("20240101", "")["has_letter"] is False
+
+
+def test_normalize_reason_drops_placeholders():
+	assert normalize_reason("  N/A ") == ""
+	assert normalize_reason("Optional!") == ""
+	assert normalize_reason("brief justification here") == ""
+	assert normalize_reason("Invoice   from\nACME") == "Invoice from ACME"
@@ -61,3 +61,37 @@ def test_format_fix_raises_last_transport_error():
 	engine = LLMEngine(transports=[first, second])
 	with pytest.raises(ValueError, match="transport down"):
 		engine.rename("old.pdf", {"extension": "pdf"})
+
+
+def test_sanitize_filename_maps_non_ascii_and_collapses_runs():
+	from rename_n_sort.llm_utils import sanitize_filename
+
+	assert sanitize_filename("Caf\u00e9 Menu  2024.pdf") == "Caf-Menu-2024.pdf"
+	assert sanitize_filename("a//b__c") == "a-b_c"
+	assert sanitize_filename("\u00e9\u00e9\u00e9") == "file"
+
+
+def test_pick_category_lookup():
+	from rename_n_sort.llm_utils import pick_category
+
+	assert pick_category("PDF") == "Document"
+	assert pick_category("tsv") == "Data"
+	assert pick_category("svgz") == "Image"
+	assert pick_category("unknown") == "Other"
+
+
+def test_sanitize_filename_long_separator_runs():
+	from rename_n_sort.llm_utils import sanitize_filename
+
+	assert sanitize_filename("a" + "-" * 5000 + "b" + "_" * 5000 + "c") == "a-b_c"
+
+
+def test_normalize_category_maps_variants():
+	from rename_n_sort.llm_utils import normalize_category
+
+	assert normalize_category("Document/Invoices") == "Document"
+	assert normalize_category(" documents (pdf)") == "Document"
+	assert normalize_category("Image - photo") == "Image"
+	assert normalize_category("Spreadsheets") == "Spreadsheet"
+	assert normalize_category("Recipes") == "Other"
+	assert normalize_category("") == "Other"
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for mdls helper caching.
+"""
+
+# Standard Library
+import subprocess
+from pathlib import Path
+
+# local repo modules
+import rename_n_sort.plugins.mdls_utils as mdls_utils
+
+
+def test_mdls_field_is_cached_per_path_and_field(monkeypatch):
+	calls: list[list[str]] = []
+
+	def _fake_run(cmd, **_kwargs):
+		calls.append(cmd)
+		return subprocess.CompletedProcess(cmd, 0, stdout="Quarterly Report\n", stderr="")
+
+	monkeypatch.setattr(mdls_utils, "_mdls_available", lambda: True)
+	monkeypatch.setattr(mdls_utils.subprocess, "run", _fake_run)
+	mdls_utils._mdls_field_cached.cache_clear()
+	path = Path("/tmp/report.pdf")
+	assert mdls_utils.mdls_field(path, "kMDItemTitle") == "Quarterly Report"
+	assert mdls_utils.mdls_field(path, "kMDItemTitle") == "Quarterly Report"
+	assert len(calls) == 1
+	mdls_utils._mdls_field_cached.cache_clear()
+
+
+def test_mdls_fields_uses_one_call(monkeypatch):
+	calls: list[list[str]] = []
+
+	def _fake_run(cmd, **_kwargs):
+		calls.append(cmd)
+		return subprocess.CompletedProcess(cmd, 0, stdout="Report\0(null)\x0012", stderr="")
+
+	monkeypatch.setattr(mdls_utils, "_mdls_available", lambda: True)
+	monkeypatch.setattr(mdls_utils.subprocess, "run", _fake_run)
+	mdls_utils._mdls_fields_cached.cache_clear()
+	data = mdls_utils.mdls_fields(Path("/tmp/a.pdf"), ["kMDItemTitle", "kMDItemAuthors", "kMDItemPageCount"])
+	assert data == {"kMDItemTitle": "Report", "kMDItemPageCount": "12"}
+	assert len(calls) == 1
+	assert calls[0].count("-name") == 3
+	mdls_utils._mdls_fields_cached.cache_clear()
+
+
+def test_mdls_batch_prefetches_many_files(monkeypatch):
+	calls: list[list[str]] = []
+	fields = ("kMDItemTitle", "kMDItemKind")
+
+	def _fake_run(cmd, **_kwargs):
+		calls.append(cmd)
+		return subprocess.CompletedProcess(cmd, 0, stdout="A\0PDF\0(null)\0Text\0", stderr="")
+
+	monkeypatch.setattr(mdls_utils, "_mdls_available", lambda: True)
+	monkeypatch.setattr(mdls_utils.subprocess, "run", _fake_run)
+	monkeypatch.setattr(mdls_utils, "_prefetched", {})
+	mdls_utils._mdls_field_cached.cache_clear()
+	first = Path("/tmp/one.pdf")
+	second = Path("/tmp/two.txt")
+	found = mdls_utils.mdls_batch([first, second], fields)
+	assert found == {first: {"kMDItemTitle": "A", "kMDItemKind": "PDF"}, second: {"kMDItemKind": "Text"}}
+	assert mdls_utils.mdls_field(first, "kMDItemTitle") == "A"
+	assert mdls_utils.mdls_field(second, "kMDItemTitle") is None
+	assert mdls_utils.mdls_fields(second, list(fields)) == {"kMDItemKind": "Text"}
+	assert len(calls) == 1
+	assert calls[0][-2:] == [str(first), str(second)]
+
+
+def test_mdls_batch_keeps_a_bounded_prefetch(monkeypatch):
+	def _fake_run(cmd, **_kwargs):
+		paths = cmd[cmd.index("kMDItemTitle") + 1 :]
+		return subprocess.CompletedProcess(cmd, 0, stdout="".join(f"T{idx}\0" for idx in range(len(paths))), stderr="")
+
+	monkeypatch.setattr(mdls_utils, "_mdls_available", lambda: True)
+	monkeypatch.setattr(mdls_utils.subprocess, "run", _fake_run)
+	monkeypatch.setattr(mdls_utils, "_prefetched", {})
+	monkeypatch.setattr(mdls_utils, "_PREFETCH_MAX_ENTRIES", 3)
+	paths = [Path(f"/tmp/file{idx}.txt") for idx in range(5)]
+	mdls_utils.mdls_batch(paths, ("kMDItemTitle",))
+	assert list(mdls_utils._prefetched) == [str(path) for path in paths[2:]]
+
+
+def test_organizer_prefetch_skips_unplannable_paths(tmp_path, monkeypatch):
+	import rename_n_sort.organizer as organizer_module
+	from rename_n_sort.config import AppConfig
+
+	batched: list[list[Path]] = []
+	monkeypatch.setattr(organizer_module, "mdls_batch", batched.append)
+	keep = tmp_path / "notes.txt"
+	keep.write_text("x")
+	folder = tmp_path / "folder.txt"
+	folder.mkdir()
+	unsupported = tmp_path / "blob.zzz"
+	unsupported.write_text("x")
+	organizer = organizer_module.Organizer(config=AppConfig(), llm=object())
+	passed = list(organizer._prefetch_mdls([keep, folder, unsupported, tmp_path / "gone.txt"]))
+	assert passed == [keep, folder, unsupported, tmp_path / "gone.txt"]
+	assert batched == [[keep]]
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent metadata cache.
+"""
+
+# Standard Library
+from pathlib import Path
+
+# local repo modules
+from rename_n_sort.config import AppConfig
+from rename_n_sort.organizer import Organizer
+from rename_n_sort.plugins.base import FileMetadata
+from rename_n_sort.plugins.cache import MetadataCache
+
+
+def test_metadata_cache_round_trip_keys_on_path_and_stat(tmp_path: Path) -> None:
+	path = tmp_path / "notes.txt"
+	path.write_text("hello", encoding="utf-8")
+	cache = MetadataCache(tmp_path / "metadata.sqlite")
+	stat_result = path.stat()
+	assert cache.get(path, stat_result) is None
+	meta = FileMetadata(path=path, title="Notes", extension="txt", created_ts=1.5)
+	meta.extra["page_count"] = 3
+	cache.put(path, stat_result, meta)
+	assert cache.contains(path, stat_result)
+	loaded = cache.get(path, stat_result)
+	assert loaded is not None
+	assert loaded.title == "Notes"
+	assert loaded.created_ts == 1.5
+	assert loaded.extra == {"page_count": 3}
+	# same inode under another name or extension is extracted again
+	assert cache.get(tmp_path / "notes.md", stat_result) is None
+	path.write_text("hello again", encoding="utf-8")
+	assert cache.get(path, path.stat()) is None
+	cache.close()
+
+
+def test_metadata_cache_skips_incomplete_results(tmp_path: Path) -> None:
+	path = tmp_path / "scan.pdf"
+	path.write_bytes(b"%PDF-1.4\n")
+	cache = MetadataCache(tmp_path / "metadata.sqlite")
+	stat_result = path.stat()
+	cache.put(path, stat_result, FileMetadata(path=path, complete=False))
+	assert not cache.contains(path, stat_result)
+	cache.close()
+
+
+def test_organizer_skips_plugins_for_cached_files(tmp_path: Path, monkeypatch) -> None:
+	source = tmp_path / "notes.txt"
+	source.write_text("quarterly budget notes", encoding="utf-8")
+	organizer = Organizer(config=AppConfig(), llm=object())
+	organizer.metadata_cache = MetadataCache(tmp_path / "metadata.sqlite")
+	first = organizer._collect_metadata(source)
+
+	def _fail(_path: Path):
+		raise AssertionError("plugin should not run for a cached file")
+
+	monkeypatch.setattr(organizer.registry, "for_path", _fail)
+	second = organizer._collect_metadata(source)
+	assert second.summary == first.summary
+	assert second.path == source
+	monkeypatch.undo()
+	source.write_text("edited notes with more words", encoding="utf-8")
+	third = organizer._collect_metadata(source)
+	assert third.summary == "edited notes with more words"
+
+
+def test_metadata_cache_drops_entries_from_older_schema(tmp_path: Path) -> None:
+	import sqlite3
+
+	db_path = tmp_path / "metadata.sqlite"
+	path = tmp_path / "notes.txt"
+	path.write_text("hello", encoding="utf-8")
+	cache = MetadataCache(db_path)
+	cache.put(path, path.stat(), FileMetadata(path=path, size_bytes=5))
+	cache.close()
+	conn = sqlite3.connect(str(db_path))
+	conn.execute("PRAGMA user_version = 0")
+	conn.close()
+	reopened = MetadataCache(db_path)
+	assert reopened.get(path, path.stat()) is None
+	reopened.close()
+
+
+def test_metadata_cache_keeps_one_entry_per_path(tmp_path: Path) -> None:
+	import sqlite3
+
+	db_path = tmp_path / "metadata.sqlite"
+	path = tmp_path / "notes.txt"
+	cache = MetadataCache(db_path)
+	for text in ("hello", "hello again", "hello once more"):
+		path.write_text(text, encoding="utf-8")
+		cache.put(path, path.stat(), FileMetadata(path=path, summary=text))
+	loaded = cache.get(path, path.stat())
+	assert loaded is not None and loaded.summary == "hello once more"
+	cache.close()
+	conn = sqlite3.connect(str(db_path))
+	(count,) = conn.execute("SELECT COUNT(*) FROM metadata").fetchone()
+	conn.close()
+	assert count == 1
@@ -22,3 +22,82 @@ def test_model_selection_large(monkeypatch):
 	monkeypatch.setattr(llm, "get_vram_size_in_gb", lambda: 40)
 	model = llm.choose_model(None)
 	assert model == "gpt-oss:20b"
+
+
+def test_vram_probe_is_cached(monkeypatch):
+	from rename_n_sort import llm_utils
+
+	calls: list[str] = []
+
+	def _fake_sysctl_u64(name):
+		calls.append(name)
+		return 16 * 1024 ** 3
+
+	monkeypatch.setattr(llm_utils.platform, "machine", lambda: "arm64")
+	monkeypatch.setattr(llm_utils, "_sysctl_u64", _fake_sysctl_u64)
+	llm_utils.get_vram_size_in_gb.cache_clear()
+	try:
+		assert llm_utils.get_vram_size_in_gb() == 16
+		assert llm_utils.get_vram_size_in_gb() == 16
+	finally:
+		llm_utils.get_vram_size_in_gb.cache_clear()
+	assert calls == ["hw.memsize"]
+
+
+def test_parse_memory_gb():
+	from rename_n_sort import llm_utils
+
+	text = "Hardware Overview:\n      Chip: Apple M2\n      Memory: 24 GB\n"
+	assert llm_utils._parse_memory_gb(text) == 24
+	assert llm_utils._parse_memory_gb("Memory:  128GB") == 128
+	assert llm_utils._parse_memory_gb("no memory line") is None
+
+
+def test_parse_vram_gb():
+	from rename_n_sort import llm_utils
+
+	text = "Graphics:\n      VRAM (Total): 8192 MB\n"
+	assert llm_utils._parse_vram_gb(text) == 8
+	assert llm_utils._parse_vram_gb("VRAM (Dynamic, Max):\t16384MB") == 16
+	assert llm_utils._parse_vram_gb("") is None
+
+
+def test_llm_exports_load_lazily():
+	import subprocess
+	import sys
+
+	code = (
+		"import sys; from rename_n_sort import llm; "
+		"before = 'rename_n_sort.llm_engine' in sys.modules; "
+		"engine = llm.LLMEngine; "
+		"print(before, 'rename_n_sort.llm_engine' in sys.modules, engine.__name__)"
+	)
+	result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+	assert result.stdout.split() == ["False", "True", "LLMEngine"]
+
+
+def test_apple_models_available_is_cached(monkeypatch):
+	import sys
+	import types
+
+	from rename_n_sort import llm_utils
+
+	calls: list[int] = []
+
+	def _fake_available():
+		calls.append(1)
+		return True
+
+	fake_module = types.ModuleType("applefoundationmodels")
+	fake_module.Session = object
+	fake_module.apple_intelligence_available = _fake_available
+	monkeypatch.setitem(sys.modules, "applefoundationmodels", fake_module)
+	monkeypatch.setattr(llm_utils.platform, "machine", lambda: "arm64")
+	monkeypatch.setattr(llm_utils, "_parse_macos_version", lambda: (26, 0, 0))
+	llm_utils.apple_models_available.cache_clear()
+	try:
+		assert llm_utils.apple_models_available() is True
+		assert llm_utils.apple_models_available() is True
+	finally:
+		llm_utils.apple_models_available.cache_clear()
+	assert calls == [1]
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the Ollama transport HTTP connection handling.
+"""
+
+# Standard Library
+import json
+import threading
+import http.server
+
+# local repo modules
+from rename_n_sort.transports.ollama import OllamaTransport
+
+
+class _ChatHandler(http.server.BaseHTTPRequestHandler):
+	protocol_version = "HTTP/1.1"
+	client_ports: list[int] = []
+	message_counts: list[int] = []
+
+	def do_POST(self):
+		length = int(self.headers.get("Content-Length", "0"))
+		request = json.loads(self.rfile.read(length).decode("utf-8"))
+		self.client_ports.append(self.client_address[1])
+		self.message_counts.append(len(request.get("messages", [])))
+		body = json.dumps({"message": {"content": "<category>Document</category>"}}).encode("utf-8")
+		self.send_response(200)
+		self.send_header("Content-Type", "application/json")
+		self.send_header("Content-Length", str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def log_message(self, format, *args):
+		return
+
+
+def _run_two_prompts(**transport_kwargs) -> None:
+	_ChatHandler.client_ports = []
+	_ChatHandler.message_counts = []
+	server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ChatHandler)
+	thread = threading.Thread(target=server.serve_forever, daemon=True)
+	thread.start()
+	try:
+		port = server.server_address[1]
+		transport = OllamaTransport(model="test", base_url=f"http://127.0.0.1:{port}", **transport_kwargs)
+		transport.generate("a", purpose="test", max_tokens=10)
+		transport.generate("b", purpose="test", max_tokens=10)
+		transport.close()
+	finally:
+		server.shutdown()
+		server.server_close()
+
+
+def test_generate_reuses_connection():
+	_run_two_prompts()
+	assert len(_ChatHandler.client_ports) == 2
+	assert len(set(_ChatHandler.client_ports)) == 1
+
+
+def test_generate_is_stateless_by_default():
+	_run_two_prompts(system_message="be brief")
+	assert _ChatHandler.message_counts == [2, 2]
+
+
+def test_generate_conversational_keeps_history():
+	_run_two_prompts(system_message="be brief", conversational=True)
+	assert _ChatHandler.message_counts == [2, 4]
+
+
+def test_base_url_parsed_into_host_and_port():
+	transport = OllamaTransport(model="test", base_url="http://example.local:8080/")
+	assert transport._host == "example.local"
+	assert transport._port == 8080
+	assert transport._path_prefix == ""
+
+
+def test_context_manager_closes_connection():
+	with OllamaTransport(model="test") as transport:
+		conn = transport._connection()
+		assert transport._connection() is conn
+	assert transport._local.conn is None
+
+
+def test_close_closes_connections_of_all_threads():
+	transport = OllamaTransport(model="test")
+	opened = []
+
+	def open_connection():
+		opened.append(transport._connection())
+
+	workers = [threading.Thread(target=open_connection) for _ in range(3)]
+	for worker in workers:
+		worker.start()
+	for worker in workers:
+		worker.join()
+	assert len(set(map(id, opened))) == 3
+	transport.close()
+	assert transport._connections == []
+	# a worker connection closed by close() is not handed out again
+	assert transport._connection() not in opened
+
+
+def test_json_helpers_round_trip_without_orjson(monkeypatch):
+	import rename_n_sort.transports.ollama as ollama_module
+
+	monkeypatch.setattr(ollama_module, "orjson", None)
+	payload = {"model": "m", "messages": [{"role": "user", "content": "caf\u00e9"}]}
+	assert ollama_module._loads(ollama_module._dumps(payload)) == payload
+
+
+def test_timeout_drops_connection_for_next_request(monkeypatch):
+	import types
+
+	import pytest
+
+	import rename_n_sort.transports.ollama as ollama_module
+
+	opened: list[object] = []
+
+	class FakeConnection:
+		def __init__(self, host, port, timeout):
+			self.closed = False
+			opened.append(self)
+
+		def request(self, method, url, body, headers):
+			return None
+
+		def getresponse(self):
+			if len(opened) == 1:
+				raise TimeoutError("timed out")
+			body = json.dumps({"message": {"content": "ok"}}).encode("utf-8")
+			return types.SimpleNamespace(status=200, read=lambda: body)
+
+		def close(self):
+			self.closed = True
+
+	monkeypatch.setattr(ollama_module.http.client, "HTTPConnection", FakeConnection)
+	transport = OllamaTransport(model="test")
+	with pytest.raises(TimeoutError):
+		transport.generate("slow", purpose="test", max_tokens=10)
+	# the timeout is not retried, and the broken connection is closed
+	assert len(opened) == 1 and opened[0].closed
+	assert transport.generate("next", purpose="test", max_tokens=10) == "ok"
+	assert len(opened) == 2
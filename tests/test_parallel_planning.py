@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent per-file planning in the organizer.
+"""
+
+# Standard Library
+import threading
+import time
+from pathlib import Path
+
+# local repo modules
+import conftest
+import rename_n_sort.config
+import rename_n_sort.llm_parsers
+import rename_n_sort.organizer
+
+
+def test_parallel_plans_overlap_and_keep_order(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.chdir(tmp_path)
+	sources: list[Path] = []
+	for idx in range(6):
+		source = tmp_path / f"note_{idx}.txt"
+		source.write_text(f"hello {idx}", encoding="utf-8")
+		sources.append(source)
+	engine = conftest.SlowEngine()
+	cfg = rename_n_sort.config.AppConfig(roots=[tmp_path], target_root=tmp_path / "out", dry_run=True, parallel=3)
+	org = rename_n_sort.organizer.Organizer(cfg, llm=engine)
+
+	plans = org.process_one_by_one(sources)
+
+	assert [plan.source for plan in plans] == sources
+	assert [plan.new_name for plan in plans] == [f"renamed-note_{idx}" for idx in range(6)]
+	assert engine.max_active > 1
+
+
+def test_parallel_plan_keeps_file_output_together(tmp_path: Path, monkeypatch, capsys) -> None:
+	monkeypatch.chdir(tmp_path)
+	sources: list[Path] = []
+	for idx in range(4):
+		source = tmp_path / f"memo_{idx}.txt"
+		source.write_text(f"memo {idx}", encoding="utf-8")
+		sources.append(source)
+	cfg = rename_n_sort.config.AppConfig(roots=[tmp_path], target_root=tmp_path / "out", dry_run=True, parallel=4)
+	org = rename_n_sort.organizer.Organizer(cfg, llm=conftest.SlowEngine())
+
+	plans = org.plan(sources)
+
+	assert [plan.source for plan in plans] == sources
+	output = capsys.readouterr().out
+	rename_lines = [line for line in output.splitlines() if line.startswith("[RENAME]")]
+	assert [line.split()[1] for line in rename_lines] == [path.name for path in sources]
+
+
+def test_color_decision_made_once(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.chdir(tmp_path)
+	org = rename_n_sort.organizer.Organizer(rename_n_sort.config.AppConfig(roots=[tmp_path]), llm=conftest.SlowEngine())
+	org._use_color = True
+	assert org._color("x", "36") == "\033[36mx\033[0m"
+	org._use_color = False
+	assert org._color("x", "36") == "x"
+
+
+def test_serial_mode_reads_metadata_in_background(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.chdir(tmp_path)
+	sources: list[Path] = []
+	for idx in range(5):
+		source = tmp_path / f"draft_{idx}.txt"
+		source.write_text(f"draft {idx}", encoding="utf-8")
+		sources.append(source)
+	engine = conftest.SlowEngine()
+	cfg = rename_n_sort.config.AppConfig(roots=[tmp_path], target_root=tmp_path / "out", dry_run=True, metadata_workers=3)
+	org = rename_n_sort.organizer.Organizer(cfg, llm=engine)
+	threads: set[str] = set()
+	original = org._collect_metadata
+
+	def _tracking_collect(path: Path):
+		threads.add(threading.current_thread().name)
+		return original(path)
+
+	monkeypatch.setattr(org, "_collect_metadata", _tracking_collect)
+	plans = org.process_one_by_one(sources)
+
+	assert [plan.source for plan in plans] == sources
+	assert threading.main_thread().name not in threads
+	# the LLM still sees one file at a time
+	assert engine.max_active == 1
+
+
+def test_one_by_one_uses_category_from_rename_prompt(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.chdir(tmp_path)
+
+	class CombinedEngine(conftest.SlowEngine):
+		def __init__(self) -> None:
+			super().__init__()
+			self.sort_calls = 0
+
+		def rename_stem_action_and_category(self, current_name, metadata, extension=None):
+			rename_result, keep_result = self.rename_and_stem_action(current_name, metadata, extension)
+			sort_result = rename_n_sort.llm_parsers.SortResult(
+				assignments={current_name: "Spreadsheet"},
+				reasons={current_name: "table of figures"},
+				raw_text="",
+			)
+			return (rename_result, keep_result, sort_result)
+
+		def sort(self, files: list) -> rename_n_sort.llm_parsers.SortResult:
+			self.sort_calls += 1
+			return super().sort(files)
+
+	source = tmp_path / "figures.txt"
+	source.write_text("q1 42 q2 57", encoding="utf-8")
+	engine = CombinedEngine()
+	cfg = rename_n_sort.config.AppConfig(roots=[tmp_path], target_root=tmp_path / "out", dry_run=True)
+	plans = rename_n_sort.organizer.Organizer(cfg, llm=engine).process_one_by_one([source])
+
+	assert plans[0].category == "Spreadsheet"
+	assert plans[0].category_reason == "table of figures"
+	assert engine.sort_calls == 0
+
+
+def test_sort_batches_overlap_when_parallel(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.chdir(tmp_path)
+
+	class SlowSortEngine(conftest.SlowEngine):
+		def __init__(self) -> None:
+			super().__init__()
+			self.sort_active = 0
+			self.sort_max_active = 0
+			self.batch_sizes: list[int] = []
+
+		def rename(self, current_name: str, metadata: dict) -> rename_n_sort.llm_parsers.RenameResult:
+			return rename_n_sort.llm_parsers.RenameResult(new_name=f"renamed-{Path(current_name).stem}", reason="", raw_text="")
+
+		def sort(self, files: list) -> rename_n_sort.llm_parsers.SortResult:
+			with self.lock:
+				self.sort_active += 1
+				self.sort_max_active = max(self.sort_max_active, self.sort_active)
+				self.batch_sizes.append(len(files))
+			time.sleep(0.05)
+			with self.lock:
+				self.sort_active -= 1
+			return super().sort(files)
+
+	sources: list[Path] = []
+	for idx in range(40):
+		source = tmp_path / f"page_{idx}.txt"
+		source.write_text(f"page {idx}", encoding="utf-8")
+		sources.append(source)
+	engine = SlowSortEngine()
+	cfg = rename_n_sort.config.AppConfig(roots=[tmp_path], target_root=tmp_path / "out", dry_run=True, parallel=3, fast_path=False)
+	plans = rename_n_sort.organizer.Organizer(cfg, llm=engine).plan(sources)
+
+	assert [plan.category for plan in plans] == ["Document"] * 40
+	assert sorted(engine.batch_sizes) == [8, 16, 16]
+	assert engine.sort_max_active > 1
+
+
+def test_keep_original_log_records_stay_whole_across_threads(tmp_path: Path, monkeypatch) -> None:
+	monkeypatch.chdir(tmp_path)
+	org = rename_n_sort.organizer.Organizer(rename_n_sort.config.AppConfig(roots=[tmp_path]), llm=conftest.SlowEngine())
+	raw_reply = "<stem_action>keep</stem_action>\n" * 200
+
+	def log_many(worker: int) -> None:
+		for idx in range(20):
+			org._log_keep_original_raw(tmp_path / f"w{worker}_{idx}.txt", raw_reply, "keep", "reason")
+
+	workers = [threading.Thread(target=log_many, args=(worker,)) for worker in range(4)]
+	for worker in workers:
+		worker.start()
+	for worker in workers:
+		worker.join()
+	records = (tmp_path / "KEEP_ORIGINAL.log").read_text(encoding="utf-8").split("=" * 80 + "\n")[1:]
+	assert len(records) == 80
+	assert all(record.endswith(raw_reply.strip() + "\n") for record in records)
@@ -12,5 +12,5 @@ def test_audio_plugin_extracts_basic_metadata(tmp_path: Path) -> None:
 	plugin = AudioPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "audio"
-	assert meta.extra.get("extension") == "mp3"
+	assert meta.extension == "mp3"
 	assert meta.summary == "Audio file mp3"
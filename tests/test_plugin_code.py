@@ -12,5 +12,5 @@ def test_code_plugin_extracts_preview(tmp_path: Path) -> None:
 	plugin = CodePlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "code"
-	assert meta.extra.get("extension") == "py"
+	assert meta.extension == "py"
 	assert meta.summary and "print" in meta.summary
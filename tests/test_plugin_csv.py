@@ -12,5 +12,20 @@ def test_csv_plugin_extracts_preview(tmp_path: Path) -> None:
 	plugin = CSVPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "csv"
-	assert meta.extra.get("extension") == "csv"
+	assert meta.extension == "csv"
 	assert meta.summary and "col1" in meta.summary
+
+
+def test_delimited_rows_plain_and_quoted(tmp_path: Path) -> None:
+	from rename_n_sort.plugins.read_utils import read_delimited_rows
+
+	plain = tmp_path / "plain.tsv"
+	plain.write_text("a\tb\n1\t2\n3\t4\n5\t6\n", encoding="utf-8")
+	assert read_delimited_rows(plain, "\t") == [["a", "b"], ["1", "2"], ["3", "4"]]
+	quoted = tmp_path / "quoted.csv"
+	quoted.write_text('name,note\n"Smith, J","line one\nline two"\nx,y\n', encoding="utf-8")
+	assert read_delimited_rows(quoted, ",") == [
+		["name", "note"],
+		["Smith, J", "line one\nline two"],
+		["x", "y"],
+	]
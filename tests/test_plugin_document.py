@@ -23,4 +23,4 @@ def test_document_plugin_handles_samples(filename: str) -> None:
 	plugin = DocumentPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "document"
-	assert meta.extra.get("extension") == path.suffix.lstrip(".")
+	assert meta.extension == path.suffix.lstrip(".")
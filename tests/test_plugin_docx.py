@@ -5,7 +5,6 @@ from pathlib import Path
 
 import pytest
 
-from rename_n_sort.plugins import docx_plugin
 from rename_n_sort.plugins.docx_plugin import DocxPlugin
 
 
@@ -16,6 +15,59 @@ def test_docx_plugin_extracts_summary() -> None:
 	plugin = DocxPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "docx"
-	assert meta.extra.get("extension") == "docx"
-	if docx_plugin.docx:
-		assert meta.summary
+	assert meta.extension == "docx"
+	assert meta.summary
+
+
+def test_docx_plugin_reads_parts_without_python_docx(tmp_path: Path) -> None:
+	import zipfile
+
+	body = "".join(
+		f"<w:p><w:r><w:t>para{idx}</w:t></w:r></w:p>" for idx in range(200)
+	)
+	path = tmp_path / "report.docx"
+	with zipfile.ZipFile(path, "w") as archive:
+		archive.writestr(
+			"docProps/core.xml",
+			'<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"'
+			' xmlns:dc="http://purl.org/dc/elements/1.1/">'
+			"<dc:title>Quarterly Report</dc:title><dc:creator>Ada</dc:creator></cp:coreProperties>",
+		)
+		archive.writestr(
+			"word/document.xml",
+			'<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+			f"<w:body>{body}</w:body></w:document>",
+		)
+	meta = DocxPlugin().extract_metadata(path)
+	full = " ".join(f"para{idx}" for idx in range(200))
+	assert meta.title == "Quarterly Report"
+	assert meta.keywords == ["Ada"]
+	assert meta.summary == f"{full[:256]} ... {full[-256:]}"
+
+
+def _corrupt_member(path: Path, member: str) -> None:
+	"""
+	Overwrite the start of a deflated member so decompression fails.
+	"""
+	import zipfile
+
+	with zipfile.ZipFile(path) as archive:
+		offset = archive.getinfo(member).header_offset
+	data = bytearray(path.read_bytes())
+	name_len = int.from_bytes(data[offset + 26 : offset + 28], "little")
+	extra_len = int.from_bytes(data[offset + 28 : offset + 30], "little")
+	start = offset + 30 + name_len + extra_len
+	data[start : start + 8] = b"\xff" * 8
+	path.write_bytes(bytes(data))
+
+
+def test_docx_plugin_survives_corrupt_archive(tmp_path: Path) -> None:
+	import zipfile
+
+	path = tmp_path / "broken.docx"
+	with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+		archive.writestr("word/document.xml", "<w:document>" + "hello " * 200 + "</w:document>")
+	_corrupt_member(path, "word/document.xml")
+	meta = DocxPlugin().extract_metadata(path)
+	assert meta.extension == "docx"
+	assert meta.summary is None
@@ -12,4 +12,30 @@ def test_generic_plugin_extracts_basic_metadata(tmp_path: Path) -> None:
 	plugin = GenericPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "generic"
-	assert meta.extra.get("extension") == "unknown"
+	assert meta.extension == "unknown"
+
+
+def test_generic_plugin_reuses_caller_stat(tmp_path: Path) -> None:
+	import os
+
+	path = tmp_path / "sample.unknown"
+	path.write_text("hello", encoding="utf-8")
+	real = path.stat()
+	# same stat with a different size proves the plugin did not stat again
+	fields = list(real)
+	fields[6] = 12345
+	stat_result = os.stat_result(fields)
+	meta = GenericPlugin().extract_metadata(path, stat_result)
+	assert meta.size_bytes == 12345
+
+
+def test_generic_plugin_formats_timestamps_on_demand(tmp_path: Path) -> None:
+	from datetime import datetime
+
+	path = tmp_path / "sample.unknown"
+	path.write_text("hello", encoding="utf-8")
+	meta = GenericPlugin().extract_metadata(path)
+	assert meta.modified_ts == path.stat().st_mtime
+	expected = datetime.fromtimestamp(meta.modified_ts).isoformat()
+	assert meta.formatted_modified() == expected
+	assert meta.to_payload()["modified"] == expected
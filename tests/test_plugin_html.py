@@ -16,7 +16,7 @@ def test_html_plugin_extracts_text_and_title(tmp_path: Path) -> None:
 	plugin = HtmlPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "html"
-	assert meta.extra.get("extension") == "html"
-	if html_plugin.BeautifulSoup:
+	assert meta.extension == "html"
+	if html_plugin._beautiful_soup_class():
 		assert meta.summary and "Hello" in meta.summary
 		assert meta.title == "Sample"
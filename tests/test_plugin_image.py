@@ -29,5 +29,26 @@ def test_image_plugin_extracts_basic_metadata(filename: str) -> None:
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "image"
 	ext = path.suffix.lstrip(".")
-	assert meta.extra.get("extension") == ext
+	assert meta.extension == ext
 	assert meta.summary == f"Image file {ext}"
+
+
+def test_moondream2_loads_once_across_plugins(monkeypatch, tmp_path: Path) -> None:
+	import sys
+	import types
+	import rename_n_sort
+	from rename_n_sort.plugins import image_plugin
+
+	setup_calls: list[int] = []
+	fake = types.ModuleType("rename_n_sort.moondream2_caption")
+	fake.setup_ai_components = lambda: setup_calls.append(1) or {"model": "fake"}
+	fake.load_image = lambda image_path: f"pixels of {image_path}"
+	fake.caption_image = lambda _image, components: f"caption from {components['model']}"
+	monkeypatch.setattr(rename_n_sort, "moondream2_caption", fake, raising=False)
+	monkeypatch.setitem(sys.modules, "rename_n_sort.moondream2_caption", fake)
+	image_plugin._moondream2.cache_clear()
+	path = tmp_path / "a.png"
+	assert ImagePlugin()._try_caption(path) == "caption from fake"
+	assert ImagePlugin()._try_caption(path) == "caption from fake"
+	assert len(setup_calls) == 1
+	image_plugin._moondream2.cache_clear()
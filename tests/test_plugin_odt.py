@@ -5,7 +5,6 @@ from pathlib import Path
 
 import pytest
 
-from rename_n_sort.plugins import odt_plugin
 from rename_n_sort.plugins.odt_plugin import OdtPlugin
 
 
@@ -16,6 +15,64 @@ def test_odt_plugin_extracts_summary() -> None:
 	plugin = OdtPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "odt"
-	assert meta.extra.get("extension") == "odt"
-	if odt_plugin.load and odt_plugin.text and odt_plugin.teletype:
-		assert meta.summary
+	assert meta.extension == "odt"
+	assert meta.summary == "This is a sample ODT file ..."
+
+
+def test_odt_plugin_keeps_head_and_tail(tmp_path: Path) -> None:
+	import zipfile
+
+	ns = (
+		'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+		'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"'
+	)
+	body = "".join(f"<text:p>para<text:s text:c=\"2\"/>{idx}</text:p>" for idx in range(200))
+	path = tmp_path / "long.odt"
+	with zipfile.ZipFile(path, "w") as archive:
+		archive.writestr("content.xml", f"<office:document-content {ns}><body>{body}</body></office:document-content>")
+	meta = OdtPlugin().extract_metadata(path)
+	full = " ".join(f"para  {idx}" for idx in range(200))
+	assert meta.summary == f"{full[:256]} ... {full[-256:]}"
+
+
+def test_odt_plugin_tolerates_malformed_space_count(tmp_path: Path) -> None:
+	import zipfile
+
+	ns = (
+		'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+		'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"'
+	)
+	body = '<text:p>Budget<text:s text:c="x"/>notes</text:p>'
+	path = tmp_path / "odd.odt"
+	with zipfile.ZipFile(path, "w") as archive:
+		archive.writestr("content.xml", f"<office:document-content {ns}><body>{body}</body></office:document-content>")
+	meta = OdtPlugin().extract_metadata(path)
+	assert meta.summary == "Budget notes ..."
+
+
+def _corrupt_member(path: Path, member: str) -> None:
+	"""
+	Overwrite the start of a deflated member so decompression fails.
+	"""
+	import zipfile
+
+	with zipfile.ZipFile(path) as archive:
+		offset = archive.getinfo(member).header_offset
+	data = bytearray(path.read_bytes())
+	name_len = int.from_bytes(data[offset + 26 : offset + 28], "little")
+	extra_len = int.from_bytes(data[offset + 28 : offset + 30], "little")
+	start = offset + 30 + name_len + extra_len
+	data[start : start + 8] = b"\xff" * 8
+	path.write_bytes(bytes(data))
+
+
+def test_odt_plugin_survives_corrupt_archive(tmp_path: Path) -> None:
+	import zipfile
+
+	path = tmp_path / "broken.odt"
+	with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+		archive.writestr("content.xml", "<office:document-content>" + "hello " * 200 + "</office:document-content>")
+	_corrupt_member(path, "content.xml")
+	meta = OdtPlugin().extract_metadata(path)
+	assert meta.extension == "odt"
+	assert meta.summary is None
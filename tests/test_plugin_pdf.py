@@ -12,4 +12,78 @@ def test_pdf_plugin_extracts_basic_metadata(tmp_path: Path) -> None:
 	plugin = PDFPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "pdf"
-	assert meta.extra.get("extension") == "pdf"
+	assert meta.extension == "pdf"
+
+
+class _FakeTextPage:
+	def __init__(self, text: str) -> None:
+		self.text = text
+
+	def get_text_range(self) -> str:
+		return self.text
+
+	def close(self) -> None:
+		pass
+
+
+class _FakePage:
+	def __init__(self, text: str) -> None:
+		self.text = text
+
+	def get_textpage(self) -> _FakeTextPage:
+		return _FakeTextPage(self.text)
+
+	def close(self) -> None:
+		pass
+
+
+class _FakeDocument:
+	def __init__(self, _path: str) -> None:
+		self.pages = [f"page {idx} text" for idx in range(5)]
+
+	def __len__(self) -> int:
+		raise AssertionError("page count should come from mdls")
+
+	def __getitem__(self, index: int) -> _FakePage:
+		return _FakePage(self.pages[index])
+
+	def close(self) -> None:
+		pass
+
+
+def test_pdf_plugin_prefers_pdfium_and_mdls_page_count(tmp_path: Path, monkeypatch) -> None:
+	import types
+
+	from rename_n_sort.plugins import pdf
+
+	fake_module = types.SimpleNamespace(PdfDocument=_FakeDocument)
+	monkeypatch.setattr(pdf, "_pdfium", lambda: fake_module)
+	monkeypatch.setattr(pdf, "mdls_fields", lambda _path, _fields: {"kMDItemPageCount": "5"})
+	monkeypatch.setattr(PDFPlugin, "_summarize_with_images", lambda *_args, **_kwargs: None)
+	path = tmp_path / "report.pdf"
+	path.write_bytes(b"%PDF-1.4\n")
+	meta = PDFPlugin().extract_metadata(path)
+	assert meta.extra["page_count"] == 5
+	assert meta.extra["pdf_text"] == "page 0 text page 1 text"
+
+
+def test_pdfium_reads_hold_the_module_lock(tmp_path: Path) -> None:
+	import types
+
+	from rename_n_sort.plugins import pdf
+
+	held: list[bool] = []
+
+	class _LockCheckingDocument(_FakeDocument):
+		def __getitem__(self, index: int) -> _FakePage:
+			held.append(pdf._PDFIUM_LOCK.locked())
+			return super().__getitem__(index)
+
+		def close(self) -> None:
+			held.append(pdf._PDFIUM_LOCK.locked())
+
+	fake_module = types.SimpleNamespace(PdfDocument=_LockCheckingDocument)
+	text_bits, _count = PDFPlugin()._read_pages_pdfium(fake_module, tmp_path / "a.pdf", 2)
+	assert text_bits == ["page 0 text", "page 1 text"]
+	assert held == [True, True, True]
+	assert not pdf._PDFIUM_LOCK.locked()
@@ -23,5 +23,5 @@ def test_presentation_plugin_handles_samples(filename: str) -> None:
 	plugin = PresentationPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "presentation"
-	assert meta.extra.get("extension") == path.suffix.lstrip(".")
+	assert meta.extension == path.suffix.lstrip(".")
 	assert meta.summary
@@ -22,3 +22,88 @@ def test_registry_picks_image_plugin(tmp_path: Path):
 	test_file.write_bytes(b"data")
 	plugin = registry.for_path(test_file)
 	assert plugin.name == "image"
+
+
+def test_heavy_office_libs_not_imported_at_startup():
+	import subprocess
+	import sys
+
+	code = (
+		"import sys, rename_n_sort.cli; "
+		"print(any(name in sys.modules for name in "
+		"('openpyxl', 'xlrd', 'pptx', 'bs4', 'docx', 'odf', 'pypdf', 'pdf2image', 'PIL', 'pillow_heif', 'pytesseract')))"
+	)
+	result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+	assert result.stdout.strip() == "False"
+
+
+def test_file_metadata_payload_merges_extra(tmp_path: Path) -> None:
+	from rename_n_sort.plugins import FileMetadata
+
+	meta = FileMetadata(path=tmp_path / "a.txt", title="Title", plugin_name="text")
+	meta.extension = "txt"
+	payload = meta.to_payload()
+	assert payload["title"] == "Title"
+	assert payload["plugin"] == "text"
+	assert payload["extension"] == "txt"
+	assert payload["keywords"] == []
+
+
+def test_registry_reuses_plugin_per_extension(tmp_path: Path) -> None:
+	registry = build_registry()
+	first = registry.for_path(tmp_path / "a.PDF")
+	second = registry.for_path(tmp_path / "b.pdf")
+	assert first is second
+	assert first.name == "pdf"
+	assert registry.for_path(tmp_path / "README").name == "generic"
+
+
+def test_registry_first_registered_plugin_wins(tmp_path: Path) -> None:
+	import pytest
+	from rename_n_sort.plugins import FileMetadataPlugin, PluginRegistry
+
+	class First(FileMetadataPlugin):
+		name = "first"
+		supported_suffixes = {"txt"}
+
+	class Second(FileMetadataPlugin):
+		name = "second"
+		supported_suffixes = {"txt", "md"}
+
+	registry = PluginRegistry()
+	registry.register(First())
+	registry.register(Second())
+	assert registry.for_path(tmp_path / "a.txt").name == "first"
+	assert registry.for_path(tmp_path / "a.md").name == "second"
+	with pytest.raises(LookupError):
+		registry.for_path(tmp_path / "a.bin")
+
+
+def test_payload_includes_slot_fields_before_extra(tmp_path: Path) -> None:
+	from rename_n_sort.plugins import FileMetadata
+
+	meta = FileMetadata(path=tmp_path / "a.pdf", size_bytes=10, extension="pdf", extra={"page_count": "3"})
+	payload = meta.to_payload()
+	assert list(payload)[4:] == ["size_bytes", "extension", "page_count"]
+	assert "created" not in payload
+
+
+def test_registry_dispatch_asks_supports(tmp_path: Path) -> None:
+	from rename_n_sort.plugins import FileMetadataPlugin, PluginRegistry
+
+	class Picky(FileMetadataPlugin):
+		name = "picky"
+		supported_suffixes = {"txt"}
+
+		def supports(self, path: Path, ext: str) -> bool:
+			return not path.name.startswith("skip")
+
+	class Plain(FileMetadataPlugin):
+		name = "plain"
+		supported_suffixes = {"txt"}
+
+	registry = PluginRegistry()
+	registry.register(Picky())
+	registry.register(Plain())
+	assert registry.for_path(tmp_path / "notes.txt").name == "picky"
+	assert registry.for_path(tmp_path / "skip_me.txt").name == "plain"
@@ -23,5 +23,5 @@ def test_spreadsheet_plugin_reads_delimited_preview(
 	plugin = SpreadsheetPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "spreadsheet"
-	assert meta.extra.get("extension") == path.suffix.lstrip(".")
+	assert meta.extension == path.suffix.lstrip(".")
 	assert meta.summary and "A" in meta.summary
@@ -15,5 +15,26 @@ def test_text_plugin_reads_sample_txt() -> None:
 	plugin = TextDocumentPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "text"
-	assert meta.extra.get("extension") == "txt"
+	assert meta.extension == "txt"
 	assert meta.summary
+
+
+def test_read_head_reads_only_the_start(tmp_path: Path) -> None:
+	from rename_n_sort.plugins.read_utils import read_head
+
+	path = tmp_path / "big.txt"
+	path.write_text("start " + "x" * 100000 + " end", encoding="utf-8")
+	head = read_head(path, nbytes=64)
+	assert head.startswith("start ")
+	assert len(head) == 64
+	meta = TextDocumentPlugin().extract_metadata(path)
+	assert meta.summary.startswith("start")
+	assert "end" not in meta.summary
+
+
+def test_flatten_whitespace_matches_split_join() -> None:
+	from rename_n_sort.plugins.read_utils import flatten_whitespace
+
+	sample = "  line one\n\tline two \r\n\x0cend  "
+	assert flatten_whitespace(sample) == " ".join(sample.split())
+	assert flatten_whitespace(" \n ") == ""
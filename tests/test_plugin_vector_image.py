@@ -15,5 +15,18 @@ def test_vector_image_plugin_reads_svg_text(tmp_path: Path) -> None:
 	plugin = VectorImagePlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "vector_image"
-	assert meta.extra.get("extension") == "svg"
+	assert meta.extension == "svg"
 	assert meta.summary and "Vector image" in meta.summary
+
+
+def test_read_svg_text_stops_at_limit(tmp_path: Path) -> None:
+	from rename_n_sort.plugins.read_utils import read_svg_text
+
+	labels = "".join(f"<text>label{idx}</text>" for idx in range(5000))
+	path = tmp_path / "big.svg"
+	path.write_text(f"<svg xmlns=\"http://www.w3.org/2000/svg\">{labels}</svg>", encoding="utf-8")
+	text = read_svg_text(path, limit=40)
+	assert text == "label0 label1 label2 label3 label4 label5"[:40]
+	broken = tmp_path / "broken.svg"
+	broken.write_text("<svg><text>oops</svg>", encoding="utf-8")
+	assert read_svg_text(broken) is None
@@ -12,5 +12,5 @@ def test_video_plugin_extracts_basic_metadata(tmp_path: Path) -> None:
 	plugin = VideoPlugin()
 	meta = plugin.extract_metadata(path)
 	assert meta.plugin_name == "video"
-	assert meta.extra.get("extension") == "mp4"
+	assert meta.extension == "mp4"
 	assert meta.summary == "Video file mp4"
@@ -5,6 +5,8 @@ Tests for collision handling.
 
 from pathlib import Path
 
+import pytest
+
 from rename_n_sort.renamer import apply_move
 
 
@@ -19,3 +21,42 @@ def test_collision_creates_counter(tmp_path: Path):
 	third = apply_move(second, target, dry_run=False)
 	assert third.name != target.name
 	assert third.name.startswith("file (")
+
+
+def test_dedupe_skips_numbered_names_case_insensitively(tmp_path: Path):
+	from rename_n_sort.renamer import dedupe_path
+
+	for name in ("Report.pdf", "report (1).pdf", "REPORT (2).PDF"):
+		(tmp_path / name).write_text("x")
+	target = tmp_path / "Report.pdf"
+	assert dedupe_path(target).name == "Report (3).pdf"
+	assert dedupe_path(tmp_path / "fresh.pdf").name == "fresh.pdf"
+
+
+def test_apply_move_leaves_no_placeholder(tmp_path: Path):
+	source = tmp_path / "in.txt"
+	source.write_text("payload")
+	(tmp_path / "out.txt").write_text("existing")
+	placed = apply_move(source, tmp_path / "out.txt", dry_run=False)
+	assert placed.name == "out (1).txt"
+	assert placed.read_text() == "payload"
+	assert (tmp_path / "out.txt").read_text() == "existing"
+	assert not source.exists()
+
+
+def test_dedupe_treats_dangling_symlink_as_taken(tmp_path: Path):
+	from rename_n_sort.renamer import dedupe_path
+
+	(tmp_path / "link.txt").symlink_to(tmp_path / "missing.txt")
+	source = tmp_path / "in.txt"
+	source.write_text("payload")
+	assert dedupe_path(tmp_path / "link.txt").name == "link (1).txt"
+	placed = apply_move(source, tmp_path / "link.txt", dry_run=False)
+	assert placed.name == "link (1).txt"
+
+
+def test_failed_move_removes_placeholder(tmp_path: Path):
+	missing = tmp_path / "gone.txt"
+	with pytest.raises(OSError):
+		apply_move(missing, tmp_path / "dest" / "out.txt", dry_run=False)
+	assert list((tmp_path / "dest").iterdir()) == []
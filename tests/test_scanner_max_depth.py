@@ -26,3 +26,77 @@ def test_max_depth_limits(tmp_path: Path) -> None:
 	assert "a.txt" in names
 	assert "b.txt" in names
 	assert "c.txt" not in names
+
+
+def test_hidden_entries_skipped(tmp_path: Path) -> None:
+	root = tmp_path
+	(root / "visible.txt").write_text("visible", encoding="utf-8")
+	(root / ".hidden.txt").write_text("hidden file", encoding="utf-8")
+	hidden_dir = root / ".cache"
+	hidden_dir.mkdir()
+	(hidden_dir / "inside.txt").write_text("hidden dir file", encoding="utf-8")
+
+	cfg = AppConfig(roots=[root], max_depth=2)
+	names = {path.name for path in iter_files(cfg)}
+
+	assert names == {"visible.txt"}
+
+
+def test_size_bounds_filter(tmp_path: Path) -> None:
+	root = tmp_path
+	(root / "empty.txt").write_bytes(b"")
+	(root / "small.txt").write_bytes(b"x" * 10)
+	(root / "large.txt").write_bytes(b"x" * 1000)
+
+	cfg = AppConfig(roots=[root], max_size=100)
+	names = {path.name for path in iter_files(cfg)}
+	assert names == {"small.txt"}
+
+	cfg = AppConfig(roots=[root], min_size=0)
+	names = {path.name for path in iter_files(cfg)}
+	assert names == {"empty.txt", "small.txt", "large.txt"}
+
+
+def test_size_filter_measures_symlink_target(tmp_path: Path) -> None:
+	root = tmp_path / "root"
+	root.mkdir()
+	target = tmp_path / "big.bin"
+	target.write_bytes(b"x" * 5000)
+	(root / "link.bin").symlink_to(target)
+	cfg = AppConfig(roots=[root], max_size=1000)
+	assert list(iter_files(cfg)) == []
+	cfg = AppConfig(roots=[root], min_size=1000)
+	assert [path.name for path in iter_files(cfg)] == ["link.bin"]
+
+
+def test_extension_filter_matches_path_suffix(tmp_path: Path) -> None:
+	for name in ("report.PDF", "notes.txt", "archive.tar.pdf", "pdf", ".pdf", "..pdf"):
+		(tmp_path / name).write_text("data", encoding="utf-8")
+
+	cfg = AppConfig(roots=[tmp_path], include_extensions=[".Pdf"], exclude_hidden=False)
+	names = {path.name for path in iter_files(cfg)}
+
+	assert cfg.include_extensions == frozenset({"pdf"})
+	assert names == {"report.PDF", "archive.tar.pdf", "..pdf"}
+
+
+def test_normalized_roots_resolved_once_until_roots_change(tmp_path: Path, monkeypatch) -> None:
+	first = tmp_path / "one"
+	second = tmp_path / "two"
+	first.mkdir()
+	second.mkdir()
+	calls: list[Path] = []
+	real_resolve = Path.resolve
+
+	def _counting_resolve(self, strict=False):
+		calls.append(self)
+		return real_resolve(self, strict=strict)
+
+	monkeypatch.setattr(Path, "resolve", _counting_resolve)
+	cfg = AppConfig(roots=[first])
+	assert cfg.normalized_roots() == [real_resolve(first)]
+	assert cfg.normalized_roots() == [real_resolve(first)]
+	assert len(calls) == 1
+	cfg.roots.append(second)
+	assert cfg.normalized_roots() == [real_resolve(first), real_resolve(second)]
+	assert len(calls) == 3